@@ -1,7 +1,19 @@
 # md_to_latex (auto generate by build_inits.py)
 # flake8: noqa: F408
 
-from md_to_latex.core import (Book, BookDocxMixin, BookFrontMatterMixin,
+from md_to_latex.bench import (BenchmarkComparison, BenchmarkHistory,
+                               BenchmarkRunner, SyntheticBook)
+from md_to_latex.core import (Book, BookDiagnosticsMixin, BookDocxMixin,
+                              BookEditMixin, BookFrontMatterMixin,
                               BookLatexConfigMixin, BookLoaderMixin,
-                              BookMarkdownMixin, BookOutputMixin, Chapter,
-                              Part)
+                              BookLockMixin, BookMarkdownMixin,
+                              BookOutputMixin, BookPreviewMixin,
+                              BookPublishMixin, BookRegistry,
+                              BookRegistryMixin, BookShardMixin,
+                              BookSnapshotMixin, BookVariantMixin,
+                              BookVolumeMixin, BuildResult, BuildTimer,
+                              Chapter, LatexCompileError, LatexError,
+                              LatexLogParser, LayoutProfile, MemoryProfiler,
+                              Part, SourceMap, TypesettingProfile)
+from md_to_latex.storage import (BookStorage, DirectoryStorage, GitStorage,
+                                 MemoryStorage, TarStorage, ZipStorage)
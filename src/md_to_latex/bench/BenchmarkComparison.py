@@ -0,0 +1,94 @@
+import fnmatch
+import json
+
+
+class BenchmarkComparison:
+    """Diffs two benchmark result sets against regression budgets."""
+
+    def __init__(
+        self,
+        base,
+        new,
+        budget=0.10,
+        budgets=None,
+        noise=3.0,
+        min_delta=0.005,
+    ):
+        """
+        Initialize a BenchmarkComparison.
+
+        A metric regresses when its median grows by more than its budget
+        *and* the growth exceeds the measurement noise, taken as *noise*
+        times the larger median absolute deviation of the two runs (and at
+        least *min_delta* seconds for timings).
+
+        Args:
+            base: Baseline results (as stored by BenchmarkHistory)
+            new: Results to check
+            budget: Allowed relative growth of a metric median
+            budgets: Optional {metric glob: budget} overrides, first match
+                wins (e.g. {"*/docx*": 0.2})
+            noise: Noise threshold in median absolute deviations
+            min_delta: Smallest timing change (seconds) ever reported
+        """
+        self.base = base
+        self.new = new
+        self.budget = budget
+        self.budgets = budgets or {}
+        self.noise = noise
+        self.min_delta = min_delta
+        self.rows = self._compare()
+
+    @staticmethod
+    def load_budgets(path):
+        """Load a {metric glob: budget} JSON file."""
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _budget_for(self, name):
+        for pattern, budget in self.budgets.items():
+            if fnmatch.fnmatch(name, pattern):
+                return budget
+        return self.budget
+
+    def _compare(self):
+        rows = []
+        base_metrics = self.base["metrics"]
+        for name, new in self.new["metrics"].items():
+            base = base_metrics.get(name)
+            if base is None:
+                continue
+            delta = new["median"] - base["median"]
+            change = delta / base["median"] if base["median"] else 0.0
+            threshold = self.noise * max(base["mad"], new["mad"])
+            if new.get("unit", "s") == "s":
+                threshold = max(threshold, self.min_delta)
+            budget = self._budget_for(name)
+            if change > budget and delta > threshold:
+                status = "regression"
+            elif change < -budget and -delta > threshold:
+                status = "improvement"
+            else:
+                status = "ok"
+            rows.append(
+                {
+                    "metric": name,
+                    "unit": new.get("unit", "s"),
+                    "base": base["median"],
+                    "new": new["median"],
+                    "change": change,
+                    "budget": budget,
+                    "status": status,
+                }
+            )
+        return rows
+
+    @property
+    def regressions(self):
+        """Rows whose metric regressed beyond budget and noise."""
+        return [row for row in self.rows if row["status"] == "regression"]
+
+    @property
+    def passed(self):
+        """True when no metric regressed."""
+        return not self.regressions
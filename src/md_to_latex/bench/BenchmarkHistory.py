@@ -0,0 +1,117 @@
+import glob
+import hashlib
+import json
+import os
+import platform
+import subprocess
+from datetime import datetime, timezone
+
+
+class BenchmarkHistory:
+    """Stores benchmark results as JSON keyed by commit and machine."""
+
+    SCHEMA = 1
+
+    def __init__(self, history_dir):
+        """
+        Initialize a BenchmarkHistory.
+
+        Args:
+            history_dir: Directory holding <commit>-<fingerprint>.json files
+        """
+        self.history_dir = history_dir
+
+    @staticmethod
+    def machine_info():
+        """Describe this machine; the fingerprint hashes the fields."""
+        info = {
+            "system": platform.system(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        }
+        digest = hashlib.sha1(
+            json.dumps(info, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        info["fingerprint"] = digest[:12]
+        return info
+
+    @staticmethod
+    def current_commit(repo_dir=None):
+        """
+        Return the short HEAD commit, with "+dirty" for local changes.
+
+        Args:
+            repo_dir: Directory inside the repository (default: the
+                directory of this package)
+        """
+        repo_dir = repo_dir or os.path.dirname(os.path.abspath(__file__))
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=repo_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+            dirty = subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=repo_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return "unknown"
+        return f"{commit}+dirty" if dirty else commit
+
+    def save(self, metrics, commit=None):
+        """
+        Save a result set and return its path.
+
+        Args:
+            metrics: Metric summaries from BenchmarkRunner.run()
+            commit: Commit id to key the results by (default: HEAD)
+        """
+        machine = self.machine_info()
+        results = {
+            "schema": self.SCHEMA,
+            "commit": commit or self.current_commit(),
+            "machine": machine,
+            "created": datetime.now(timezone.utc).isoformat(),
+            "metrics": metrics,
+        }
+        os.makedirs(self.history_dir, exist_ok=True)
+        path = os.path.join(
+            self.history_dir,
+            f"{results['commit']}-{machine['fingerprint']}.json",
+        )
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        return path
+
+    def load(self, ref):
+        """
+        Load a result set by file path or commit id.
+
+        A commit id resolves to this machine's results for that commit.
+
+        Args:
+            ref: Path to a results file, or a commit id
+        """
+        path = ref
+        if not os.path.isfile(path):
+            fingerprint = self.machine_info()["fingerprint"]
+            path = os.path.join(self.history_dir, f"{ref}-{fingerprint}.json")
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No benchmark results for {ref!r}")
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def entries(self):
+        """Return stored result files, oldest first."""
+        return sorted(
+            glob.glob(os.path.join(self.history_dir, "*.json")),
+            key=os.path.getmtime,
+        )
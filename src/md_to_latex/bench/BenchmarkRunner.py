@@ -0,0 +1,187 @@
+import io
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from contextlib import redirect_stdout
+
+from md_to_latex.bench.SyntheticBook import SyntheticBook
+from md_to_latex.core.Book import Book
+
+
+class BenchmarkRunner:
+    """Runs the benchmark scenarios over synthetic books."""
+
+    SCENARIOS = ("load", "convert", "docx", "build", "draft", "catalog")
+
+    # Books kept resident by the catalog scenario
+    CATALOG_BOOKS = 100
+
+    def __init__(self, sizes=None, scenarios=None, repeat=5):
+        """
+        Initialize a BenchmarkRunner.
+
+        Args:
+            sizes: Synthetic book sizes to run (default: all)
+            scenarios: Scenarios to run (default: BenchmarkRunner.SCENARIOS)
+            repeat: Samples recorded per metric
+        """
+        self.sizes = list(sizes or SyntheticBook.SIZES)
+        self.scenarios = list(scenarios or self.SCENARIOS)
+        for scenario in self.scenarios:
+            if scenario not in self.SCENARIOS:
+                raise ValueError(f"Unknown benchmark scenario {scenario!r}")
+        self.repeat = repeat
+
+    # ── Scenarios ───────────────────────────────────────────────────────────
+    # Each scenario returns {metric suffix: value}; "" is the scenario
+    # total in seconds and suffixes ending in "bytes" are sizes.
+
+    @staticmethod
+    def _fresh_book(book_dir):
+        """
+        A Book with an empty scratch directory, so no state cached by an
+        earlier sample (e.g. DOCX chapter fragments) is reused.
+        """
+        scratch_dir = tempfile.mkdtemp(dir=os.path.dirname(book_dir))
+        book = Book(book_dir, scratch_dir=scratch_dir)
+        book.open_outputs = False
+        return book
+
+    @staticmethod
+    def _scenario_load(book_dir):
+        """Construct a Book (discovery, metadata and content reads)."""
+        start = time.perf_counter()
+        Book(book_dir)
+        return {"": time.perf_counter() - start}
+
+    @staticmethod
+    def _scenario_convert(book_dir):
+        """Run Chapter._parse_markdown_to_latex over every chapter."""
+        book = Book(book_dir)
+        chapters = [ch for part in book.parts for ch in part.chapters]
+        chapters += book.chapters
+        start = time.perf_counter()
+        for chapter in chapters:
+            content = chapter._strip_first_heading(chapter.content)
+            chapter._parse_markdown_to_latex(content)
+        return {"": time.perf_counter() - start}
+
+    @classmethod
+    def _scenario_docx(cls, book_dir):
+        """
+        Generate the DOCX file only, and report its size; "cached" times
+        a second generation that reuses every chapter fragment.
+        """
+        book = cls._fresh_book(book_dir)
+        book.word_count = book._count_words()
+        os.makedirs(book.output_dir, exist_ok=True)
+        output_path = os.path.join(book.output_dir, "bench")
+        start = time.perf_counter()
+        docx_path = book._generate_docx(output_path)
+        seconds = time.perf_counter() - start
+        with zipfile.ZipFile(docx_path) as docx:
+            document_bytes = docx.getinfo("word/document.xml").file_size
+        start = time.perf_counter()
+        book._generate_docx(output_path)
+        return {
+            "": seconds,
+            "cached": time.perf_counter() - start,
+            "bytes": os.path.getsize(docx_path),
+            "document_xml_bytes": document_bytes,
+        }
+
+    @classmethod
+    def _scenario_build(cls, book_dir, profile="production"):
+        """Run a full build and report each build stage."""
+        book = cls._fresh_book(book_dir)
+        start = time.perf_counter()
+        result = book.build(timing=True, profile=profile)
+        metrics = {"": time.perf_counter() - start}
+        for stage, seconds in result.stage_durations().items():
+            metrics[stage] = seconds
+        return metrics
+
+    @classmethod
+    def _scenario_draft(cls, book_dir):
+        """Run a full build with the draft typesetting profile."""
+        return cls._scenario_build(book_dir, profile="draft")
+
+    @classmethod
+    def _scenario_catalog(cls, book_dir):
+        """
+        Keep CATALOG_BOOKS Books of the book resident, as a catalog
+        service does, and report their Python heap with the chapter text
+        loaded ("bytes") and after Book.evict_content() ("evicted_bytes").
+        The books after the first reopen from its model snapshot.
+        """
+        scratch_dir = tempfile.mkdtemp(dir=os.path.dirname(book_dir))
+        Book(book_dir, scratch_dir=scratch_dir)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            heap_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            books = [
+                Book(book_dir, scratch_dir=scratch_dir)
+                for _ in range(cls.CATALOG_BOOKS)
+            ]
+            seconds = time.perf_counter() - start
+            loaded = tracemalloc.get_traced_memory()[0] - heap_before
+            for book in books:
+                book.evict_content()
+            evicted = tracemalloc.get_traced_memory()[0] - heap_before
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+        return {"": seconds, "bytes": loaded, "evicted_bytes": evicted}
+
+    # ── Runner ──────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _summarize(unit, samples):
+        """Return the stored summary for one metric."""
+        median = statistics.median(samples)
+        mad = statistics.median(abs(s - median) for s in samples)
+        return {
+            "unit": unit,
+            "samples": samples,
+            "median": median,
+            "mad": mad,
+            "min": min(samples),
+        }
+
+    def run(self):
+        """
+        Run all configured scenarios.
+
+        Returns:
+            Dict of metric name ("<size>/<scenario>[/<stage>]") to summary
+        """
+        samples = {}
+        work_dir = tempfile.mkdtemp(prefix="md_to_latex_bench_")
+        try:
+            for size in self.sizes:
+                book_dir = SyntheticBook(size).write(work_dir)
+                for scenario in self.scenarios:
+                    func = getattr(self, f"_scenario_{scenario}")
+                    for _ in range(self.repeat):
+                        with redirect_stdout(io.StringIO()):
+                            metrics = func(book_dir)
+                        for suffix, value in metrics.items():
+                            name = "/".join(
+                                p for p in (size, scenario, suffix) if p
+                            )
+                            samples.setdefault(name, []).append(value)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        return {
+            name: self._summarize(
+                "bytes" if name.endswith("bytes") else "s", values
+            )
+            for name, values in samples.items()
+        }
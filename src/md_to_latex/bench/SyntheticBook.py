@@ -0,0 +1,118 @@
+import json
+import os
+import random
+
+_WORDS = (
+    "the of and a to in is was he she it that for on with as his her "
+    "they at be this from had by not but what all were when we there "
+    "can an your which their said if do will each about how up out "
+    "them then many some so these would other into has more time "
+    "river lantern harbour window morning letter silence garden road "
+    "stranger promise winter shadow memory voice station journey"
+).split()
+
+
+class SyntheticBook:
+    """Deterministic generator for benchmark book directories."""
+
+    # name: (parts, chapters per part, segments per chapter,
+    #        paragraphs per segment)
+    SIZES = {
+        "small": (1, 3, 2, 10),
+        "medium": (3, 6, 3, 20),
+        "large": (6, 12, 3, 30),
+    }
+
+    def __init__(self, size="small", seed=0):
+        """
+        Initialize a SyntheticBook.
+
+        Args:
+            size: One of SyntheticBook.SIZES
+            seed: Random seed, so every run writes identical content
+        """
+        if size not in self.SIZES:
+            raise ValueError(
+                f"Unknown book size {size!r}; "
+                f"expected one of {', '.join(self.SIZES)}"
+            )
+        self.size = size
+        self.seed = seed
+
+    def _sentence(self, rng):
+        """Return one sentence with occasional inline markup."""
+        words = rng.choices(_WORDS, k=rng.randint(8, 18))
+        roll = rng.random()
+        if roll < 0.15:
+            words[1] = f"**{words[1]}**"
+        elif roll < 0.3:
+            words[2] = f"*{words[2]}*"
+        sentence = " ".join(words).capitalize() + "."
+        roll = rng.random()
+        if roll < 0.1:
+            quote = " ".join(rng.choices(_WORDS, k=5))
+            sentence += f' "{quote.capitalize()}."'
+        elif roll < 0.18:
+            note = " ".join(rng.choices(_WORDS, k=8))
+            sentence += f"^[{note.capitalize()}.]"
+        return sentence
+
+    def _paragraph(self, rng):
+        """Return a paragraph of four to six sentences."""
+        return " ".join(
+            self._sentence(rng) for _ in range(rng.randint(4, 6))
+        )
+
+    def _segment(self, rng, title, paragraphs):
+        """Return the markdown for one NNN.md segment file."""
+        blocks = [f"# {title}"] if title else []
+        for i in range(paragraphs):
+            if i and i % 8 == 0:
+                blocks.append("---")
+            elif i and i % 5 == 0:
+                blocks.append(f"## {' '.join(rng.choices(_WORDS, k=3))}")
+            blocks.append(self._paragraph(rng))
+        return "\n\n".join(blocks) + "\n"
+
+    def write(self, root_dir):
+        """
+        Write the book under *root_dir* and return the book directory.
+
+        Args:
+            root_dir: Directory that receives a book-<size> directory
+        """
+        parts, chapters, segments, paragraphs = self.SIZES[self.size]
+        rng = random.Random(self.seed)
+        book_dir = os.path.join(root_dir, f"book-{self.size}")
+        os.makedirs(book_dir, exist_ok=True)
+
+        metadata = {
+            "title": f"Synthetic {self.size.title()} Book",
+            "author": "Benchmark",
+            "year": "2026",
+        }
+        with open(
+            os.path.join(book_dir, "metadata.json"), "w", encoding="utf-8"
+        ) as f:
+            json.dump(metadata, f)
+
+        chapter_number = 0
+        for part in range(1, parts + 1):
+            part_dir = os.path.join(book_dir, f"part-{part}-part-{part}")
+            for _ in range(chapters):
+                chapter_number += 1
+                chapter_dir = os.path.join(
+                    part_dir, f"chapter-{chapter_number:02d}-chapter"
+                )
+                os.makedirs(chapter_dir, exist_ok=True)
+                for segment in range(1, segments + 1):
+                    title = (
+                        f"Chapter {chapter_number}" if segment == 1 else None
+                    )
+                    with open(
+                        os.path.join(chapter_dir, f"{segment:03d}.md"),
+                        "w",
+                        encoding="utf-8",
+                    ) as f:
+                        f.write(self._segment(rng, title, paragraphs))
+        return book_dir
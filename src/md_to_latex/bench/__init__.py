@@ -0,0 +1,7 @@
+# md_to_latex.bench (auto generate by build_inits.py)
+# flake8: noqa: F408
+
+from md_to_latex.bench.BenchmarkComparison import BenchmarkComparison
+from md_to_latex.bench.BenchmarkHistory import BenchmarkHistory
+from md_to_latex.bench.BenchmarkRunner import BenchmarkRunner
+from md_to_latex.bench.SyntheticBook import SyntheticBook
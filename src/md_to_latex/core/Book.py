@@ -1,14 +1,33 @@
 import os
 import re
+import sys
+import time
+from contextlib import contextmanager
 
 from pylatex import Document, NoEscape
 
+from md_to_latex.core.BookDiagnosticsMixin import BookDiagnosticsMixin
 from md_to_latex.core.BookDocxMixin import BookDocxMixin
+from md_to_latex.core.BookEditMixin import BookEditMixin
 from md_to_latex.core.BookFrontMatterMixin import BookFrontMatterMixin
 from md_to_latex.core.BookLatexConfigMixin import BookLatexConfigMixin
 from md_to_latex.core.BookLoaderMixin import BookLoaderMixin
+from md_to_latex.core.BookLockMixin import BookLockMixin
 from md_to_latex.core.BookMarkdownMixin import BookMarkdownMixin
 from md_to_latex.core.BookOutputMixin import BookOutputMixin
+from md_to_latex.core.BookPreviewMixin import BookPreviewMixin
+from md_to_latex.core.BookPublishMixin import BookPublishMixin
+from md_to_latex.core.BookRegistryMixin import BookRegistryMixin
+from md_to_latex.core.BookShardMixin import BookShardMixin
+from md_to_latex.core.BookSnapshotMixin import BookSnapshotMixin
+from md_to_latex.core.BookVariantMixin import BookVariantMixin
+from md_to_latex.core.BookVolumeMixin import BookVolumeMixin
+from md_to_latex.core.BuildResult import BuildResult
+from md_to_latex.core.BuildTimer import BuildTimer
+from md_to_latex.core.LayoutProfile import LayoutProfile
+from md_to_latex.core.MemoryProfiler import MemoryProfiler
+from md_to_latex.core.SourceMap import SourceMap
+from md_to_latex.core.TypesettingProfile import TypesettingProfile
 
 
 class Book(
@@ -17,7 +36,17 @@ class Book(
     BookLatexConfigMixin,
     BookFrontMatterMixin,
     BookOutputMixin,
+    BookPublishMixin,
+    BookLockMixin,
+    BookShardMixin,
+    BookVolumeMixin,
+    BookVariantMixin,
     BookDocxMixin,
+    BookDiagnosticsMixin,
+    BookPreviewMixin,
+    BookSnapshotMixin,
+    BookRegistryMixin,
+    BookEditMixin,
 ):
     """Represents a complete book with parts, chapters, and metadata."""
 
@@ -36,21 +65,65 @@ class Book(
         text = text.strip("-")
         return text
 
-    def __init__(self, book_dir):
+    def __init__(
+        self,
+        book_dir,
+        profile_memory=False,
+        output_dir=None,
+        scratch_dir=None,
+        snapshot=True,
+    ):
         """
-        Initialize a Book from a directory.
+        Initialize a Book from a directory, an archive or a storage.
 
         Args:
-            book_dir: Path to the book directory
+            book_dir: Path to the book directory or to a zip or tar
+                archive of it (read without extracting), or a BookStorage
+                such as MemoryStorage
+            profile_memory: Record peak heap and RSS per build stage
+                (starts tracemalloc, which slows the build down)
+            output_dir: Directory the finished files are published to
+                (default: <book_dir>.compiled)
+            scratch_dir: Local directory pdflatex works in, e.g.
+                /dev/shm (default: the system temporary directory)
+            snapshot: Reopen the book from a snapshot of its loaded
+                model while the stats of its files are unchanged; the
+                snapshot is kept under scratch_dir, so only books given
+                a scratch_dir are snapshotted
         """
-        self.book_dir = book_dir
-        self.metadata = self._load_metadata()
-        self.title = self.metadata.get("title", os.path.basename(book_dir))
-        self.subtitle = self.metadata.get("subtitle")
-        self.author = self.metadata.get("author")
-        self.year = self.metadata.get("year")
-        self.edition = self.metadata.get("edition")
-        self.publisher = self.metadata.get("publisher")
+        load_start = time.perf_counter()
+        self.storage = self._open_storage(book_dir)
+        self.book_dir = book_dir = self.storage.root
+        self.output_dir = output_dir or f"{book_dir}.compiled"
+        self.scratch_dir = scratch_dir
+        self.memory = MemoryProfiler(enabled=profile_memory)
+        with self.memory.stage("load"):
+            if snapshot and self.scratch_dir and self.storage.cacheable:
+                self.from_snapshot = self._load_with_snapshot()
+            else:
+                self._load()
+                self.from_snapshot = False
+        self.word_count = 0  # Will be calculated when generating
+        # Open generated files in the default viewer (macOS only)
+        self.open_outputs = sys.platform == "darwin"
+        self.timer = BuildTimer()
+        self._source_map = None
+        self._artifacts = {}
+        # {path relative to book_dir: digest} of in-memory edits (see
+        # update_segment()), which the build key includes
+        self._edits = {}
+        # Chapters edited since the last rebuild()
+        self._edited_chapters = []
+        # Pinned build time of a reproducible build (see build())
+        self.source_date_epoch = None
+        self.profile = TypesettingProfile.get("production")
+        self.layout = LayoutProfile.get("a4-manuscript")
+        self._load_span = (load_start, time.perf_counter())
+        self._load_memory = list(self.memory.stages)
+
+    def _load(self):
+        """Load metadata, parts, chapters and about files."""
+        self._set_metadata(self._load_metadata())
         self.format = self._detect_format()
         if self.format == 2:
             self.parts = []
@@ -64,8 +137,22 @@ class Book(
         self.about_book_title, self.about_book = self._load_about_file(
             "about-the-book.md"
         )
-        self.output_dir = f"{book_dir}.compiled"
-        self.word_count = 0  # Will be calculated when generating
+
+    def _set_metadata(self, metadata):
+        """Set the metadata and the fields taken from it."""
+        self.metadata = metadata
+        self.title = metadata.get("title", self.storage.name)
+        self.subtitle = metadata.get("subtitle")
+        self.author = metadata.get("author")
+        self.year = metadata.get("year")
+        self.edition = metadata.get("edition")
+        self.publisher = metadata.get("publisher")
+
+    @contextmanager
+    def _stage(self, name, child=False):
+        """Time and (if enabled) memory-profile one build stage."""
+        with self.timer.span(name), self.memory.stage(name, child=child):
+            yield
 
     def toLatex(self):
         """
@@ -74,33 +161,233 @@ class Book(
         Returns:
             Path to the generated PDF file
         """
+        return self.build().output_path
+
+    def build(
+        self,
+        timing=False,
+        trace_path=None,
+        fail_fast=False,
+        diagnose=None,
+        source_map=True,
+        shards=None,
+        profile="production",
+        volume_words=None,
+        volume_pages=None,
+        layouts=None,
+        reproducible=None,
+        docx_compression=None,
+    ):
+        """
+        Generate the LaTeX document, compile to PDF and write the DOCX.
+
+        Args:
+            timing: Record timing spans for each stage and chapter
+            trace_path: Optional path for a Chrome trace-event JSON file
+                (implies timing)
+            fail_fast: Abort pdflatex on the first LaTeX error
+            diagnose: When the PDF fails, isolate the broken chapter with
+                this diagnose() strategy ("standalone" or "bisect")
+            source_map: Write <name>.texmap.json mapping .tex lines back
+                to the NNN.md segment files, and use it to locate errors
+            shards: Compile the PDF as shards in parallel and stitch them:
+                "parts" for one shard per part, or a number of chapter
+                groups. Needs pypdf; for final builds where throughput
+                matters more than cross-shard references
+            profile: TypesettingProfile or its name; "draft" skips
+                microtype, hyperref and the DOCX, uses a built-in font
+                and a single pdflatex pass, and writes <name>-draft.pdf
+            volume_words: Split the PDF at part boundaries into volumes
+                of at most this many words, each with its own title page
+                and contents, compiled in parallel as <name>-vol-<n>
+            volume_pages: Like volume_words, with a page budget
+                estimated from the word count
+            layouts: Names from LAYOUTS, dicts of LayoutProfile
+                settings or LayoutProfile objects; the body is rendered
+                once and every layout is compiled concurrently, each to
+                <name><layout suffix>.pdf
+            reproducible: Make identical inputs give byte-identical
+                PDF and DOCX files by pinning their timestamps and IDs to
+                SOURCE_DATE_EPOCH, or to the newest book file when it is
+                unset. None (the default) enables this whenever
+                SOURCE_DATE_EPOCH is set
+            docx_compression: zlib level (0-9) of the DOCX zip; lower is
+                faster, higher is smaller (default: zlib's default, 6)
+
+        Returns:
+            BuildResult describing the generated artifacts; unchanged
+            files are left untouched and every artifact's digest is
+            recorded in <output_dir>/manifest.json. Builds of one book
+            are serialized by a lock kept outside output_dir (see
+            BookLockMixin._lock_path()); a build that waited
+            for an identical one returns that build's result (with
+            shared=True) instead of repeating it
+        """
+        options = dict(
+            timing=timing,
+            trace_path=trace_path,
+            fail_fast=fail_fast,
+            diagnose=diagnose,
+            source_map=source_map,
+            shards=shards,
+            profile=profile,
+            volume_words=volume_words,
+            volume_pages=volume_pages,
+            layouts=layouts,
+            reproducible=reproducible,
+            docx_compression=docx_compression,
+        )
+        requested = time.time()
+        with self._build_lock():
+            key = self._build_key(options)
+            result = self._concurrent_result(key, requested)
+            if result is None:
+                result = self._build(**options)
+                self._save_build_record(key, result)
+        return result
+
+    def _build(
+        self,
+        timing,
+        trace_path,
+        fail_fast,
+        diagnose,
+        source_map,
+        shards,
+        profile,
+        volume_words,
+        volume_pages,
+        layouts,
+        reproducible,
+        docx_compression,
+    ):
+        """Run one build; see build() for the arguments."""
+        self.timer = BuildTimer(enabled=timing or trace_path is not None)
+        self.timer.add_span("load", *self._load_span)
+        self.memory.stages = list(self._load_memory)
+        self.profile = TypesettingProfile.get(profile)
+        self.source_date_epoch = self._resolve_source_date(reproducible)
+        self._artifacts = {}
+        volumes = None
+        variants = None
+        modes = (shards, volume_words or volume_pages, layouts)
+        if len([mode for mode in modes if mode]) > 1:
+            raise ValueError("Shards, volumes and layouts cannot be combined")
+        if volume_words or volume_pages:
+            volumes = self._plan_volumes(volume_words, volume_pages)
         os.makedirs(self.output_dir, exist_ok=True)
 
+        # Use kebab-case for file name
+        file_name = self._to_kebab_case(self.title) + self.profile.suffix
+        # pdflatex works in a local scratch directory; finished files are
+        # published to output_dir as they complete
+        with self._scratch() as build_dir:
+            output_path = os.path.join(build_dir, file_name)
+            if volumes:
+                self._generate_volumes(
+                    output_path,
+                    volumes,
+                    fail_fast=fail_fast,
+                    source_map=source_map,
+                )
+                first = volumes[0]
+                result = first["pdf_path"] or first["tex_path"]
+                tex_path = first["tex_path"]
+            elif layouts:
+                source_map = SourceMap(self.book_dir) if source_map else None
+                with self._stage("convert"):
+                    doc = self._build_document(source_map=source_map)
+                variants = self._generate_variants(
+                    doc,
+                    output_path,
+                    layouts,
+                    fail_fast=fail_fast,
+                    source_map=source_map,
+                )
+                first = variants[0]
+                result = first["pdf_path"] or first["tex_path"]
+                tex_path = first["tex_path"]
+            else:
+                source_map = SourceMap(self.book_dir) if source_map else None
+                with self._stage("convert"):
+                    doc = self._build_document(source_map=source_map)
+                result = self._generate_output(
+                    doc,
+                    output_path,
+                    fail_fast=fail_fast,
+                    diagnose=diagnose,
+                    source_map=source_map,
+                    shards=shards,
+                )
+                tex_path = os.path.join(self.output_dir, f"{file_name}.tex")
+            docx_path = None
+            if self.profile.docx:
+                with self._stage("generate_docx"):
+                    docx_path = self._generate_docx(
+                        output_path, compression_level=docx_compression
+                    )
+        manifest_path = self._write_manifest()
+        self.memory.stop()
+
+        build_result = BuildResult(
+            result,
+            tex_path=tex_path,
+            pdf_path=result if result.endswith(".pdf") else None,
+            docx_path=docx_path,
+            timer=self.timer,
+            memory=self.memory.stages,
+            volumes=volumes,
+            variants=variants,
+            artifacts=self._artifacts,
+            manifest_path=manifest_path,
+        )
+        if trace_path:
+            build_result.write_trace(trace_path)
+        return build_result
+
+    def _new_document(self, volume=None, layout=None):
+        """
+        Create a PyLaTeX document carrying the book's preamble.
+
+        Args:
+            volume: Optional volume dict from _plan_volumes(), for the
+                title page of one volume
+            layout: LayoutProfile to use instead of self.layout
+        """
+        layout = layout or self.layout
         doc = Document(
             documentclass="book",
-            document_options=["a4paper", "twoside", "12pt"],
+            document_options=layout.class_options,
         )
+        self._configure_document(doc, layout)
+        self._setup_document_metadata(doc, volume)
+        return doc
 
-        self._configure_document(doc)
+    def _build_document(self, source_map=None):
+        """
+        Create the PyLaTeX document with front matter and body.
 
+        Args:
+            source_map: Optional SourceMap that records where each
+                chapter segment lands in the .tex file
+        """
         # Calculate word count
         self.word_count = self._count_words()
 
-        self._setup_document_metadata(doc)
+        doc = self._new_document()
         self._add_front_matter(doc)
 
         doc.append(NoEscape(r"\mainmatter"))
 
         if self.format == 2:
             for chapter in self.chapters:
-                chapter.to_latex(doc)
+                with self.timer.span(chapter.title, category="chapter"):
+                    chapter.to_latex(doc, source_map=source_map)
         else:
             for part in self.parts:
-                part.to_latex(doc)
+                with self.timer.span(part.title, category="part"):
+                    part.to_latex(
+                        doc, timer=self.timer, source_map=source_map
+                    )
 
-        # Use kebab-case for file name
-        file_name = self._to_kebab_case(self.title)
-        output_path = os.path.join(self.output_dir, file_name)
-        result = self._generate_output(doc, output_path)
-        self._generate_docx(output_path)
-        return result
+        return doc
@@ -0,0 +1,232 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from pylatex import NoEscape
+from rich.console import Console
+
+from md_to_latex.core.LatexError import LatexError
+
+console = Console()
+
+
+class BookDiagnosticsMixin:
+    """Mixin for isolating the chapter that breaks pdflatex."""
+
+    # ── Standalone compiles ─────────────────────────────────────────────────
+
+    def _diagnostic_document(self, items):
+        """
+        Build a standalone document from (title, latex body) pairs.
+
+        The document uses the book's own preamble so packages and macros
+        behave exactly as in the full build.
+        """
+        doc = self._new_document()
+        doc.append(NoEscape(r"\mainmatter"))
+        for title, body in items:
+            doc.append(NoEscape(r"\chapter{" + title + "}"))
+            doc.append(NoEscape(body))
+            doc.append(NoEscape(r"\newpage"))
+        return doc
+
+    @staticmethod
+    def _chapter_items(chapter):
+        """Return the (title, latex body) pair for a whole chapter."""
+        # Segments are joined the way PyLaTeX joins document items
+        segments = chapter._latex_segments()
+        body = "%\n".join(latex for _, _, latex, _ in segments)
+        return [(chapter.title, body)]
+
+    @staticmethod
+    def _segment_items(chapter, latex):
+        """Return the (title, latex body) pair for one NNN.md segment."""
+        return [(chapter.title, latex)]
+
+    def _compile_items(self, work_dir, name, items):
+        """
+        Compile *items* standalone (one pass, halting on the first error).
+
+        Returns:
+            List of LatexError objects; empty when the compile succeeded
+        """
+        with self.timer.span(name, category="diagnose"):
+            doc = self._diagnostic_document(items)
+            doc.generate_tex(os.path.join(work_dir, name))
+            returncode, parser = self._run_pdflatex(
+                work_dir, f"{name}.tex", fail_fast=True
+            )
+        if returncode != 0 and not parser.errors:
+            return [
+                LatexError(
+                    f"pdflatex exited with status {returncode}",
+                    file=f"{name}.tex",
+                )
+            ]
+        return parser.errors
+
+    def _compile_all(self, work_dir, jobs, max_workers):
+        """
+        Compile {name: items} jobs concurrently.
+
+        Returns:
+            {name: errors} for every job
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                name: pool.submit(self._compile_items, work_dir, name, items)
+                for name, items in jobs.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    # ── Strategies ──────────────────────────────────────────────────────────
+
+    def _failing_chapters_standalone(self, work_dir, chapters, max_workers):
+        """Compile every chapter alone, all in one parallel round."""
+        jobs = {
+            f"chapter-{i:03d}": self._chapter_items(chapter)
+            for i, chapter in enumerate(chapters)
+        }
+        results = self._compile_all(work_dir, jobs, max_workers)
+        return [
+            (chapter, results[f"chapter-{i:03d}"])
+            for i, chapter in enumerate(chapters)
+            if results[f"chapter-{i:03d}"]
+        ]
+
+    def _failing_chapters_bisect(self, work_dir, chapters, max_workers):
+        """
+        Compile halving groups of chapters until single chapters remain.
+
+        Each round compiles both halves of every failing group in parallel.
+        """
+        groups = [list(range(len(chapters)))]
+        failing = []
+        round_number = 0
+        while groups:
+            round_number += 1
+            jobs = {}
+            for g, group in enumerate(groups):
+                halves = (
+                    [group]
+                    if len(group) == 1
+                    else [group[: len(group) // 2], group[len(group) // 2 :]]
+                )
+                for h, half in enumerate(halves):
+                    items = []
+                    for index in half:
+                        items += self._chapter_items(chapters[index])
+                    jobs[f"bisect-{round_number}-{g}-{h}"] = (half, items)
+            results = self._compile_all(
+                work_dir,
+                {name: items for name, (_, items) in jobs.items()},
+                max_workers,
+            )
+            groups = []
+            for name, (half, _) in jobs.items():
+                if not results[name]:
+                    continue
+                if len(half) == 1:
+                    failing.append((chapters[half[0]], results[name]))
+                else:
+                    groups.append(half)
+        failing.sort(key=lambda f: chapters.index(f[0]))
+        return failing
+
+    def _failing_segment(self, work_dir, chapter_number, chapter, max_workers):
+        """
+        Compile each NNN.md segment of a failing chapter standalone.
+
+        Returns:
+            (segment path, errors) for the first failing segment, or
+            (None, None) when no single segment fails on its own
+        """
+        segments = chapter._latex_segments()
+        if len(segments) < 2:
+            return (segments[0][0] if segments else None), None
+        jobs = {
+            f"chapter-{chapter_number:03d}-segment-{s:03d}": (
+                self._segment_items(chapter, latex)
+            )
+            for s, (_, _, latex, _) in enumerate(segments)
+        }
+        results = self._compile_all(work_dir, jobs, max_workers)
+        for s, (path, _, _, _) in enumerate(segments):
+            errors = results[f"chapter-{chapter_number:03d}-segment-{s:03d}"]
+            if errors:
+                return path, errors
+        return None, None
+
+    # ── Entry point ─────────────────────────────────────────────────────────
+
+    def diagnose(self, strategy="standalone", max_workers=None):
+        """
+        Find the chapters (and NNN.md segments) that break pdflatex.
+
+        Chapters are compiled standalone with the book's preamble, in
+        parallel, instead of bisecting by hand over full-book compiles.
+
+        Args:
+            strategy: "standalone" compiles every chapter alone in one
+                parallel round; "bisect" compiles halving groups, which
+                needs fewer pdflatex runs when few chapters are broken
+            max_workers: Maximum concurrent pdflatex processes
+                (default: CPU count)
+
+        Returns:
+            List of dicts with "chapter" (title), "chapter_index",
+            "segment" (path relative to the book directory, or None) and
+            "errors" (LatexError objects), in book order
+        """
+        if strategy not in ("standalone", "bisect"):
+            raise ValueError(f"Unknown diagnosis strategy {strategy!r}")
+        max_workers = max_workers or os.cpu_count()
+        chapters = self._all_chapters()
+        if not self.word_count:
+            self.word_count = self._count_words()
+
+        work_dir = tempfile.mkdtemp(
+            prefix="md_to_latex_diagnose_", dir=self.scratch_dir
+        )
+        try:
+            find_failing = getattr(self, f"_failing_chapters_{strategy}")
+            failing = find_failing(work_dir, chapters, max_workers)
+            findings = []
+            for chapter, errors in failing:
+                chapter_number = chapters.index(chapter)
+                segment, segment_errors = self._failing_segment(
+                    work_dir, chapter_number, chapter, max_workers
+                )
+                findings.append(
+                    {
+                        "chapter": chapter.title,
+                        "chapter_index": chapter_number + 1,
+                        "segment": (
+                            os.path.relpath(segment, self.book_dir)
+                            if segment
+                            else None
+                        ),
+                        "errors": segment_errors or errors,
+                    }
+                )
+            return findings
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _report_diagnosis(self, findings):
+        """Print diagnose() findings."""
+        if not findings:
+            console.print(
+                "[yellow]→ Every chapter compiles on its own; the error "
+                "comes from front matter or chapter interaction[/yellow]"
+            )
+            return
+        for finding in findings:
+            where = finding["segment"] or "(no single segment)"
+            console.print(
+                f"[red]✗ Chapter {finding['chapter_index']}:[/red] "
+                f"[bold]{finding['chapter']}[/bold] [dim]{where}[/dim]"
+            )
+            for error in finding["errors"][:3]:
+                console.print(f"    {error}")
@@ -1,19 +1,60 @@
+import hashlib
+import io
+import json
+import os
 import re
 import subprocess
-import sys
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime, timezone
 
 from docx import Document as DocxDocument
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.opc.oxml import serialize_part_xml
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.shared import Cm, Inches, Pt, RGBColor
+from lxml import etree
 from rich.console import Console
 
+from md_to_latex.core.BuildTimer import BuildTimer
+
 console = Console()
 
 _FONT = "Garamond"
 _MAROON = RGBColor(0x80, 0x00, 0x00)
 _DARK_GREY = RGBColor(0x50, 0x50, 0x50)
+# Styles defined once per document and referenced from runs and
+# paragraphs, instead of repeating direct formatting on each of them
+_NOTE_REF_STYLE = "Note Reference"
+_NOTE_TEXT_STYLE = "Note Text"
+_NOTE_SEPARATOR_STYLE = "Note Separator"
+_QUOTE_STYLE = "Maroon Quote"
+_SCENE_BREAK_STYLE = "Scene Break"
+# Zip entry times cannot predate 1980-01-01
+_ZIP_MIN_EPOCH = 315532800
+_DOCUMENT_PART = "word/document.xml"
+_INLINE_PATTERN = re.compile(
+    r"(\*\*\*(.+?)\*\*\*"
+    r"|\*\*(.+?)\*\*"
+    r"|(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)"
+    r'|"([^"]+)"'
+    r"|\^\[([^\]]+)\]"
+    r"|([^*\"^]+|\^(?!\[)))",
+    re.DOTALL,
+)
+_SCENE_BREAK_BLOCK = re.compile(r"(---|\.\.\.)")
+_SCENE_BREAK_LINE = re.compile(r"\s*(---|\.\.\.)\s*")
+_HEADING_BLOCK = re.compile(r"^(#{1,4})\s+(.+)")
+# Bump when the chapter XML changes, to invalidate cached fragments
+_FRAGMENT_VERSION = 1
+_FRAGMENT_CACHE = "docx_fragments"
+# How long a cache shared by several revisions keeps unused fragments
+_SHARED_FRAGMENT_MAX_AGE = 30 * 24 * 3600
 
 
 class BookDocxMixin:
@@ -90,6 +131,57 @@ class BookDocxMixin:
             except KeyError:
                 pass
 
+        self._docx_add_content_styles(doc)
+
+    def _docx_add_content_styles(self, doc):
+        """Define the footnote, quote and scene-break styles."""
+        styles = doc.styles
+
+        note_ref = styles.add_style(_NOTE_REF_STYLE, WD_STYLE_TYPE.CHARACTER)
+        note_ref.font.size = Pt(8)
+        note_ref.font.superscript = True
+
+        quote = styles.add_style(_QUOTE_STYLE, WD_STYLE_TYPE.CHARACTER)
+        quote.font.color.rgb = _MAROON
+
+        note_text = styles.add_style(_NOTE_TEXT_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+        note_text.base_style = styles["Normal"]
+        note_text.font.size = Pt(9)
+        note_text.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
+
+        separator = styles.add_style(
+            _NOTE_SEPARATOR_STYLE, WD_STYLE_TYPE.PARAGRAPH
+        )
+        separator.base_style = note_text
+        separator.font.size = Pt(8)
+        separator.font.color.rgb = _DARK_GREY
+        separator.paragraph_format.space_before = Pt(12)
+
+        scene_break = styles.add_style(
+            _SCENE_BREAK_STYLE, WD_STYLE_TYPE.PARAGRAPH
+        )
+        scene_break.base_style = styles["Normal"]
+        scene_break.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+        # python-docx resolves style names by scanning every style, so
+        # runs and paragraphs reference these ids directly
+        self._docx_style_ids = {
+            style.name: style.style_id
+            for style in (note_ref, quote, note_text, separator, scene_break)
+        }
+
+    def _docx_styled_run(self, paragraph, text, style):
+        """Append a run of *text* in the character style *style*."""
+        run = paragraph.add_run(text)
+        run._r.style = self._docx_style_ids[style]
+        return run
+
+    def _docx_styled_paragraph(self, doc, style, text=None):
+        """Append a paragraph in the paragraph style *style*."""
+        paragraph = doc.add_paragraph(text)
+        paragraph._p.style = self._docx_style_ids[style]
+        return paragraph
+
     # ── Running header ──────────────────────────────────────────────────────
 
     def _docx_setup_header(self, doc):
@@ -213,28 +305,12 @@ class BookDocxMixin:
         """Emit collected footnote texts as end-notes, then reset the list."""
         if not self._fn_notes:
             return
-        sep = doc.add_paragraph()
-        sep.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
-        sep.paragraph_format.space_before = Pt(12)
-        sep_r = sep.add_run("─" * 30)
-        sep_r.font.name = _FONT
-        sep_r.font.size = Pt(8)
-        sep_r.font.color.rgb = _DARK_GREY
+        self._docx_styled_paragraph(doc, _NOTE_SEPARATOR_STYLE, "─" * 30)
         for num, text in self._fn_notes:
-            note_p = doc.add_paragraph()
-            note_p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
-            ref_r = note_p.add_run(str(num))
-            ref_r.font.name = _FONT
-            ref_r.font.size = Pt(8)
-            ref_r.font.superscript = True
-            space_r = note_p.add_run(" ")
-            space_r.font.name = _FONT
-            space_r.font.size = Pt(9)
-            runs_before = len(note_p.runs)
+            note_p = self._docx_styled_paragraph(doc, _NOTE_TEXT_STYLE)
+            self._docx_styled_run(note_p, str(num), _NOTE_REF_STYLE)
+            note_p.add_run(" ")
             self._docx_parse_inline(doc, note_p, text)
-            for run in note_p.runs[runs_before:]:
-                run.font.name = _FONT
-                run.font.size = Pt(9)
         self._fn_notes = []
 
     # ── Inline markdown parser ──────────────────────────────────────────────
@@ -246,16 +322,7 @@ class BookDocxMixin:
         Handles: ***bold-italic***, **bold**, *italic*, "quoted" (maroon),
         ^[footnote] (superscript number, text collected for end-notes), plain text.
         """
-        pattern = re.compile(
-            r"(\*\*\*(.+?)\*\*\*"
-            r"|\*\*(.+?)\*\*"
-            r"|(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)"
-            r'|"([^"]+)"'
-            r"|\^\[([^\]]+)\]"
-            r"|([^*\"^]+|\^(?!\[)))",
-            re.DOTALL,
-        )
-        for m in pattern.finditer(text):
+        for m in _INLINE_PATTERN.finditer(text):
             if m.group(2):  # ***bold-italic***
                 run = paragraph.add_run(m.group(2))
                 run.bold = True
@@ -267,15 +334,15 @@ class BookDocxMixin:
                 run = paragraph.add_run(m.group(4))
                 run.italic = True
             elif m.group(5):  # "quoted" → maroon curly quotes
-                run = paragraph.add_run(f"\u201c{m.group(5)}\u201d")
-                run.font.color.rgb = _MAROON
+                self._docx_styled_run(
+                    paragraph, f"\u201c{m.group(5)}\u201d", _QUOTE_STYLE
+                )
             elif m.group(6):  # ^[footnote] → superscript number + collect
                 self._fn_counter += 1
                 self._fn_notes.append((self._fn_counter, m.group(6)))
-                ref_r = paragraph.add_run(str(self._fn_counter))
-                ref_r.font.name = _FONT
-                ref_r.font.size = Pt(8)
-                ref_r.font.superscript = True
+                self._docx_styled_run(
+                    paragraph, str(self._fn_counter), _NOTE_REF_STYLE
+                )
             elif m.group(7):  # plain text
                 paragraph.add_run(m.group(7))
 
@@ -296,13 +363,12 @@ class BookDocxMixin:
                 continue
 
             # Scene-break block (whole block is --- or ...)
-            if re.fullmatch(r"(---|\.\.\.)", block):
-                p = doc.add_paragraph("\u2026")
-                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            if _SCENE_BREAK_BLOCK.fullmatch(block):
+                self._docx_styled_paragraph(doc, _SCENE_BREAK_STYLE, "\u2026")
                 continue
 
             # Heading block
-            m = re.match(r"^(#{1,4})\s+(.+)", block)
+            m = _HEADING_BLOCK.match(block)
             if m:
                 level = min(len(m.group(1)), 3)
                 doc.add_heading(m.group(2).strip(), level=level)
@@ -314,10 +380,11 @@ class BookDocxMixin:
             current_para = None
 
             for line in lines:
-                if re.fullmatch(r"\s*(---|\.\.\.)\s*", line):
+                if _SCENE_BREAK_LINE.fullmatch(line):
                     current_para = None
-                    p = doc.add_paragraph("\u2026")
-                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                    self._docx_styled_paragraph(
+                        doc, _SCENE_BREAK_STYLE, "\u2026"
+                    )
                 else:
                     if current_para is None:
                         current_para = doc.add_paragraph()
@@ -325,6 +392,31 @@ class BookDocxMixin:
                         current_para.add_run(" ")
                     self._docx_parse_inline(doc, current_para, line.strip())
 
+    @staticmethod
+    def _docx_count_notes(content):
+        """
+        Count the footnotes _docx_add_markdown_content() would number in
+        *content*, without rendering it.
+        """
+        count = 0
+        for block in re.split(r"\n\n+", content.strip()):
+            block = block.strip()
+            if (
+                not block
+                or _SCENE_BREAK_BLOCK.fullmatch(block)
+                or _HEADING_BLOCK.match(block)
+            ):
+                continue
+            for line in block.split("\n"):
+                if _SCENE_BREAK_LINE.fullmatch(line):
+                    continue
+                count += sum(
+                    1
+                    for m in _INLINE_PATTERN.finditer(line.strip())
+                    if m.group(6)
+                )
+        return count
+
     def _docx_add_about_section(self, doc, title, content):
         """Add an about-the-book / about-the-author section."""
         doc.add_page_break()
@@ -332,10 +424,317 @@ class BookDocxMixin:
         self._docx_add_markdown_content(doc, content)
         self._docx_flush_notes(doc)
 
+    # ── Reproducible output ─────────────────────────────────────────────────
+
+    def _docx_pin_core_properties(self, doc):
+        """Replace the save-time stamps in the core properties."""
+        source_date = datetime.fromtimestamp(
+            self.source_date_epoch, timezone.utc
+        )
+        core_properties = doc.core_properties
+        core_properties.created = source_date
+        core_properties.modified = source_date
+        core_properties.revision = 1
+
+    # ── Streaming writer ────────────────────────────────────────────────────
+
+    def _docx_chapter_jobs(self, first_note):
+        """
+        Return the body layout and the chapters to render.
+
+        Footnotes are numbered continuously through the book, so each
+        chapter's job carries the number its first footnote follows.
+
+        Returns:
+            (layout, jobs): layout lists the part titles and the indices
+            into jobs in document order; a job is (title, heading level,
+            content, first_note)
+        """
+        if self.format == 2:
+            sections = [(None, self.chapters)]
+            level = 1
+        else:
+            sections = [(part.title, part.chapters) for part in self.parts]
+            level = 2
+        layout, jobs = [], []
+        for part_title, chapters in sections:
+            if part_title is not None:
+                layout.append(part_title)
+            for chapter in chapters:
+                content = chapter._strip_first_heading(chapter.content)
+                layout.append(len(jobs))
+                jobs.append((chapter.title, level, content, first_note))
+                first_note += self._docx_count_notes(content)
+        return layout, jobs
+
+    def _docx_render_chapter(self, doc, title, level, content, first_note):
+        """
+        Render one chapter into the empty body of *doc* and return its
+        body XML.
+        """
+        self._fn_notes = []
+        self._fn_counter = first_note
+        doc.add_page_break()
+        doc.add_heading(title, level=level)
+        self._docx_add_markdown_content(doc, content)
+        self._docx_flush_notes(doc)
+        return self._docx_take_body(doc.element.body)
+
+    @staticmethod
+    def _docx_fragment_key(job):
+        """Content hash of a chapter job, naming its cached fragment."""
+        return hashlib.sha256(
+            json.dumps([_FRAGMENT_VERSION, *job]).encode("utf-8")
+        ).hexdigest()
+
+    def _docx_chapter_fragments(self, jobs, max_workers=None):
+        """
+        Yield the body XML of each chapter job, in order.
+
+        Fragments of unchanged chapters are read from the fragment cache
+        as they are needed; the others are rendered in worker processes
+        (python-docx is pure Python, so threads would not run them in
+        parallel), cached and passed on as they arrive, so the body is
+        never held in memory whole. Fragments no chapter uses any more
+        are removed from the cache once every fragment was yielded; when
+        the storage shares the cache between revisions (see
+        BookStorage.cache_id), only once they have not been used for 30
+        days. Without a cache directory (see _cache_dir()), every chapter
+        is rendered.
+
+        Args:
+            jobs: Chapter jobs from _docx_chapter_jobs()
+            max_workers: Worker processes (default: one per CPU)
+        """
+        cache_dir = self._cache_dir(_FRAGMENT_CACHE, shared=True)
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        keys = [self._docx_fragment_key(job) for job in jobs]
+        missing = {}
+        for key, job in zip(keys, jobs):
+            if cache_dir is None or not os.path.isfile(
+                os.path.join(cache_dir, key)
+            ):
+                missing.setdefault(key, job)
+        console.print(
+            f"[dim]→ DOCX chapters: {len(jobs) - len(missing)} cached, "
+            f"{len(missing)} rendered[/dim]"
+        )
+
+        workers = min(max_workers or os.cpu_count() or 1, len(missing))
+        with ExitStack() as stack:
+            if workers > 1:
+                pool = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=workers)
+                )
+                rendered = self._docx_render_window(
+                    pool, missing.values(), workers * 2
+                )
+            else:
+                rendered = (
+                    self._docx_render_fragment(job)
+                    for job in missing.values()
+                )
+            pending = set(missing)
+            for key, job in zip(keys, jobs):
+                path = cache_dir and os.path.join(cache_dir, key)
+                if key in pending:
+                    pending.remove(key)
+                    fragment, spans = next(rendered)
+                    self.timer.merge(spans)
+                    if path:
+                        self._write_atomic(path, fragment)
+                else:
+                    try:
+                        with open(path or "", "rb") as f:
+                            fragment = f.read()
+                    except OSError:  # no cache, or removed by a prune
+                        fragment, _ = self._docx_render_fragment(job)
+                yield fragment
+
+        if cache_dir is None:
+            return
+        used = set(keys)
+        shared = self.storage.cache_id is not None
+        now = time.time()
+        for name in os.listdir(cache_dir):
+            path = os.path.join(cache_dir, name)
+            if name in used:
+                if shared:
+                    os.utime(path)
+            elif (
+                not shared
+                or now - os.path.getmtime(path) > _SHARED_FRAGMENT_MAX_AGE
+            ):
+                os.remove(path)
+
+    def _docx_render_window(self, pool, jobs, window):
+        """
+        Yield (body XML, spans) of each job in order, rendered in *pool*.
+
+        At most *window* jobs are submitted and not yet yielded, so the
+        finished fragments waiting for their turn stay bounded however
+        long the book is.
+        """
+        jobs = iter(jobs)
+        futures = deque()
+
+        def submit_next():
+            job = next(jobs, None)
+            if job is not None:
+                futures.append(
+                    pool.submit(
+                        _render_chapter_fragment, job, self.timer.enabled
+                    )
+                )
+
+        for _ in range(window):
+            submit_next()
+        while futures:
+            yield futures.popleft().result()
+            submit_next()
+
+    def _docx_render_fragment(self, job):
+        """
+        Render a chapter job in this process, timed as a chapter span.
+
+        Returns:
+            (body XML, spans), like _render_chapter_fragment(); the span
+            is recorded on self.timer directly, so spans is empty
+        """
+        with self.timer.span(job[0], category="chapter"):
+            fragment = _render_chapter_fragment(job)[0]
+        return fragment, []
+
+    def _docx_body_fragments(self, doc, max_workers=None):
+        """
+        Yield the body XML of the parts and chapters in document order.
+
+        Part headings are added to *doc* and taken out again; chapters
+        come from _docx_chapter_fragments().
+        """
+        layout, jobs = self._docx_chapter_jobs(self._fn_counter)
+        fragments = self._docx_chapter_fragments(jobs, max_workers)
+        for item in layout:
+            if isinstance(item, int):
+                yield next(fragments)
+            else:
+                doc.add_page_break()
+                doc.add_heading(item, level=1)
+                yield self._docx_take_body(doc.element.body)
+        # Run the generator to its end, which prunes the fragment cache
+        for _ in fragments:
+            pass
+
+    @staticmethod
+    def _docx_take_body(body):
+        """
+        Serialize the body content added so far and remove it, leaving
+        only the section properties.
+
+        The body is serialized whole and its start tag cut off, so the
+        namespace declarations appear once in the document element
+        instead of on every paragraph.
+        """
+        xml = etree.tostring(body, encoding="UTF-8", xml_declaration=False)
+        content = xml[xml.index(b">") + 1 : xml.rindex(b"<w:sectPr")]
+        sect_pr = body.sectPr
+        for child in list(body):
+            if child is not sect_pr:
+                body.remove(child)
+        return content
+
+    def _docx_stream_document(self, doc, stream, fragments):
+        """
+        Write word/document.xml to *stream*: the front matter already in
+        *doc*, then each body XML fragment from *fragments*.
+        """
+        xml = serialize_part_xml(doc.element)
+        stream.write(xml[: xml.index(b"<w:body>") + len(b"<w:body>")])
+        stream.write(self._docx_take_body(doc.element.body))
+        for fragment in fragments:
+            stream.write(fragment)
+        stream.write(xml[xml.rindex(b"<w:sectPr") :])
+
+    def _docx_write_package(
+        self, doc, docx_path, fragments, compression_level
+    ):
+        """
+        Write the DOCX package, streaming word/document.xml.
+
+        Every other part (styles, header, settings, core properties) is
+        taken from *doc* saved with only its front matter. The document
+        part is streamed to a file next to *docx_path* first and added
+        with ZipFile.write(), which takes the compression level and the
+        entry time (the file's mtime) without holding the part in memory.
+        """
+        if self.source_date_epoch is not None:
+            self._docx_pin_core_properties(doc)
+            date_time = time.gmtime(
+                max(self.source_date_epoch, _ZIP_MIN_EPOCH)
+            )[:6]
+        else:
+            date_time = time.localtime()[:6]
+
+        skeleton_buffer = io.BytesIO()
+        doc.save(skeleton_buffer)
+        document_path = f"{docx_path}.document.xml"
+        try:
+            with open(document_path, "wb") as stream:
+                self._docx_stream_document(doc, stream, fragments)
+            os.chmod(document_path, 0o644)
+            mtime = time.mktime(date_time + (0, 0, -1))
+            os.utime(document_path, (mtime, mtime))
+            package = zipfile.ZipFile(
+                docx_path,
+                "w",
+                zipfile.ZIP_DEFLATED,
+                compresslevel=compression_level,
+            )
+            with zipfile.ZipFile(skeleton_buffer) as skeleton, package:
+                for info in skeleton.infolist():
+                    if info.filename == _DOCUMENT_PART:
+                        package.write(document_path, _DOCUMENT_PART)
+                        continue
+                    entry = zipfile.ZipInfo(
+                        info.filename, date_time=date_time
+                    )
+                    entry.compress_type = zipfile.ZIP_DEFLATED
+                    entry.external_attr = 0o100644 << 16
+                    package.writestr(
+                        entry,
+                        skeleton.read(info.filename),
+                        compresslevel=compression_level,
+                    )
+        finally:
+            if os.path.exists(document_path):
+                os.remove(document_path)
+
     # ── Main entry point ────────────────────────────────────────────────────
 
-    def _generate_docx(self, output_path):
-        """Build and save the DOCX file to *output_path*.docx."""
+    def _generate_docx(
+        self,
+        output_path,
+        compression_level=None,
+        max_workers=None,
+        open_output=True,
+    ):
+        """
+        Build and save the DOCX file to *output_path*.docx, then publish
+        it to output_dir.
+
+        Chapters are rendered to XML fragments in parallel and cached by
+        content, and the body is written into the zip fragment by
+        fragment.
+
+        Args:
+            output_path: Output path without extension
+            compression_level: zlib level for the zip entries, 0 (none,
+                fastest) to 9 (smallest); None for zlib's default
+            max_workers: Processes rendering chapters (default: one per
+                CPU)
+            open_output: Open the DOCX afterwards when open_outputs is set
+        """
         # Reset footnote state
         self._fn_notes = []
         self._fn_counter = 0
@@ -365,33 +764,52 @@ class BookDocxMixin:
                 self.about_author,
             )
 
-        # Body
-        if self.format == 2:
-            for chapter in self.chapters:
-                doc.add_page_break()
-                doc.add_heading(chapter.title, level=1)
-                content = chapter._strip_first_heading(chapter.content)
-                self._docx_add_markdown_content(doc, content)
-                self._docx_flush_notes(doc)
-        else:
-            for part in self.parts:
-                doc.add_page_break()
-                doc.add_heading(part.title, level=1)
-                for chapter in part.chapters:
-                    doc.add_page_break()
-                    doc.add_heading(chapter.title, level=2)
-                    content = chapter._strip_first_heading(chapter.content)
-                    self._docx_add_markdown_content(doc, content)
-                    self._docx_flush_notes(doc)
-
         docx_path = f"{output_path}.docx"
-        doc.save(docx_path)
+        with self.timer.span("save_docx", category="docx"):
+            self._docx_write_package(
+                doc,
+                docx_path,
+                self._docx_body_fragments(doc, max_workers),
+                compression_level,
+            )
+            docx_path = self._publish(docx_path)
         console.print(
             f"[green]✓ DOCX generated successfully:[/green] "
             f"[bold]{docx_path}[/bold]"
         )
 
-        if sys.platform == "darwin":
+        if open_output and self.open_outputs:
             subprocess.run(["open", docx_path], check=False)
 
         return docx_path
+
+
+_worker_state = {}
+
+
+def _render_chapter_fragment(job, timing=False):
+    """
+    Render a chapter job to body XML; the entry point of the worker
+    processes of BookDocxMixin._docx_chapter_fragments().
+
+    Each process keeps one renderer and styled document, so the styles
+    are set up once per process rather than once per chapter.
+
+    Args:
+        job: Chapter job from BookDocxMixin._docx_chapter_jobs()
+        timing: Time the chapter as a span, for the build's timer
+
+    Returns:
+        (body XML, list of BuildTimer spans)
+    """
+    if not _worker_state:
+        renderer = BookDocxMixin()
+        doc = DocxDocument()
+        renderer._docx_setup_styles(doc)
+        _worker_state.update(renderer=renderer, doc=doc)
+    timer = BuildTimer(enabled=timing)
+    with timer.span(job[0], category="chapter"):
+        fragment = _worker_state["renderer"]._docx_render_chapter(
+            _worker_state["doc"], *job
+        )
+    return fragment, timer.spans
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+
+from md_to_latex.core.TypesettingProfile import TypesettingProfile
+
+# Targets rebuild() can refresh, cheapest first
+REBUILD_TARGETS = ("preview", "docx", "book")
+# build() options that also apply to a "docx" rebuild
+_DOCX_OPTIONS = ("profile", "reproducible", "docx_compression")
+
+
+class BookEditMixin:
+    """
+    Mixin for patching the loaded book in memory, as a live editor does,
+    and rebuilding only what the edits affect.
+
+    Edits are not written to the book's files. Each chapter keeps its
+    LaTeX and word count until its text changes, DOCX chapter fragments
+    and previews are cached by content, so a rebuild after an edit
+    converts and renders only the edited chapter.
+    """
+
+    def _find_segment(self, path):
+        """
+        Return (chapter, segment index, relative path) of the NNN.md
+        segment (or flat chapter file) at *path*.
+
+        Raises:
+            ValueError: If no chapter of the book reads *path*
+        """
+        rel_path = self.storage._relative(path)
+        for chapter in self._all_chapters():
+            rel_paths = chapter._relative_md_files(self.book_dir)
+            if rel_path in rel_paths:
+                return chapter, rel_paths.index(rel_path), rel_path
+        raise ValueError(f"No chapter segment at {path!r}")
+
+    def update_segment(self, path, new_text):
+        """
+        Replace the markdown of one segment in memory.
+
+        Only the chapter holding the segment loses its cached LaTeX and
+        word count. The chapter is queued for the next rebuild().
+
+        Args:
+            path: Path of the NNN.md file (or flat chapter file),
+                absolute or relative to book_dir
+            new_text: New markdown of the segment
+
+        Returns:
+            The updated Chapter
+
+        Raises:
+            ValueError: If no chapter of the book reads *path*
+        """
+        chapter, index, rel_path = self._find_segment(
+            os.path.join(self.book_dir, path)
+        )
+        chapter.update_segment(index, new_text)
+        self._edits[rel_path] = hashlib.sha256(
+            new_text.encode("utf-8")
+        ).hexdigest()
+        if chapter not in self._edited_chapters:
+            self._edited_chapters.append(chapter)
+        return chapter
+
+    def update_metadata(self, **fields):
+        """
+        Change metadata.json fields (title, author, ...) in memory.
+
+        Chapters are unaffected, so their cached LaTeX and DOCX
+        fragments stay valid; the title page, headers and document
+        properties change on the next build.
+
+        Args:
+            **fields: Metadata fields to set; None removes a field
+        """
+        metadata = dict(self.metadata)
+        for name, value in fields.items():
+            if value is None:
+                metadata.pop(name, None)
+            else:
+                metadata[name] = value
+        self._set_metadata(metadata)
+        self._edits["metadata.json"] = hashlib.sha256(
+            json.dumps(metadata, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def rebuild(self, targets=("preview",), **build_options):
+        """
+        Refresh outputs after update_segment() and update_metadata().
+
+        Args:
+            targets: Any of REBUILD_TARGETS:
+                "preview" compiles the preview PDFs of the chapters
+                edited since the last rebuild (see preview());
+                "docx" regenerates the DOCX alone, re-rendering only the
+                edited chapters' fragments;
+                "book" runs build(**build_options), which converts only
+                the edited chapters and then compiles the whole PDF
+            **build_options: Passed on to build() for "book"; profile,
+                reproducible and docx_compression also apply to "docx"
+
+        Returns:
+            Dict of target to its result: the preview() list, the DOCX
+            path, or the BuildResult
+
+        Raises:
+            ValueError: For unknown targets
+        """
+        for target in targets:
+            if target not in REBUILD_TARGETS:
+                raise ValueError(
+                    f"Unknown rebuild target {target!r}; "
+                    f"expected one of {', '.join(REBUILD_TARGETS)}"
+                )
+        results = {}
+        if "preview" in targets:
+            results["preview"] = (
+                self.preview(self._edited_chapters)
+                if self._edited_chapters
+                else []
+            )
+        if "docx" in targets:
+            results["docx"] = self._rebuild_docx(
+                **{
+                    name: build_options[name]
+                    for name in _DOCX_OPTIONS
+                    if name in build_options
+                }
+            )
+        if "book" in targets:
+            results["book"] = self.build(**build_options)
+        self._edited_chapters = []
+        return results
+
+    def _rebuild_docx(
+        self, profile="production", reproducible=None, docx_compression=None
+    ):
+        """
+        Generate and publish the DOCX without the LaTeX and PDF.
+
+        The options are those of build(), not of the previous build, and
+        the DOCX is never opened in a viewer, since an editor may call
+        this on every change.
+
+        Args:
+            profile: TypesettingProfile or its name
+            reproducible: Pin the DOCX timestamps (see build())
+            docx_compression: zlib level (0-9) of the DOCX zip
+
+        Returns:
+            Path to the published DOCX file
+        """
+        with self._build_lock(), self._scratch() as build_dir:
+            self.profile = TypesettingProfile.get(profile)
+            self.source_date_epoch = self._resolve_source_date(reproducible)
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._artifacts = {}
+            self.word_count = self._count_words()
+            file_name = self._to_kebab_case(self.title) + self.profile.suffix
+            docx_path = self._generate_docx(
+                os.path.join(build_dir, file_name),
+                compression_level=docx_compression,
+                open_output=False,
+            )
+            self._write_manifest()
+        return docx_path
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 from pylatex import Command, NoEscape, Section
 
@@ -6,8 +6,14 @@ from pylatex import Command, NoEscape, Section
 class BookFrontMatterMixin:
     """Mixin for generating book front matter."""
 
-    def _build_title(self):
-        """Build title string with metadata (subtitle and word count)."""
+    def _build_title(self, volume=None):
+        """
+        Build title string with metadata (subtitle and word count).
+
+        Args:
+            volume: Optional volume dict from _plan_volumes(); its number
+                is added below the subtitle
+        """
         title_parts = [
             f"{{\\fontsize{{24}}{{28.8}}\\selectfont {self.title}}}"
         ]
@@ -15,10 +21,19 @@ class BookFrontMatterMixin:
             title_parts.append(
                 f"{{\\fontsize{{12}}{{14.4}}\\selectfont {self.subtitle}}}"
             )
+        if volume:
+            title_parts.append(
+                f"{{\\fontsize{{14}}{{16.8}}\\selectfont"
+                f" Volume {volume['volume']}}}"
+            )
         return "\\\\\n\\vspace{0.5em}\n".join(title_parts)
 
     def _format_date_str(self):
         """Format self.year into a display date string."""
+        if not self.year and self.source_date_epoch is not None:
+            return datetime.fromtimestamp(
+                self.source_date_epoch, timezone.utc
+            ).strftime("%B %d, %Y")
         if not self.year:
             return r"{\fontsize{9}{10.8}\selectfont \today}"
         for fmt in ("%Y", "%Y-%m-%d"):
@@ -28,19 +43,21 @@ class BookFrontMatterMixin:
                 pass
         return self.year
 
-    def _build_date_block(self):
+    def _build_date_block(self, word_count=None):
         """Build the date + word count preamble block."""
+        if word_count is None:
+            word_count = self.word_count
         date_str = self._format_date_str()
         date_part = f"{{\\fontsize{{9}}{{10.8}}\\selectfont {date_str}}}"
         word_part = (
             f"{{\\fontsize{{12}}{{14.4}}\\selectfont"
-            f" {self.word_count:,} words}}"
+            f" {word_count:,} words}}"
         )
         return "\\\\\n\\vspace{0.3em}\n".join([date_part, word_part])
 
-    def _setup_document_metadata(self, doc):
+    def _setup_document_metadata(self, doc, volume=None):
         """Set up document title, author, date, and custom commands."""
-        title_with_metadata = self._build_title()
+        title_with_metadata = self._build_title(volume)
         doc.preamble.append(Command("title", NoEscape(title_with_metadata)))
 
         if self.author:
@@ -50,7 +67,9 @@ class BookFrontMatterMixin:
             )
             doc.preamble.append(Command("author", NoEscape(author_text)))
 
-        date_text = self._build_date_block()
+        date_text = self._build_date_block(
+            volume["words"] if volume else None
+        )
         doc.preamble.append(Command("date", NoEscape(date_text)))
 
         doc.preamble.append(
@@ -99,10 +118,11 @@ class BookFrontMatterMixin:
                 processed_content = self._process_markdown(self.about_author)
                 doc.append(NoEscape(processed_content))
 
-    def _add_front_matter(self, doc):
+    def _add_front_matter(self, doc, about=True):
         """Add title, table of contents, and about sections."""
         doc.append(NoEscape(r"\frontmatter"))
         doc.append(NoEscape(r"\maketitle"))
         self._add_copyright_page(doc)
         doc.append(NoEscape(r"\tableofcontents"))
-        self._add_about_sections(doc)
+        if about:
+            self._add_about_sections(doc)
@@ -4,24 +4,20 @@ from pylatex import Command, NoEscape, Package
 class BookLatexConfigMixin:
     """Mixin for LaTeX document configuration."""
 
-    def _add_formatting_packages(self, doc):
+    def _add_formatting_packages(self, doc, layout):
         """Add formatting packages to document preamble."""
-        doc.preamble.append(
-            Package(
-                "geometry",
-                options=["margin=1in", "a4paper", "headheight=15pt"],
-            )
-        )
+        doc.preamble.append(Package("geometry", options=layout.geometry))
         doc.preamble.append(Package("setspace"))
-        doc.preamble.append(Command("doublespacing"))
-        doc.preamble.append(Package("microtype"))
+        doc.preamble.append(Command(layout.spacing))
+        if self.profile.microtype:
+            doc.preamble.append(Package("microtype"))
         doc.preamble.append(Package("booktabs"))
         doc.preamble.append(Package("fancyhdr"))
         doc.preamble.append(Package("titlesec"))
 
     def _add_font_packages(self, doc):
         """Add font packages to document preamble."""
-        doc.preamble.append(Package("ebgaramond"))
+        doc.preamble.append(Package(self.profile.font_package))
         doc.preamble.append(Package("inputenc", options=["utf8"]))
         doc.preamble.append(Package("fontenc", options=["T1"]))
 
@@ -108,17 +104,40 @@ class BookLatexConfigMixin:
             )
         )
 
-    def _configure_document(self, doc):
-        """Configure LaTeX document with book formatting."""
+    def _add_reproducible_ids(self, doc):
+        """
+        Derive the PDF trailer ID from the job name and source date, not
+        the wall clock and scratch path, so identical inputs give
+        byte-identical PDFs.
+        """
+        doc.preamble.append(
+            NoEscape(
+                r"\ifdefined\pdftrailerid\pdftrailerid{\jobname-"
+                + str(self.source_date_epoch)
+                + r"}\fi"
+            )
+        )
+
+    def _configure_document(self, doc, layout=None):
+        """
+        Configure LaTeX document with book formatting.
+
+        Args:
+            layout: LayoutProfile to use instead of self.layout
+        """
+        layout = layout or self.layout
         doc.documentclass = Command(
             "documentclass",
-            options=["a4paper", "twoside", "12pt"],
+            options=layout.class_options,
             arguments=["book"],
         )
-        self._add_formatting_packages(doc)
+        self._add_formatting_packages(doc, layout)
         self._add_font_packages(doc)
         self._add_quote_styling(doc)
         if self._has_section_breaks():
             self._add_section_break_command(doc)
         self._configure_headers(doc)
-        self._add_hyperref_package(doc)
+        if self.profile.hyperref:
+            self._add_hyperref_package(doc)
+        if self.source_date_epoch is not None:
+            self._add_reproducible_ids(doc)
@@ -1,11 +1,17 @@
 import json
 import os
 import re
+import tarfile
+import zipfile
 
 from rich.console import Console
 
 from md_to_latex.core.Chapter import Chapter
 from md_to_latex.core.Part import Part
+from md_to_latex.storage.BookStorage import BookStorage
+from md_to_latex.storage.DirectoryStorage import DirectoryStorage
+from md_to_latex.storage.TarStorage import TarStorage
+from md_to_latex.storage.ZipStorage import ZipStorage
 
 console = Console()
 
@@ -13,13 +19,44 @@ console = Console()
 class BookLoaderMixin:
     """Mixin for loading book data from files."""
 
+    @staticmethod
+    def _open_storage(source):
+        """
+        Return the storage backend for *source*.
+
+        Args:
+            source: A BookStorage, the path to a zip or tar archive, or
+                the path to a book directory
+        """
+        if isinstance(source, BookStorage):
+            return source
+        if os.path.isfile(source):
+            if zipfile.is_zipfile(source):
+                return ZipStorage(source)
+            if tarfile.is_tarfile(source):
+                return TarStorage(source)
+        return DirectoryStorage(source)
+
+    def close(self):
+        """
+        Close the storage the book was loaded from, e.g. its zip archive.
+
+        Chapters dropped by evict() can no longer be re-read afterwards.
+        """
+        self.storage.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def _load_metadata(self):
         """Load metadata from metadata.json file."""
         metadata_path = os.path.join(self.book_dir, "metadata.json")
-        if os.path.isfile(metadata_path):
+        if self.storage.isfile(metadata_path):
             try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return json.loads(self.storage.read_text(metadata_path))
             except (json.JSONDecodeError, IOError) as e:
                 console.print(
                     f"[yellow]⚠ Warning:[/yellow] "
@@ -35,12 +72,12 @@ class BookLoaderMixin:
         Returns 1 if the book uses part/chapter directories (format 1),
         or 2 if chapters are top-level .md files (format 2).
         """
-        if not os.path.isdir(self.book_dir):
+        if not self.storage.isdir(self.book_dir):
             return 1
-        entries = os.listdir(self.book_dir)
+        entries = self.storage.listdir(self.book_dir)
         has_parts = any(
             re.fullmatch(r"part-\d+-[a-z0-9\-]+", e)
-            and os.path.isdir(os.path.join(self.book_dir, e))
+            and self.storage.isdir(os.path.join(self.book_dir, e))
             for e in entries
         )
         if has_parts:
@@ -56,15 +93,15 @@ class BookLoaderMixin:
         """Load all parts directly from the book directory."""
         parts = []
 
-        if not os.path.isdir(self.book_dir):
+        if not self.storage.isdir(self.book_dir):
             return parts
 
         # Get all part-<N>-<name> directories directly inside the book dir
         part_dirs = [
             d
-            for d in os.listdir(self.book_dir)
+            for d in self.storage.listdir(self.book_dir)
             if (
-                os.path.isdir(os.path.join(self.book_dir, d))
+                self.storage.isdir(os.path.join(self.book_dir, d))
                 and re.fullmatch(r"part-\d+-[a-z0-9\-]+", d)
             )
         ]
@@ -74,32 +111,32 @@ class BookLoaderMixin:
 
         for part_dir in part_dirs:
             part_path = os.path.join(self.book_dir, part_dir)
-            parts.append(Part(part_path))
+            parts.append(Part(part_path, self.storage))
 
         return parts
 
     def _load_chapters_flat(self):
         """Load chapters from top-level chapter-NN-*.md files (format 2)."""
-        if not os.path.isdir(self.book_dir):
+        if not self.storage.isdir(self.book_dir):
             return []
 
         files = [
             f
-            for f in os.listdir(self.book_dir)
+            for f in self.storage.listdir(self.book_dir)
             if re.fullmatch(r"chapter-\d+.*\.md", f)
         ]
         files.sort(key=lambda f: int(re.match(r"chapter-(\d+)", f).group(1)))
 
         return [
-            Chapter.from_file(os.path.join(self.book_dir, f)) for f in files
+            Chapter.from_file(os.path.join(self.book_dir, f), self.storage)
+            for f in files
         ]
 
     def _load_about_file(self, filename):
         """Load content from an about file."""
         file_path = os.path.join(self.book_dir, filename)
-        if os.path.isfile(file_path):
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+        if self.storage.isfile(file_path):
+            lines = self.storage.read_text(file_path).splitlines(True)
             if not lines:
                 return None, None
             # Extract title from first line
@@ -109,25 +146,30 @@ class BookLoaderMixin:
             return title, content
         return None, None
 
+    def _all_chapters(self):
+        """Return every chapter in book order, across parts."""
+        return [
+            chapter for part in self.parts for chapter in part.chapters
+        ] + list(self.chapters)
+
     def _count_words(self):
         """Count total words in all chapters."""
-        word_count = 0
-        for part in self.parts:
-            for chapter in part.chapters:
-                word_count += len(chapter.content.split())
-        for chapter in self.chapters:
-            word_count += len(chapter.content.split())
-        return word_count
+        return sum(chapter.word_count for chapter in self._all_chapters())
+
+    def evict_content(self):
+        """
+        Drop the text of every chapter, keeping titles, paths and word
+        counts; each chapter re-reads its files when its text is next
+        needed (e.g. by a build).
+        """
+        for chapter in self._all_chapters():
+            chapter.evict()
 
     def _has_section_breaks(self):
         """Check if any chapter content contains section break markers."""
         pattern = re.compile(r"^\s*(---|\.\.\.)\s*$", re.MULTILINE)
 
-        all_chapters = [
-            chapter for part in self.parts for chapter in part.chapters
-        ] + list(self.chapters)
-
-        if any(pattern.search(ch.content) for ch in all_chapters):
+        if any(pattern.search(ch.content) for ch in self._all_chapters()):
             return True
 
         has_breaks_in_about = (
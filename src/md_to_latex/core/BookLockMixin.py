@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from rich.console import Console
+
+from md_to_latex.core.BuildResult import BuildResult
+
+try:
+    import fcntl
+except ImportError:  # advisory locks need a POSIX system
+    fcntl = None
+
+console = Console()
+
+# Directory of the lock files and build records, keyed by output_dir
+LOCK_DIR = "md_to_latex_locks"
+LOCK_SUFFIX = ".lock"
+BUILD_RECORD_SUFFIX = "-build.json"
+
+
+def _option_value(value):
+    """JSON stand-in for build options such as LayoutProfile objects."""
+    to_dict = getattr(value, "to_dict", None)
+    return to_dict() if to_dict else repr(value)
+
+
+class BookLockMixin:
+    """Mixin for serializing builds of one book across processes."""
+
+    def _lock_path(self, suffix):
+        """
+        Return the path of the output directory's lock file or build
+        record.
+
+        They live in LOCK_DIR under scratch_dir (default: the system
+        temp directory), named by a digest of output_dir, so they stay
+        out of the published tree and its manifest, and off network
+        file systems where flock() may not work. Builders of one output
+        directory share the lock when they use the same scratch_dir.
+
+        Args:
+            suffix: LOCK_SUFFIX or BUILD_RECORD_SUFFIX
+        """
+        lock_dir = os.path.join(
+            self.scratch_dir or tempfile.gettempdir(), LOCK_DIR
+        )
+        os.makedirs(lock_dir, exist_ok=True)
+        output_dir = os.path.abspath(self.output_dir)
+        digest = hashlib.sha1(output_dir.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(lock_dir, digest + suffix)
+
+    @contextmanager
+    def _build_lock(self):
+        """
+        Hold the output directory's advisory lock for the duration of
+        the block.
+
+        The lock is an flock() on a local file (see _lock_path()), so
+        concurrent builders in other processes (or threads, with their
+        own Book) wait for each other. Without fcntl, builds are not
+        serialized.
+        """
+        with open(self._lock_path(LOCK_SUFFIX), "a") as f:
+            if fcntl is None:
+                yield
+                return
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                console.print(
+                    "[yellow]→ Waiting for another build of this book..."
+                    "[/yellow]"
+                )
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _build_key(self, options):
+        """
+        Digest of the build options, the state of the book's files and
+        the in-memory edits made to them.
+
+        Two builds with the same key produce the same outputs.
+        """
+        digest = hashlib.sha256()
+        digest.update(
+            json.dumps(options, sort_keys=True, default=_option_value).encode(
+                "utf-8"
+            )
+        )
+        digest.update(os.environ.get("SOURCE_DATE_EPOCH", "").encode())
+        for path, signature in sorted(self.storage.signatures().items()):
+            digest.update(f"{path}\0{signature}\n".encode("utf-8"))
+        for path, edit in sorted(self._edits.items()):
+            digest.update(f"edit:{path}\0{edit}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_build_record(self):
+        try:
+            with open(
+                self._lock_path(BUILD_RECORD_SUFFIX), "r", encoding="utf-8"
+            ) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_build_record(self, key, result):
+        """Record the result of the build that just finished."""
+        record = {"key": key, "finished": time.time()}
+        record["result"] = result.to_dict()
+        self._write_atomic(
+            self._lock_path(BUILD_RECORD_SUFFIX),
+            json.dumps(record, indent=2).encode("utf-8"),
+        )
+
+    def _concurrent_result(self, key, requested):
+        """
+        Return the result of an identical build that finished while this
+        one waited for the lock, or None.
+
+        Only the last build is recorded: any other build in between may
+        have replaced its outputs.
+
+        Args:
+            key: _build_key() of this build
+            requested: time.time() when this build was requested
+        """
+        record = self._load_build_record()
+        if (
+            not record
+            or record.get("key") != key
+            or record.get("finished", 0) < requested
+        ):
+            return None
+        console.print(
+            "[green]✓ Reusing the identical build that just finished[/green]"
+        )
+        return BuildResult.from_dict(record["result"], shared=True)
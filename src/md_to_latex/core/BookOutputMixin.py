@@ -1,74 +1,273 @@
 import os
 import subprocess
-import sys
 
 from rich.console import Console
 
+from md_to_latex.core.LatexCompileError import LatexCompileError
+from md_to_latex.core.LatexLogParser import LatexLogParser
+
 console = Console()
 
 
 class BookOutputMixin:
     """Mixin for generating output files."""
 
-    def _compile_pdf(self, tex_dir, tex_filename):
-        """Compile LaTeX to PDF using pdflatex."""
-        # Run pdflatex twice to generate table of contents
-        # First pass creates .toc file, second pass uses it
-        for _ in range(2):
-            result = subprocess.run(
-                ["pdflatex", "--interaction=nonstopmode", tex_filename],
-                cwd=tex_dir,
-                capture_output=True,
-                text=True,
-                check=False,
+    def _resolve_source_date(self, reproducible=None):
+        """
+        Return the pinned build time of a reproducible build, or None.
+
+        Args:
+            reproducible: True, False, or None to build reproducibly only
+                when SOURCE_DATE_EPOCH is set
+
+        Returns:
+            SOURCE_DATE_EPOCH when set, else the newest modification time
+            of the book's files, as integer seconds; None when the build
+            is not reproducible
+
+        Raises:
+            ValueError: If SOURCE_DATE_EPOCH is not an integer
+        """
+        epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        if reproducible is None:
+            reproducible = bool(epoch)
+        if not reproducible:
+            return None
+        if epoch:
+            try:
+                return int(epoch)
+            except ValueError:
+                raise ValueError(
+                    f"SOURCE_DATE_EPOCH must be an integer, got {epoch!r}"
+                ) from None
+        newest = 0
+        for path in self.storage.walk():
+            newest = max(newest, self.storage.mtime(path) or 0)
+        return int(newest)
+
+    def _run_pdflatex(
+        self, tex_dir, tex_filename, fail_fast=False, draftmode=False
+    ):
+        """
+        Run one pdflatex pass, parsing its output as it streams.
+
+        With *fail_fast*, pdflatex halts on the first error and is killed
+        as soon as that error has been parsed, instead of typesetting the
+        rest of the book. With *draftmode*, no PDF is written; the pass
+        only updates the .aux, .toc and .out files.
+
+        Returns:
+            (returncode, LatexLogParser) tuple
+        """
+        command = [
+            "pdflatex",
+            "--interaction=nonstopmode",
+            "-file-line-error",
+        ]
+        if fail_fast:
+            command.append("-halt-on-error")
+        if draftmode:
+            command.append("-draftmode")
+        command.append(tex_filename)
+
+        env = None
+        if self.source_date_epoch is not None:
+            # Pins the PDF dates and \today; see _add_reproducible_ids
+            env = dict(
+                os.environ,
+                SOURCE_DATE_EPOCH=str(self.source_date_epoch),
+                FORCE_SOURCE_DATE="1",
+            )
+
+        parser = LatexLogParser(tex_filename)
+        process = subprocess.Popen(
+            command,
+            cwd=tex_dir,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        )
+        with process.stdout:
+            for line in process.stdout:
+                if parser.feed(line) and fail_fast:
+                    process.kill()
+                    break
+        returncode = self._wait_pdflatex(process)
+        parser.close()
+        return returncode, parser
+
+    def _wait_pdflatex(self, process):
+        """
+        Wait for a pdflatex process, reporting its own peak RSS to the
+        memory profiler where os.wait4() is available.
+
+        Returns:
+            The process's exit status
+        """
+        if not (self.memory.enabled and hasattr(os, "wait4")):
+            return process.wait()
+        _, status, rusage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        self.memory.child_exited(rusage)
+        return process.returncode
+
+    def _locate_sources(self, tex_filename, errors, source_map=None):
+        """Attach the originating markdown location to each error."""
+        source_map = source_map or self._source_map
+        if source_map is None:
+            return
+        for latex_error in errors:
+            in_main_file = latex_error.file is None or (
+                os.path.basename(latex_error.file) == tex_filename
             )
-            if result.returncode != 0:
-                console.print("[red]✗ pdflatex failed[/red]")
-                console.print("[dim]stdout:[/dim]", result.stdout)
-                console.print("[dim]stderr:[/dim]", result.stderr)
-                msg = (
-                    f"pdflatex failed with return code "
-                    f"{result.returncode}"
+            if latex_error.line and in_main_file:
+                location = source_map.lookup(latex_error.line)
+                if location:
+                    latex_error.source_file, latex_error.source_line = location
+
+    def _report_latex_errors(self, error):
+        """Print the errors carried by a LatexCompileError."""
+        console.print("[red]✗ pdflatex failed[/red]")
+        if not error.errors:
+            console.print("[dim]" + "\n".join(error.tail) + "[/dim]")
+            return
+        for latex_error in error.errors:
+            console.print(
+                f"  [bold]{latex_error.location}[/bold]: "
+                f"{latex_error.message}"
+            )
+            if latex_error.context:
+                console.print(f"    [dim]{latex_error.context}[/dim]")
+            if latex_error.source_file:
+                console.print(
+                    f"    [yellow]↳ from {latex_error.source_file}:"
+                    f"{latex_error.source_line}[/yellow]"
                 )
-                raise RuntimeError(msg)
+
+    def _compile_pdf(
+        self, tex_dir, tex_filename, fail_fast=False, source_map=None
+    ):
+        """
+        Compile LaTeX to PDF using pdflatex.
+
+        Args:
+            source_map: SourceMap of this .tex file (default: the one of
+                the current build)
+
+        Raises:
+            LatexCompileError: If a pass reports errors; later passes are
+                skipped.
+        """
+        # Production runs pdflatex twice to generate table of contents
+        # First pass creates .toc file, second pass uses it
+        passes = self.profile.passes
+        for pass_number in range(1, passes + 1):
+            with self.timer.span(
+                f"pdflatex pass {pass_number}", category="pdflatex"
+            ):
+                returncode, parser = self._run_pdflatex(
+                    tex_dir,
+                    tex_filename,
+                    fail_fast=fail_fast,
+                    draftmode=self.profile.draftmode
+                    and pass_number < passes,
+                )
+            if returncode != 0 or parser.errors:
+                self._locate_sources(
+                    tex_filename, parser.errors, source_map
+                )
+                error = LatexCompileError(
+                    returncode, parser.errors, parser.tail
+                )
+                self._report_latex_errors(error)
+                raise error
 
     def _cleanup_aux_files(self, tex_dir, base_name):
         """Remove all compilation artifacts except .tex and .pdf files."""
         keep_extensions = {".tex", ".pdf"}
         for fname in os.listdir(tex_dir):
             name, ext = os.path.splitext(fname)
-            if name == base_name and ext not in keep_extensions:
-                os.remove(os.path.join(tex_dir, fname))
+            path = os.path.join(tex_dir, fname)
+            if (
+                name == base_name
+                and ext not in keep_extensions
+                and os.path.isfile(path)
+            ):
+                os.remove(path)
 
-    def _generate_output(self, doc, output_path):
-        """Generate PDF or LaTeX file."""
+    def _generate_output(
+        self,
+        doc,
+        output_path,
+        fail_fast=False,
+        diagnose=None,
+        source_map=None,
+        shards=None,
+    ):
+        """
+        Generate PDF or LaTeX file.
+
+        Args:
+            doc: PyLaTeX Document object
+            output_path: Output path without extension, in a scratch
+                directory; the .tex and PDF are published to output_dir
+            fail_fast: Abort pdflatex on the first error
+            diagnose: diagnose() strategy to run when pdflatex fails
+            source_map: SourceMap filled while building *doc*; saved as
+                <output_path>.texmap.json and used to locate errors
+            shards: Compile the PDF as parallel shards ("parts" or a
+                number of chapter groups) instead of in one pdflatex run
+        """
+        self._source_map = source_map
         try:
             # Generate the .tex file first
-            doc.generate_tex(output_path)
+            with self._stage("generate_tex"):
+                doc.generate_tex(output_path)
             tex_file = f"{output_path}.tex"
+            if source_map is not None:
+                source_map.resolve(tex_file)
+                source_map.save(f"{output_path}.texmap.json")
             tex_dir = os.path.dirname(tex_file)
             tex_filename = os.path.basename(tex_file)
             base_name = os.path.splitext(tex_filename)[0]
 
-            self._compile_pdf(tex_dir, tex_filename)
+            with self._stage("compile_pdf", child=True):
+                if shards:
+                    self._compile_sharded(
+                        output_path, shards, fail_fast=fail_fast
+                    )
+                else:
+                    self._compile_pdf(
+                        tex_dir, tex_filename, fail_fast=fail_fast
+                    )
             self._cleanup_aux_files(tex_dir, base_name)
 
-            pdf_path = f"{output_path}.pdf"
+            _, pdf_path = self._publish_latex(tex_file, f"{output_path}.pdf")
             console.print(
                 f"[green]✓ PDF generated successfully:[/green] "
                 f"[bold]{pdf_path}[/bold]"
             )
 
             # Open the PDF on macOS
-            if sys.platform == "darwin":
+            if self.open_outputs:
                 subprocess.run(["open", pdf_path], check=False)
 
             return pdf_path
         except Exception as e:
             console.print(f"[red]✗ Error generating PDF:[/red] {e}")
+            if diagnose and isinstance(e, LatexCompileError):
+                console.print(
+                    "[yellow]→ Compiling chapters standalone to isolate "
+                    "the error...[/yellow]"
+                )
+                with self._stage("diagnose"):
+                    self._report_diagnosis(self.diagnose(strategy=diagnose))
             doc.generate_tex(output_path)
+            tex_path, _ = self._publish_latex(f"{output_path}.tex")
             console.print(
                 f"[yellow]→ LaTeX file saved:[/yellow] "
-                f"[bold]{output_path}.tex[/bold]"
+                f"[bold]{tex_path}[/bold]"
             )
-            return f"{output_path}.tex"
+            return tex_path
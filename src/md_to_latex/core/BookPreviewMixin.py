@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from pylatex import NoEscape
+
+from md_to_latex.core.LatexError import LatexError
+from md_to_latex.core.SourceMap import SourceMap
+
+_CACHE_FILE = "previews.json"
+
+
+class BookPreviewMixin:
+    """Mixin for compiling standalone chapter preview PDFs."""
+
+    @property
+    def preview_dir(self):
+        """Directory holding preview PDFs and their cache index."""
+        return os.path.join(self.output_dir, "previews")
+
+    def _select_chapters(self, chapters):
+        """
+        Resolve a chapter selection to (1-based index, Chapter) pairs.
+
+        Args:
+            chapters: None for every chapter, or a list of 1-based
+                chapter numbers, chapter titles (case-insensitive) or
+                Chapter objects
+        """
+        all_chapters = self._all_chapters()
+        if chapters is None:
+            return list(enumerate(all_chapters, 1))
+        selected = []
+        for wanted in chapters:
+            if isinstance(wanted, int) or str(wanted).isdigit():
+                number = int(wanted)
+                if not 1 <= number <= len(all_chapters):
+                    raise ValueError(
+                        f"Chapter {number} out of range "
+                        f"(1-{len(all_chapters)})"
+                    )
+                selected.append((number, all_chapters[number - 1]))
+                continue
+            for number, chapter in enumerate(all_chapters, 1):
+                if chapter is wanted or (
+                    isinstance(wanted, str)
+                    and chapter.title.lower() == wanted.lower()
+                ):
+                    selected.append((number, chapter))
+                    break
+            else:
+                raise ValueError(f"No chapter matches {wanted!r}")
+        return selected
+
+    def _preview_name(self, number, chapter):
+        return f"chapter-{number:03d}-{self._to_kebab_case(chapter.title)}"
+
+    def _preview_document(self, number, chapter, source_map=None):
+        """
+        Build a standalone document for one chapter.
+
+        It uses the book's preamble, headers and chapter numbering, so the
+        preview typesets like the chapter does in the full book.
+        """
+        doc = self._new_document()
+        doc.append(NoEscape(r"\mainmatter"))
+        doc.append(
+            NoEscape(r"\setcounter{chapter}{" + str(number - 1) + "}")
+        )
+        chapter.to_latex(doc, source_map=source_map)
+        return doc
+
+    def _load_preview_cache(self):
+        try:
+            with open(
+                os.path.join(self.preview_dir, _CACHE_FILE),
+                "r",
+                encoding="utf-8",
+            ) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_preview_cache(self, cache):
+        with open(
+            os.path.join(self.preview_dir, _CACHE_FILE), "w", encoding="utf-8"
+        ) as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+
+    def _compile_preview(self, name, tex, source_map):
+        """
+        Compile one preview (a single pass is enough without contents)
+        in a scratch directory, and publish its PDF to preview_dir.
+
+        Returns:
+            List of LatexError objects; empty when the compile succeeded
+        """
+        with self.timer.span(name, category="preview"), self._scratch(
+            "md_to_latex_preview_"
+        ) as work_dir:
+            tex_path = os.path.join(work_dir, f"{name}.tex")
+            with open(tex_path, "w", encoding="utf-8") as f:
+                f.write(tex)
+            returncode, parser = self._run_pdflatex(
+                work_dir, f"{name}.tex", fail_fast=True
+            )
+            if parser.errors:
+                source_map.resolve(tex_path)
+                self._locate_sources(
+                    f"{name}.tex", parser.errors, source_map
+                )
+            elif returncode != 0:
+                return [
+                    LatexError(
+                        f"pdflatex exited with status {returncode}",
+                        file=f"{name}.tex",
+                    )
+                ]
+            else:
+                self._publish(
+                    os.path.join(work_dir, f"{name}.pdf"), self.preview_dir
+                )
+        return parser.errors
+
+    def preview(self, chapters=None, max_workers=None):
+        """
+        Compile chapters into small standalone preview PDFs.
+
+        Previews are compiled in parallel and cached by a hash of their
+        LaTeX, so asking again for an unchanged chapter is instant.
+
+        Args:
+            chapters: None for every chapter, or a list of 1-based
+                chapter numbers, titles or Chapter objects
+            max_workers: Maximum concurrent pdflatex processes
+                (default: CPU count)
+
+        Returns:
+            List of dicts with "chapter" (title), "chapter_index",
+            "pdf_path" (None when it failed), "cached" and "errors"
+            (LatexError objects), in the order requested
+        """
+        selected = self._select_chapters(chapters)
+        # Serialized with builds, which publish to the same directory
+        with self._build_lock():
+            return self._compile_previews(selected, max_workers)
+
+    def _compile_previews(self, selected, max_workers):
+        """Compile the (number, Chapter) pairs whose cache is stale."""
+        os.makedirs(self.preview_dir, exist_ok=True)
+        cache = self._load_preview_cache()
+
+        names = []
+        jobs = {}
+        previews = []
+        for number, chapter in selected:
+            name = self._preview_name(number, chapter)
+            source_map = SourceMap(self.book_dir)
+            tex = self._preview_document(number, chapter, source_map).dumps()
+            digest = hashlib.sha256(tex.encode("utf-8")).hexdigest()
+            pdf_path = os.path.join(self.preview_dir, f"{name}.pdf")
+            cached = cache.get(name) == digest and os.path.isfile(pdf_path)
+            if not cached:
+                jobs[name] = (tex, digest, source_map)
+            names.append(name)
+            previews.append(
+                {
+                    "chapter": chapter.title,
+                    "chapter_index": number,
+                    "pdf_path": pdf_path,
+                    "cached": cached,
+                    "errors": [],
+                }
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers or os.cpu_count()
+        ) as pool:
+            futures = {
+                name: pool.submit(
+                    self._compile_preview, name, tex, source_map
+                )
+                for name, (tex, _, source_map) in jobs.items()
+            }
+            results = {name: f.result() for name, f in futures.items()}
+
+        for name, preview in zip(names, previews):
+            if name not in results:
+                continue
+            if results[name]:
+                preview["errors"] = results[name]
+                preview["pdf_path"] = None
+                cache.pop(name, None)
+            else:
+                cache[name] = jobs[name][1]
+        self._save_preview_cache(cache)
+        return previews
@@ -0,0 +1,210 @@
+import errno
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+MANIFEST_FILE = "manifest.json"
+_CHUNK_SIZE = 1 << 20
+
+
+class BookPublishMixin:
+    """Mixin for building in a scratch directory and publishing outputs."""
+
+    @contextmanager
+    def _scratch(self, prefix="md_to_latex_build_"):
+        """
+        Yield a fresh working directory under scratch_dir.
+
+        pdflatex writes its .aux, .log, .toc and .out files here instead
+        of into the output directory; the directory is removed afterwards.
+        """
+        if self.scratch_dir:
+            os.makedirs(self.scratch_dir, exist_ok=True)
+        work_dir = tempfile.mkdtemp(prefix=prefix, dir=self.scratch_dir)
+        try:
+            yield work_dir
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _cache_dir(self, name, shared=False):
+        """
+        Return the directory for the book's cached *name* state, or None
+        when the book keeps no caches.
+
+        Caches are kept only under an explicit scratch_dir, so a default
+        build leaves nothing behind in the system temp directory. The
+        directory is keyed by output_dir, so it survives between builds.
+
+        Args:
+            name: Name of the cache
+            shared: Key the directory by the storage's cache_id when it
+                has one, for content-keyed caches that every edition of
+                the book can share
+        """
+        if not self.scratch_dir:
+            return None
+        cache_id = (shared and self.storage.cache_id) or os.path.abspath(
+            self.output_dir
+        )
+        digest = hashlib.sha1(cache_id.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.scratch_dir, f"md_to_latex_{name}_{digest}")
+
+    @staticmethod
+    def _file_digest(path):
+        """Return the SHA-256 hex digest of a file."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def _same_file_content(cls, path, dest, digest):
+        """Whether *dest* exists and has the SHA-256 digest *digest*."""
+        return (
+            os.path.isfile(dest)
+            and os.path.getsize(dest) == os.path.getsize(path)
+            and cls._file_digest(dest) == digest
+        )
+
+    @staticmethod
+    def _copy_replace(path, dest):
+        """
+        Copy *path* next to *dest* under a temporary name, then rename it
+        over *dest*, so readers never see a partly written file.
+        """
+        dest_dir, dest_name = os.path.split(dest)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{dest_name}.", suffix=".tmp", dir=dest_dir
+        )
+        try:
+            with os.fdopen(fd, "wb") as f, open(path, "rb") as src:
+                shutil.copyfileobj(src, f)
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, dest)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.remove(path)
+
+    @staticmethod
+    def _write_atomic(path, data):
+        """Write *data* (bytes) to a temporary file and rename it to *path*."""
+        dest_dir, name = os.path.split(path)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{name}.", suffix=".tmp", dir=dest_dir or "."
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return path
+
+    def _publish(self, path, dest_dir=None):
+        """
+        Atomically move a finished artifact into the output directory.
+
+        Within one file system this is a rename; across file systems
+        (e.g. from /dev/shm to a network share) the file is copied to a
+        temporary name in *dest_dir* and renamed from there. When the
+        target already has the same content it is left untouched, so its
+        mtime only changes when its bytes do. Either way the artifact is
+        recorded for the build manifest.
+
+        Args:
+            path: Artifact written in a scratch directory
+            dest_dir: Target directory (default: output_dir)
+
+        Returns:
+            The published path
+        """
+        dest = os.path.join(
+            dest_dir or self.output_dir, os.path.basename(path)
+        )
+        if os.path.abspath(path) == os.path.abspath(dest):
+            return dest
+        digest = self._file_digest(path)
+        size = os.path.getsize(path)
+        changed = not self._same_file_content(path, dest, digest)
+        if not changed:
+            os.remove(path)
+        else:
+            try:
+                os.replace(path, dest)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                self._copy_replace(path, dest)
+        name = os.path.relpath(dest, self.output_dir).replace(os.sep, "/")
+        self._artifacts[name] = {
+            "sha256": digest,
+            "size": size,
+            "changed": changed,
+        }
+        return dest
+
+    def _publish_latex(self, tex_path, pdf_path=None):
+        """
+        Publish a .tex file with its source map and PDF.
+
+        The PDF is published last, so a new PDF is never visible next to
+        the previous build's .tex file.
+
+        Returns:
+            (published .tex path, published PDF path or None)
+        """
+        texmap_path = f"{os.path.splitext(tex_path)[0]}.texmap.json"
+        if os.path.isfile(texmap_path):
+            self._publish(texmap_path)
+        tex_path = self._publish(tex_path)
+        if pdf_path:
+            pdf_path = self._publish(pdf_path)
+        return tex_path, pdf_path
+
+    def _write_manifest(self):
+        """
+        Record the digest and size of every published artifact in
+        output_dir/manifest.json.
+
+        Entries from earlier builds (e.g. another profile) are kept while
+        their file exists. The manifest itself is only rewritten when its
+        content changes.
+
+        Returns:
+            Path to the manifest
+        """
+        path = os.path.join(self.output_dir, MANIFEST_FILE)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                previous = json.load(f).get("artifacts", {})
+        except (OSError, ValueError):
+            previous = {}
+        artifacts = {
+            name: entry
+            for name, entry in previous.items()
+            if os.path.isfile(os.path.join(self.output_dir, name))
+        }
+        for name, entry in self._artifacts.items():
+            artifacts[name] = {
+                "sha256": entry["sha256"],
+                "size": entry["size"],
+            }
+        data = (
+            json.dumps({"artifacts": artifacts}, indent=2, sort_keys=True)
+            + "\n"
+        ).encode("utf-8")
+        try:
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return path
+        except OSError:
+            pass
+        return self._write_atomic(path, data)
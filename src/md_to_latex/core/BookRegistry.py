@@ -0,0 +1,146 @@
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from rich.console import Console
+
+console = Console()
+
+# Default memory cap of a registry, in estimated bytes of loaded books
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class BookRegistry:
+    """
+    In-process LRU cache of loaded books, kept current by the stats of
+    their files.
+
+    open() returns the cached Book while BookStorage.signatures() of its
+    files is unchanged. When files were only edited, the book re-reads
+    just the chapters they belong to; added or removed files and other
+    edits load it again. The least recently opened books are dropped
+    once the estimated memory of all books exceeds max_bytes.
+
+    Books are opened and loaded outside the registry lock, under a lock
+    of their own key, so one slow load neither blocks other books nor
+    runs twice for the same book.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize a BookRegistry.
+
+        Args:
+            max_bytes: Memory cap, in bytes estimated by
+                Book._resident_bytes(); the most recently opened book is
+                kept even when it alone exceeds the cap
+        """
+        self.max_bytes = max_bytes
+        # key -> [book, signatures, estimated bytes], oldest first
+        self._entries = OrderedDict()
+        # key -> [lock held while that book is opened, number of threads
+        # holding or waiting for it]; dropped once no thread does
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def resident_bytes(self):
+        """Estimated memory of all cached books."""
+        return sum(entry[2] for entry in self._entries.values())
+
+    def open(self, book_class, book_dir, **kwargs):
+        """
+        Return the loaded book at *book_dir*, reusing the cached one when
+        its files allow.
+
+        Books are cached per path and keyword arguments. A BookStorage
+        (e.g. MemoryStorage) has no path to be found again by, so it is
+        always loaded.
+
+        Args:
+            book_class: Book class to construct
+            book_dir: Path to the book directory or archive
+            **kwargs: Passed on to book_class
+        """
+        if not isinstance(book_dir, (str, os.PathLike)):
+            return book_class(book_dir, **kwargs)
+        key = (os.path.abspath(book_dir), tuple(sorted(kwargs.items())))
+        with self._key_lock(key):
+            storage = book_class._open_storage(os.fspath(book_dir))
+            signatures = storage.signatures()
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None or not self._revalidate(
+                entry, storage, signatures
+            ):
+                book = book_class(storage, **kwargs)
+                entry = [book, signatures, book._resident_bytes()]
+            elif entry[0].storage is not storage:
+                # Unchanged: the cached book keeps reading its own storage
+                storage.close()
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                self._trim()
+            return entry[0]
+
+    @contextmanager
+    def _key_lock(self, key):
+        """
+        Hold the lock of *key*, shared by every thread opening that book.
+
+        The lock lives exactly as long as some thread holds or waits for
+        it, whether or not the book stays cached, so a second lock for
+        the same book never exists while the first is in use.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            key_lock[1] += 1
+        try:
+            with key_lock[0]:
+                yield
+        finally:
+            with self._lock:
+                key_lock[1] -= 1
+                if not key_lock[1]:
+                    del self._key_locks[key]
+
+    @staticmethod
+    def _revalidate(entry, storage, signatures):
+        """
+        Bring a cached entry up to date with *signatures*.
+
+        Returns:
+            False when the book has to be loaded again
+        """
+        book, old_signatures, _ = entry
+        if signatures == old_signatures:
+            return True
+        refreshed = book._refresh_chapters(
+            storage, old_signatures, signatures
+        )
+        if refreshed is None:
+            return False
+        console.print(
+            f"[cyan]→ {book.title}: re-read {len(refreshed)} changed "
+            f"chapter(s)[/cyan]"
+        )
+        entry[1] = signatures
+        entry[2] = book._resident_bytes()
+        return True
+
+    def _trim(self):
+        """Drop the least recently opened books above max_bytes."""
+        total = self.resident_bytes
+        while total > self.max_bytes and len(self._entries) > 1:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            total -= size
+
+    def clear(self):
+        """Drop every cached book."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,87 @@
+import sys
+
+from md_to_latex.core.BookRegistry import BookRegistry
+
+
+class BookRegistryMixin:
+    """Mixin for reusing loaded books through a BookRegistry."""
+
+    # Registry used by Book.open(); replace it to change the memory cap
+    registry = BookRegistry()
+
+    @classmethod
+    def open(cls, book_dir, **kwargs):
+        """
+        Return a loaded Book for *book_dir*, shared with earlier calls
+        while its files are unchanged (see BookRegistry).
+
+        Args:
+            book_dir: Path to the book directory or archive
+            **kwargs: Passed on to Book()
+        """
+        return cls.registry.open(cls, book_dir, **kwargs)
+
+    def _refresh_chapters(self, storage, old_signatures, signatures):
+        """
+        Re-read the chapters whose files changed between two
+        BookStorage.signatures() results.
+
+        Directory entries are ignored, since editors that save by
+        renaming change the directory's stats too; added or removed
+        files show up as different keys.
+        A re-read chapter drops its update_segment() edits, as the files
+        on disk now hold the newer text, so they no longer count towards
+        the build key either.
+        The model snapshot on disk is not rewritten; it no longer matches
+        and the next Book() of the files replaces it.
+
+        Args:
+            storage: Freshly opened storage of the book
+            old_signatures: Signatures the book was loaded with
+            signatures: Current signatures
+
+        Returns:
+            List of re-read chapters, or None when files were added or
+            removed or a file that is not chapter text changed, so the
+            book has to be loaded again
+        """
+        if signatures.keys() != old_signatures.keys():
+            return None
+        changed = {
+            rel_path
+            for rel_path, signature in signatures.items()
+            if signature != old_signatures[rel_path]
+            and not rel_path.endswith("/")
+        }
+        chapter_by_file = {
+            rel_path: chapter
+            for chapter in self._all_chapters()
+            for rel_path in chapter._relative_md_files(self.storage.root)
+        }
+        if not changed <= chapter_by_file.keys():
+            return None
+        self.storage.close()
+        self.storage = storage
+        for part in self.parts:
+            part.storage = storage
+        for chapter in self._all_chapters():
+            chapter.storage = storage
+        refreshed = []
+        for rel_path in sorted(changed):
+            chapter = chapter_by_file[rel_path]
+            if chapter not in refreshed:
+                chapter.reload()
+                for chapter_path in chapter._relative_md_files(storage.root):
+                    self._edits.pop(chapter_path, None)
+                refreshed.append(chapter)
+        return refreshed
+
+    def _resident_bytes(self):
+        """Estimate the memory held by the loaded book."""
+        return sum(
+            chapter._resident_bytes() for chapter in self._all_chapters()
+        ) + sum(
+            sys.getsizeof(text)
+            for text in (self.about_author, self.about_book)
+            if text
+        )
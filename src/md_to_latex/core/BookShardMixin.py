@@ -0,0 +1,434 @@
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pylatex import NoEscape
+from rich.console import Console
+
+from md_to_latex.core.LatexCompileError import LatexCompileError
+from md_to_latex.core.SourceMap import SourceMap
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # pypdf is only needed for sharded builds
+    PdfReader = PdfWriter = None
+
+console = Console()
+
+# Each shard records the page the next shard starts on in its .aux file
+_SHARD_MACROS = r"""\makeatletter
+\providecommand{\mdtolatexshardend}[1]{}
+\newcommand{\mdtolatexrecordshardend}{\clearpage%
+  \immediate\write\@auxout{\string\mdtolatexshardend{\the\value{page}}}}
+\makeatother"""
+_SHARD_END = re.compile(r"^\\mdtolatexshardend\{(\d+)\}", re.MULTILINE)
+_SHARD_START = re.compile(r"\\setcounter\{page\}\{(\d+)\}")
+# Separates shard 0's own .toc entries from those merged in from the rest
+_TOC_MERGE_MARKER = "% md_to_latex:merged-shards\n"
+_MAX_PASSES = 5
+_SHARD_CACHE = "shards"
+
+
+class BookShardMixin:
+    """Mixin for compiling the PDF as parallel shards and stitching them."""
+
+    # ── Planning ────────────────────────────────────────────────────────────
+
+    def _body_units(self):
+        """Return the body as (part or None, chapter or None) units."""
+        if self.format == 2:
+            return [(None, chapter) for chapter in self.chapters]
+        units = []
+        for part in self.parts:
+            units += [(part, chapter) for chapter in part.chapters] or [
+                (part, None)
+            ]
+        return units
+
+    def _shard_units(self, shards):
+        """
+        Split the body into shards.
+
+        Args:
+            shards: "parts" for one shard per part, or the number of
+                contiguous chapter groups, balanced by word count
+
+        Returns:
+            List of non-empty lists of (part, chapter) units
+        """
+        units = self._body_units()
+        if shards == "parts":
+            if self.format == 2:
+                raise ValueError(
+                    "Flat books have no parts; pass a shard count instead"
+                )
+            groups = []
+            for unit in units:
+                if groups and groups[-1][-1][0] is unit[0]:
+                    groups[-1].append(unit)
+                else:
+                    groups.append([unit])
+            return groups
+
+        try:
+            count = int(shards)
+        except ValueError:
+            raise ValueError(
+                f"Shards must be 'parts' or a number, got {shards!r}"
+            ) from None
+        if count < 1:
+            raise ValueError(f"Shard count must be positive, got {shards!r}")
+        count = min(count, len(units)) or 1
+        weights = [
+            chapter.word_count + 1 if chapter else 1
+            for _, chapter in units
+        ]
+        target = sum(weights) / count
+        groups = [[]]
+        cumulative = 0
+        for index, (unit, weight) in enumerate(zip(units, weights)):
+            remaining_units = len(units) - index
+            remaining_groups = count - len(groups)
+            if (
+                groups[-1]
+                and remaining_groups > 0
+                and (
+                    cumulative >= target * len(groups)
+                    or remaining_units <= remaining_groups
+                )
+            ):
+                groups.append([])
+            groups[-1].append(unit)
+            cumulative += weight
+        return groups
+
+    # ── Shard documents ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def _shard_name(index):
+        return f"shard-{index:03d}"
+
+    def _shard_document(self, index, units, source_map=None):
+        """
+        Build the document for one shard.
+
+        Shard 0 carries the front matter; later shards \\input a small
+        start file that sets the page, chapter and part counters, so
+        numbering continues where the previous shard stopped.
+        """
+        doc = self._new_document()
+        doc.preamble.append(NoEscape(_SHARD_MACROS))
+        if index == 0:
+            self._add_front_matter(doc)
+            doc.append(NoEscape(r"\mainmatter"))
+        else:
+            doc.append(
+                NoEscape(r"\input{" + self._shard_name(index) + "-start}")
+            )
+        for part, chapter in units:
+            if part is not None and (
+                chapter is None or chapter is part.chapters[0]
+            ):
+                doc.append(part.heading())
+            if chapter is not None:
+                with self.timer.span(chapter.title, category="chapter"):
+                    chapter.to_latex(doc, source_map=source_map)
+        doc.append(NoEscape(r"\mdtolatexrecordshardend"))
+        return doc
+
+    @staticmethod
+    def _shard_counters(groups):
+        """Return the (chapter, part) counters each shard starts from."""
+        counters = []
+        chapters, parts = 0, 0
+        seen_parts = set()
+        for units in groups:
+            counters.append((chapters, parts))
+            for part, chapter in units:
+                if part is not None and id(part) not in seen_parts:
+                    seen_parts.add(id(part))
+                    parts += 1
+                if chapter is not None:
+                    chapters += 1
+        return counters
+
+    # ── Pass state ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _read_shard_end(aux_path):
+        """Return the page recorded at the end of a shard, or None."""
+        try:
+            with open(aux_path, "r", encoding="utf-8", errors="replace") as f:
+                match = _SHARD_END.search(f.read())
+        except OSError:
+            return None
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _read_shard_start(start_path):
+        """Return the page a shard's start file set, or None."""
+        try:
+            with open(start_path, "r", encoding="utf-8") as f:
+                match = _SHARD_START.search(f.read())
+        except OSError:
+            return None
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _own_toc(toc_path):
+        """Return a shard's own .toc entries, without merged ones."""
+        try:
+            with open(toc_path, "r", encoding="utf-8", errors="replace") as f:
+                text = f.read()
+        except OSError:
+            return ""
+        return text.split(_TOC_MERGE_MARKER, 1)[0]
+
+    def _shard_state(self, work_dir, names):
+        """
+        Read the start pages and merged contents from the last pass.
+
+        Each shard's page count is the page recorded at its end in its
+        .aux minus the page its start file set, so every start page is
+        shard 0's end plus the page counts of all shards in between, and
+        one pass moves every boundary at once. The first pass of a build
+        reuses the previous build's page counts.
+        """
+        start_pages = [None]
+        page = None
+        for index, name in enumerate(names[:-1]):
+            end = self._read_shard_end(os.path.join(work_dir, f"{name}.aux"))
+            if index == 0:
+                page = end
+            elif page is not None and end is not None:
+                started = self._read_shard_start(
+                    os.path.join(work_dir, f"{name}-start.tex")
+                )
+                page += end - (started or 1)
+            else:
+                page = None
+            start_pages.append(page)
+        tocs = [
+            self._own_toc(os.path.join(work_dir, f"{name}.toc"))
+            for name in names
+        ]
+        return start_pages, tocs
+
+    def _write_shard_state(self, work_dir, names, counters, state):
+        """Write each shard's start file and shard 0's merged .toc."""
+        start_pages, tocs = state
+        for index in range(1, len(names)):
+            chapter, part = counters[index]
+            with open(
+                os.path.join(work_dir, f"{names[index]}-start.tex"),
+                "w",
+                encoding="utf-8",
+            ) as f:
+                f.write(
+                    "\\makeatletter\\@mainmattertrue\\makeatother\n"
+                    "\\pagenumbering{arabic}\n"
+                    f"\\setcounter{{page}}{{{start_pages[index] or 1}}}\n"
+                    f"\\setcounter{{chapter}}{{{chapter}}}\n"
+                    f"\\setcounter{{part}}{{{part}}}\n"
+                )
+        with open(
+            os.path.join(work_dir, f"{names[0]}.toc"), "w", encoding="utf-8"
+        ) as f:
+            f.write(tocs[0] + _TOC_MERGE_MARKER + "".join(tocs[1:]))
+
+    def _shard_work_dir(self, output_path):
+        """
+        Return the shard working directory for *output_path*.
+
+        With a scratch_dir it is a cache directory (see _cache_dir()),
+        because its .aux and .toc files seed the next build. Otherwise it
+        lives in the per-build scratch directory next to *output_path*
+        and the first pass of every build starts cold.
+        """
+        cache_dir = self._cache_dir(_SHARD_CACHE)
+        if cache_dir is None:
+            return f"{output_path}-shards"
+        return os.path.join(cache_dir, os.path.basename(output_path))
+
+    # ── Compilation ─────────────────────────────────────────────────────────
+
+    def _compile_shard(self, work_dir, name, pass_number, fail_fast):
+        with self.timer.span(
+            f"{name} pass {pass_number}", category="pdflatex"
+        ):
+            return self._run_pdflatex(
+                work_dir, f"{name}.tex", fail_fast=fail_fast
+            )
+
+    def _compile_shard_pass(
+        self, work_dir, names, source_maps, pass_number, fail_fast, pool
+    ):
+        """Run one pdflatex pass over every shard concurrently."""
+        futures = [
+            pool.submit(
+                self._compile_shard, work_dir, name, pass_number, fail_fast
+            )
+            for name in names
+        ]
+        errors = []
+        failed = None
+        for name, source_map, future in zip(names, source_maps, futures):
+            returncode, parser = future.result()
+            if returncode != 0 or parser.errors:
+                self._locate_sources(
+                    f"{name}.tex", parser.errors, source_map=source_map
+                )
+                errors += parser.errors
+                failed = failed or (returncode, parser.tail)
+        if failed:
+            returncode, tail = failed
+            raise LatexCompileError(returncode or 1, errors, tail)
+
+    def _compile_sharded(
+        self, output_path, shards, fail_fast=False, max_workers=None
+    ):
+        """
+        Compile the PDF as shards in parallel and stitch them together.
+
+        The body is split at part boundaries or into chapter groups. Each
+        shard is compiled with the book's preamble, continuing the page,
+        chapter and part counters of the shard before it; shard 0's table
+        of contents merges the entries of all shards. Cross-shard
+        references other than the contents are not resolved.
+
+        Args:
+            output_path: Output path without extension
+            shards: "parts" or a number of chapter groups
+            fail_fast: Abort each pdflatex run on its first error
+            max_workers: Maximum concurrent pdflatex processes
+                (default: CPU count)
+
+        Returns:
+            Path to the stitched PDF
+        """
+        if PdfWriter is None:
+            raise RuntimeError("Sharded builds need pypdf (pip install pypdf)")
+        work_dir = self._shard_work_dir(output_path)
+        os.makedirs(work_dir, exist_ok=True)
+        groups = self._shard_units(shards)
+        names = [self._shard_name(i) for i in range(len(groups))]
+        counters = self._shard_counters(groups)
+
+        source_maps = []
+        for index, (name, units) in enumerate(zip(names, groups)):
+            with self.timer.span(name, category="shard"):
+                source_map = SourceMap(self.book_dir)
+                doc = self._shard_document(index, units, source_map)
+                doc.generate_tex(os.path.join(work_dir, name))
+                source_map.resolve(os.path.join(work_dir, f"{name}.tex"))
+                source_maps.append(source_map)
+
+        used = None
+        with ThreadPoolExecutor(
+            max_workers=max_workers or os.cpu_count()
+        ) as pool:
+            # Two passes settle the contents; more run only while a pass
+            # moves a shard boundary (e.g. a longer contents)
+            for pass_number in range(1, _MAX_PASSES + 1):
+                state = self._shard_state(work_dir, names)
+                if pass_number > 2 and state == used:
+                    break
+                used = state
+                self._write_shard_state(work_dir, names, counters, state)
+                self._compile_shard_pass(
+                    work_dir,
+                    names,
+                    source_maps,
+                    pass_number,
+                    fail_fast,
+                    pool,
+                )
+        if self._shard_state(work_dir, names) != used:
+            console.print(
+                f"[yellow]⚠ Shard page numbers did not settle after "
+                f"{_MAX_PASSES} passes; later shards may be misnumbered"
+                f"[/yellow]"
+            )
+
+        pdf_path = f"{output_path}.pdf"
+        with self.timer.span("stitch", category="shard"):
+            self._stitch_pdfs(
+                [os.path.join(work_dir, f"{name}.pdf") for name in names],
+                pdf_path,
+                source_date_epoch=self.source_date_epoch,
+            )
+        return pdf_path
+
+    # ── Stitching ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _page_label_ranges(reader):
+        """Return (first page, style, prefix, start) label ranges."""
+        labels = reader.trailer["/Root"].get("/PageLabels")
+        if labels is None:
+            return []
+        nums = labels.get_object().get("/Nums", [])
+        ranges = []
+        for i in range(0, len(nums) - 1, 2):
+            label = nums[i + 1].get_object()
+            ranges.append(
+                (
+                    int(nums[i]),
+                    label.get("/S"),
+                    label.get("/P"),
+                    int(label.get("/St", 1)),
+                )
+            )
+        return ranges
+
+    @classmethod
+    def _stitch_pdfs(cls, pdf_paths, output_pdf, source_date_epoch=None):
+        """
+        Concatenate shard PDFs, keeping bookmarks, link targets and
+        page labels (roman front matter, arabic body).
+
+        The document information (title, author, dates) is the first
+        shard's. The trailer ID is a checksum of the stitched document
+        rather than random, so identical shards give a byte-identical
+        PDF.
+
+        Args:
+            pdf_paths: Shard PDFs in page order
+            output_pdf: Path of the stitched PDF
+            source_date_epoch: Pin the creation and modification dates
+                to this time, as pdflatex does in a reproducible build
+        """
+        writer = PdfWriter()
+        labels = []
+        for path in pdf_paths:
+            reader = PdfReader(path)
+            offset = len(writer.pages)
+            if offset == 0 and reader.metadata:
+                writer.add_metadata(reader.metadata)
+            writer.append(reader, import_outline=True)
+            end = len(writer.pages) - 1
+            ranges = cls._page_label_ranges(reader)
+            for i, (first, style, prefix, start) in enumerate(ranges):
+                last = (
+                    offset + ranges[i + 1][0] - 1
+                    if i + 1 < len(ranges)
+                    else end
+                )
+                labels.append((offset + first, last, style, prefix, start))
+        for first, last, style, prefix, start in labels:
+            if first <= last:
+                writer.set_page_label(
+                    first, last, style=style, prefix=prefix, start=start
+                )
+        if source_date_epoch is not None:
+            pdf_date = time.strftime(
+                "D:%Y%m%d%H%M%SZ", time.gmtime(source_date_epoch)
+            )
+            writer.add_metadata(
+                {"/CreationDate": pdf_date, "/ModDate": pdf_date}
+            )
+        writer.generate_file_identifiers()
+        with open(output_pdf, "wb") as f:
+            writer.write(f)
+        return output_pdf
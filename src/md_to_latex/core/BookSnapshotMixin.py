@@ -0,0 +1,139 @@
+import json
+import os
+
+from rich.console import Console
+
+from md_to_latex.core.Chapter import Chapter
+from md_to_latex.core.Part import Part
+
+console = Console()
+
+# Bump when the snapshot layout or the loaded model changes
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_CACHE = "model"
+_SNAPSHOT_FILE = "snapshot.json"
+
+
+class BookSnapshotMixin:
+    """
+    Mixin for saving the loaded book model and reopening it from that
+    snapshot while none of the book's files changed.
+    """
+
+    def _snapshot_path(self):
+        return os.path.join(self._cache_dir(_SNAPSHOT_CACHE), _SNAPSHOT_FILE)
+
+    def _model_dict(self):
+        """Return the loaded model as plain data."""
+        return {
+            "metadata": self.metadata,
+            "format": self.format,
+            "parts": [part.to_dict(self.book_dir) for part in self.parts],
+            "chapters": [
+                chapter.to_dict(self.book_dir) for chapter in self.chapters
+            ],
+            "about_author": [self.about_author_title, self.about_author],
+            "about_book": [self.about_book_title, self.about_book],
+        }
+
+    def _restore_model(self, model):
+        """Set the loaded model from _model_dict() data."""
+        self._set_metadata(model["metadata"])
+        self.format = model["format"]
+        self.parts = [
+            Part.from_dict(part, self.book_dir, self.storage)
+            for part in model["parts"]
+        ]
+        self.chapters = [
+            Chapter.from_dict(chapter, self.book_dir, self.storage)
+            for chapter in model["chapters"]
+        ]
+        self.about_author_title, self.about_author = model["about_author"]
+        self.about_book_title, self.about_book = model["about_book"]
+
+    @staticmethod
+    def _snapshot_chapters(model):
+        """Yield the chapter dicts of a model dict in book order."""
+        for part in model["parts"]:
+            yield from part["chapters"]
+        yield from model["chapters"]
+
+    def _load_snapshot(self, signatures):
+        """
+        Restore the model from the snapshot if it was taken of files
+        with exactly these *signatures*.
+
+        The snapshot is a JSON header line followed by the text of every
+        chapter, so a stale snapshot is rejected after reading only the
+        header, and chapter text is decoded once rather than parsed as
+        JSON strings.
+
+        Returns:
+            True when the model was restored
+        """
+        try:
+            with open(self._snapshot_path(), "rb") as f:
+                header = json.loads(f.readline())
+                if (
+                    header.get("version") != SNAPSHOT_VERSION
+                    or header.get("signatures") != signatures
+                ):
+                    return False
+                text = f.read().decode("utf-8")
+        except (OSError, ValueError):
+            return False
+        model = header["model"]
+        start = 0
+        for chapter in self._snapshot_chapters(model):
+            end = start + chapter["content"]
+            chapter["content"] = text[start:end]
+            start = end
+        self._restore_model(model)
+        return True
+
+    def _save_snapshot(self, signatures):
+        """
+        Save the loaded model with the signatures of the files it was
+        loaded from.
+
+        A snapshot that cannot be written only costs the next open a
+        full load, so errors are reported and otherwise ignored.
+        """
+        model = self._model_dict()
+        texts = []
+        for chapter in self._snapshot_chapters(model):
+            texts.append(chapter["content"])
+            chapter["content"] = len(chapter["content"])
+        header = {
+            "version": SNAPSHOT_VERSION,
+            "signatures": signatures,
+            "model": model,
+        }
+        data = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        data += b"\n" + "".join(texts).encode("utf-8")
+        try:
+            os.makedirs(self._cache_dir(_SNAPSHOT_CACHE), exist_ok=True)
+            self._write_atomic(self._snapshot_path(), data)
+        except OSError as e:
+            console.print(
+                f"[yellow]⚠ Warning:[/yellow] Could not save the book "
+                f"snapshot: {e}"
+            )
+
+    def _load_with_snapshot(self):
+        """
+        Load the book, from its snapshot when the stats of its files
+        (see BookStorage.signatures()) are unchanged.
+
+        The signatures are taken before a full load, so a file changed
+        during the load invalidates the snapshot saved after it.
+
+        Returns:
+            True when the model came from the snapshot
+        """
+        signatures = self.storage.signatures()
+        if self._load_snapshot(signatures):
+            return True
+        self._load()
+        self._save_snapshot(signatures)
+        return False
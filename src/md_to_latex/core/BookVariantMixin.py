@@ -0,0 +1,127 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from pylatex import NoEscape
+from rich.console import Console
+
+from md_to_latex.core.LatexCompileError import LatexCompileError
+from md_to_latex.core.LayoutProfile import LayoutProfile
+
+console = Console()
+
+
+class BookVariantMixin:
+    """Mixin for compiling one book in several page layouts at once."""
+
+    def _variant_document(self, layout, body):
+        """Wrap already rendered document content in *layout*'s preamble."""
+        doc = self._new_document(layout=layout)
+        doc.append(NoEscape(body))
+        return doc
+
+    def _compile_variant(self, variant, source_map, fail_fast):
+        """Compile one variant; errors are recorded on the variant dict."""
+        tex_dir, tex_filename = os.path.split(variant["tex_path"])
+        try:
+            with self.timer.span(variant["layout"], category="variant"):
+                self._compile_pdf(
+                    tex_dir,
+                    tex_filename,
+                    fail_fast=fail_fast,
+                    source_map=source_map,
+                )
+        except LatexCompileError as e:
+            variant["errors"] = e.errors
+            return
+        self._cleanup_aux_files(tex_dir, os.path.splitext(tex_filename)[0])
+        variant["pdf_path"] = f"{os.path.splitext(variant['tex_path'])[0]}.pdf"
+
+    def _generate_variants(
+        self,
+        doc,
+        output_path,
+        layouts,
+        fail_fast=False,
+        source_map=None,
+        max_workers=None,
+    ):
+        """
+        Compile the rendered book in every layout, concurrently.
+
+        The body LaTeX of *doc* is rendered once and wrapped in each
+        layout's preamble; only pdflatex runs per layout.
+
+        Args:
+            doc: Document from _build_document()
+            output_path: Output path without extension; each variant
+                adds its layout's suffix
+            layouts: Layout names, dicts or LayoutProfile objects
+            fail_fast: Abort each pdflatex run on its first error
+            source_map: SourceMap filled while building *doc*; each
+                variant saves its own <name>.texmap.json
+            max_workers: Maximum concurrent pdflatex processes
+                (default: CPU count)
+
+        Returns:
+            List of dicts with "layout", "tex_path", "pdf_path" (None
+            when it failed) and "errors", in the order requested
+        """
+        layouts = [LayoutProfile.get(layout) for layout in layouts]
+        suffixes = [layout.suffix for layout in layouts]
+        if len(set(suffixes)) != len(suffixes):
+            raise ValueError("Each layout needs its own file name suffix")
+
+        variants = []
+        source_maps = []
+        with self._stage("generate_tex"):
+            body = doc.dumps_content()
+            for layout in layouts:
+                variant_path = output_path + layout.suffix
+                self._variant_document(layout, body).generate_tex(
+                    variant_path
+                )
+                tex_path = f"{variant_path}.tex"
+                variant_map = None
+                if source_map is not None:
+                    variant_map = source_map.resolved(tex_path)
+                    variant_map.save(f"{variant_path}.texmap.json")
+                source_maps.append(variant_map)
+                variants.append(
+                    {
+                        "layout": layout.name,
+                        "tex_path": tex_path,
+                        "pdf_path": None,
+                        "errors": [],
+                    }
+                )
+
+        try:
+            with self._stage("compile_pdf", child=True):
+                with ThreadPoolExecutor(
+                    max_workers=max_workers or os.cpu_count()
+                ) as pool:
+                    list(
+                        pool.map(
+                            self._compile_variant,
+                            variants,
+                            source_maps,
+                            [fail_fast] * len(variants),
+                        )
+                    )
+        except Exception as e:
+            console.print(f"[red]✗ Error generating PDF:[/red] {e}")
+        for variant in variants:
+            variant["tex_path"], variant["pdf_path"] = self._publish_latex(
+                variant["tex_path"], variant["pdf_path"]
+            )
+            if variant["pdf_path"]:
+                console.print(
+                    f"[green]✓ {variant['layout']} PDF generated:[/green] "
+                    f"[bold]{variant['pdf_path']}[/bold]"
+                )
+            else:
+                console.print(
+                    f"[yellow]→ {variant['layout']} LaTeX file saved:"
+                    f"[/yellow] [bold]{variant['tex_path']}[/bold]"
+                )
+        return variants
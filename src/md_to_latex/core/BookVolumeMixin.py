@@ -0,0 +1,201 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from pylatex import NoEscape
+from rich.console import Console
+
+from md_to_latex.core.LatexCompileError import LatexCompileError
+from md_to_latex.core.SourceMap import SourceMap
+
+console = Console()
+
+# Words on a double-spaced 12pt manuscript page, for page budgets
+WORDS_PER_PAGE = 250
+
+
+class BookVolumeMixin:
+    """Mixin for splitting very large books into separate volumes."""
+
+    def _volume_units(self):
+        """Return the units volumes split at: parts, or flat chapters."""
+        if self.format == 2:
+            return [(None, [chapter]) for chapter in self.chapters]
+        return [(part, part.chapters) for part in self.parts]
+
+    def _plan_volumes(self, max_words=None, max_pages=None):
+        """
+        Group whole parts into volumes under a word or page budget.
+
+        Parts are never split, so a part larger than the budget gets a
+        volume of its own. Flat books are split between chapters.
+
+        Args:
+            max_words: Maximum words per volume
+            max_pages: Maximum pages per volume, estimated at
+                WORDS_PER_PAGE words per page
+
+        Returns:
+            List of dicts with "volume" (1-based number), "parts",
+            "chapters", "words" and the "first_chapter" and "first_part"
+            counters the volume continues from
+        """
+        budgets = [b for b in (max_words, max_pages) if b]
+        if not budgets:
+            raise ValueError("Pass a word or page budget for volumes")
+        if any(b <= 0 for b in budgets):
+            raise ValueError("Volume budgets must be positive")
+        budget = min(
+            b
+            for b in (max_words, max_pages and max_pages * WORDS_PER_PAGE)
+            if b
+        )
+
+        volumes = []
+        chapters_before = parts_before = 0
+        for part, chapters in self._volume_units():
+            words = sum(c.word_count for c in chapters)
+            current = volumes[-1] if volumes else None
+            if current is None or (
+                current["chapters"] and current["words"] + words > budget
+            ):
+                current = {
+                    "volume": len(volumes) + 1,
+                    "parts": [],
+                    "chapters": [],
+                    "words": 0,
+                    "first_chapter": chapters_before,
+                    "first_part": parts_before,
+                }
+                volumes.append(current)
+            if part is not None:
+                current["parts"].append(part)
+                parts_before += 1
+            current["chapters"] += chapters
+            current["words"] += words
+            chapters_before += len(chapters)
+        return volumes
+
+    def _volume_document(self, volume, source_map=None):
+        """
+        Build the document for one volume: its own title page and
+        contents, then its parts, with chapter and part numbers
+        continuing from the volumes before it.
+        """
+        doc = self._new_document(volume=volume)
+        # About pages belong to the book, not to every volume
+        self._add_front_matter(doc, about=volume["volume"] == 1)
+        doc.append(NoEscape(r"\mainmatter"))
+        doc.append(
+            NoEscape(
+                r"\setcounter{chapter}{" + str(volume["first_chapter"]) + "}"
+            )
+        )
+        doc.append(
+            NoEscape(r"\setcounter{part}{" + str(volume["first_part"]) + "}")
+        )
+        if volume["parts"]:
+            for part in volume["parts"]:
+                with self.timer.span(part.title, category="part"):
+                    part.to_latex(
+                        doc, timer=self.timer, source_map=source_map
+                    )
+        else:
+            for chapter in volume["chapters"]:
+                with self.timer.span(chapter.title, category="chapter"):
+                    chapter.to_latex(doc, source_map=source_map)
+        return doc
+
+    def _compile_volume(self, volume, source_map, fail_fast):
+        """Compile one volume; errors are recorded on the volume dict."""
+        tex_dir, tex_filename = os.path.split(volume["tex_path"])
+        try:
+            with self.timer.span(
+                f"volume {volume['volume']}", category="volume"
+            ):
+                self._compile_pdf(
+                    tex_dir,
+                    tex_filename,
+                    fail_fast=fail_fast,
+                    source_map=source_map,
+                )
+        except LatexCompileError as e:
+            volume["errors"] = e.errors
+            return
+        self._cleanup_aux_files(tex_dir, os.path.splitext(tex_filename)[0])
+        volume["pdf_path"] = f"{os.path.splitext(volume['tex_path'])[0]}.pdf"
+
+    def _generate_volumes(
+        self,
+        output_path,
+        volumes,
+        fail_fast=False,
+        source_map=True,
+        max_workers=None,
+    ):
+        """
+        Generate and compile every volume, in parallel.
+
+        Args:
+            output_path: Output path without extension; volumes are
+                written as <output_path>-vol-<n>
+            volumes: Plan from _plan_volumes()
+            fail_fast: Abort each pdflatex run on its first error
+            source_map: Write a .texmap.json per volume
+            max_workers: Maximum concurrent pdflatex processes
+                (default: CPU count)
+
+        Returns:
+            The volume dicts, each with "tex_path", "pdf_path" (None when
+            it failed) and "errors"
+        """
+        self.word_count = self._count_words()
+        source_maps = [
+            SourceMap(self.book_dir) if source_map else None
+            for _ in volumes
+        ]
+        with self._stage("convert"):
+            docs = [
+                self._volume_document(volume, source_map=volume_map)
+                for volume, volume_map in zip(volumes, source_maps)
+            ]
+        with self._stage("generate_tex"):
+            for volume, volume_map, doc in zip(volumes, source_maps, docs):
+                volume_path = f"{output_path}-vol-{volume['volume']}"
+                doc.generate_tex(volume_path)
+                volume.update(
+                    tex_path=f"{volume_path}.tex", pdf_path=None, errors=[]
+                )
+                if volume_map is not None:
+                    volume_map.resolve(volume["tex_path"])
+                    volume_map.save(f"{volume_path}.texmap.json")
+
+        try:
+            with self._stage("compile_pdf", child=True):
+                with ThreadPoolExecutor(
+                    max_workers=max_workers or os.cpu_count()
+                ) as pool:
+                    list(
+                        pool.map(
+                            self._compile_volume,
+                            volumes,
+                            source_maps,
+                            [fail_fast] * len(volumes),
+                        )
+                    )
+        except Exception as e:
+            console.print(f"[red]✗ Error generating PDF:[/red] {e}")
+        for volume in volumes:
+            volume["tex_path"], volume["pdf_path"] = self._publish_latex(
+                volume["tex_path"], volume["pdf_path"]
+            )
+            if volume["pdf_path"]:
+                console.print(
+                    f"[green]✓ Volume {volume['volume']} PDF generated:"
+                    f"[/green] [bold]{volume['pdf_path']}[/bold]"
+                )
+            else:
+                console.print(
+                    f"[yellow]→ Volume {volume['volume']} LaTeX file saved:"
+                    f"[/yellow] [bold]{volume['tex_path']}[/bold]"
+                )
+        return volumes
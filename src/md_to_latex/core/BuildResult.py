@@ -0,0 +1,126 @@
+class BuildResult:
+    """Structured outcome of a Book build."""
+
+    def __init__(
+        self,
+        output_path,
+        tex_path=None,
+        pdf_path=None,
+        docx_path=None,
+        timer=None,
+        trace_path=None,
+        memory=None,
+        volumes=None,
+        variants=None,
+        artifacts=None,
+        manifest_path=None,
+        shared=False,
+    ):
+        """
+        Initialize a BuildResult.
+
+        Args:
+            output_path: Primary artifact (the PDF, or the .tex when PDF
+                compilation failed)
+            tex_path: Path to the generated .tex file
+            pdf_path: Path to the generated PDF, or None if it failed
+            docx_path: Path to the generated DOCX file
+            timer: BuildTimer holding the spans recorded during the build
+            trace_path: Path of the Chrome trace file, if one was written
+            memory: Per-stage memory records from a MemoryProfiler
+            volumes: Volume dicts when the book was split into volumes;
+                tex_path and pdf_path then refer to volume 1
+            variants: Layout variant dicts when several layouts were
+                built; tex_path and pdf_path then refer to the first
+            artifacts: Published files by path relative to the output
+                directory, each with "sha256", "size" and "changed"
+                (False when the previous file was identical)
+            manifest_path: Path to the artifact digest manifest
+            shared: True when this is the result of an identical build
+                in another process, which this one waited for
+        """
+        self.output_path = output_path
+        self.tex_path = tex_path
+        self.pdf_path = pdf_path
+        self.docx_path = docx_path
+        self.timer = timer
+        self.trace_path = trace_path
+        self.memory = memory or []
+        self.volumes = volumes or []
+        self.variants = variants or []
+        self.artifacts = artifacts or {}
+        self.manifest_path = manifest_path
+        self.shared = shared
+
+    @classmethod
+    def from_dict(cls, data, shared=False):
+        """Rebuild a BuildResult (without timing spans) from to_dict()."""
+        return cls(
+            data["output_path"],
+            tex_path=data["tex_path"],
+            pdf_path=data["pdf_path"],
+            docx_path=data["docx_path"],
+            trace_path=data["trace_path"],
+            memory=data["memory"],
+            volumes=data["volumes"],
+            variants=data["variants"],
+            artifacts=data["artifacts"],
+            manifest_path=data["manifest_path"],
+            shared=shared,
+        )
+
+    @property
+    def spans(self):
+        """All timing spans recorded during the build."""
+        return self.timer.spans if self.timer else []
+
+    def stage_durations(self):
+        """Return seconds spent in each top-level build stage."""
+        return self.timer.durations("stage") if self.timer else {}
+
+    def write_trace(self, path):
+        """Write the build timeline as a Chrome trace-event JSON file."""
+        self.trace_path = self.timer.write_chrome_trace(path)
+        return self.trace_path
+
+    def to_dict(self):
+        """Return a JSON-serializable summary of the build."""
+        return {
+            "output_path": self.output_path,
+            "tex_path": self.tex_path,
+            "pdf_path": self.pdf_path,
+            "docx_path": self.docx_path,
+            "trace_path": self.trace_path,
+            "stages": self.stage_durations(),
+            "memory": self.memory,
+            "volumes": [self._volume_dict(volume) for volume in self.volumes],
+            "variants": [
+                dict(
+                    variant,
+                    errors=[str(error) for error in variant["errors"]],
+                )
+                for variant in self.variants
+            ],
+            "artifacts": self.artifacts,
+            "manifest_path": self.manifest_path,
+            "shared": self.shared,
+        }
+
+    @staticmethod
+    def _volume_dict(volume):
+        """Serialize a volume dict; from_dict() volumes already are."""
+        return {
+            "volume": volume["volume"],
+            "parts": [
+                getattr(part, "title", part) for part in volume["parts"]
+            ],
+            "chapters": (
+                volume["chapters"]
+                if isinstance(volume["chapters"], int)
+                else len(volume["chapters"])
+            ),
+            "words": volume["words"],
+            "tex_path": volume["tex_path"],
+            "pdf_path": volume["pdf_path"],
+            "errors": [str(error) for error in volume["errors"]],
+        }
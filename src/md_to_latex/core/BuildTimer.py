@@ -0,0 +1,147 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+_NULL_SPAN = nullcontext()
+
+
+class BuildTimer:
+    """Collects nested timing spans for a build, per thread."""
+
+    def __init__(self, enabled=False):
+        """
+        Initialize a BuildTimer.
+
+        Args:
+            enabled: When False, span() returns a shared no-op context
+                manager and nothing is recorded.
+        """
+        self.enabled = enabled
+        self.spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def span(self, name, category="stage", **args):
+        """
+        Time the enclosed block as a span.
+
+        Spans opened inside another span on the same thread are recorded
+        as its children (depth + 1).
+
+        Args:
+            name: Span name shown in the timeline
+            category: Span category (e.g. "stage", "chapter", "pdflatex")
+            **args: Extra key/value pairs attached to the span
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._record(name, category, args)
+
+    @contextmanager
+    def _record(self, name, category, args):
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._local.depth = depth
+            self.add_span(name, start, end, category, depth=depth, **args)
+
+    def add_span(self, name, start, end, category="stage", depth=0, **args):
+        """
+        Record a span measured elsewhere with time.perf_counter().
+
+        Args:
+            name: Span name
+            start: Start time in perf_counter seconds
+            end: End time in perf_counter seconds
+            category: Span category
+            depth: Nesting depth of the span on its thread
+            **args: Extra key/value pairs attached to the span
+        """
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        span = {
+            "name": name,
+            "category": category,
+            "start": start,
+            "end": end,
+            "depth": depth,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "thread": thread.name,
+            "args": args,
+        }
+        with self._lock:
+            self.spans.append(span)
+
+    def merge(self, spans):
+        """Add spans recorded by a worker (thread or process) timer."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.spans.extend(spans)
+
+    def durations(self, category="stage"):
+        """
+        Return total seconds per span name for one category.
+
+        Args:
+            category: Span category to sum, or None for all categories
+        """
+        totals = {}
+        for span in self.spans:
+            if category is not None and span["category"] != category:
+                continue
+            elapsed = span["end"] - span["start"]
+            totals[span["name"]] = totals.get(span["name"], 0.0) + elapsed
+        return totals
+
+    def to_chrome_trace(self):
+        """
+        Convert spans to the Chrome trace-event format.
+
+        The result opens in about:tracing and Perfetto; each thread or
+        worker process becomes its own track.
+        """
+        if not self.spans:
+            return {"traceEvents": [], "displayTimeUnit": "ms"}
+        origin = min(span["start"] for span in self.spans)
+        events = []
+        threads = {}
+        for span in sorted(self.spans, key=lambda s: (s["start"], s["depth"])):
+            threads[(span["pid"], span["tid"])] = span["thread"]
+            events.append(
+                {
+                    "name": span["name"],
+                    "cat": span["category"],
+                    "ph": "X",
+                    "ts": (span["start"] - origin) * 1e6,
+                    "dur": (span["end"] - span["start"]) * 1e6,
+                    "pid": span["pid"],
+                    "tid": span["tid"],
+                    "args": span["args"],
+                }
+            )
+        for (pid, tid), thread_name in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        """Write the spans as a Chrome trace-event JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
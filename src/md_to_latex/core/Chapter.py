@@ -1,26 +1,60 @@
+import bisect
 import os
 import re
+import sys
 
 from pylatex import NoEscape
 
+from md_to_latex.core.SourceMap import SourceMap
+from md_to_latex.storage.DirectoryStorage import DirectoryStorage
+
+_FIRST_HEADING = re.compile(r"^#[ \t]+.+\n?", re.MULTILINE)
+
 
 class Chapter:
-    """Represents a chapter in the book."""
+    """
+    Represents a chapter in the book.
+
+    Chapters use __slots__ and keep their segment file names relative to
+    one directory, so a catalog holding thousands of books pays mostly
+    for the text; evict() drops the text too, and content re-reads it
+    from the chapter's files on the next access. The LaTeX is converted
+    once per content and kept until the content changes, e.g. through
+    update_segment().
+    """
+
+    __slots__ = (
+        "chapter_dir",
+        "storage",
+        "title",
+        "_source_dir",
+        "_md_names",
+        "_segment_lengths",
+        "_content",
+        "_word_count",
+        "_latex",
+        "_edited",
+    )
 
-    def __init__(self, chapter_dir):
+    def __init__(self, chapter_dir, storage=None):
         """
         Initialize a Chapter from a directory containing NNN.md files.
 
         Args:
             chapter_dir: Path to the chapter directory (e.g., chapter-01)
+            storage: BookStorage holding the directory (default: the
+                file system)
         """
         self.chapter_dir = chapter_dir
-        self._md_files = self._sorted_md_files()
+        self.storage = storage or DirectoryStorage(chapter_dir)
+        self._source_dir = chapter_dir
+        self._md_names = self._sorted_md_names()
         self.title = self._extract_title()
-        self.content = self._read_content()
+        self._edited = False
+        self._set_segments(self._read_segments())
 
     @classmethod
-    def from_file(cls, file_path):
+    def from_file(cls, file_path, storage=None):
         """
         Create a Chapter from a single markdown file (flat format).
 
@@ -28,17 +62,171 @@ class Chapter:
 
         Args:
             file_path: Path to the .md file (e.g., chapter-01-getting-started.md)
+            storage: BookStorage holding the file (default: the file
+                system)
         """
         instance = cls.__new__(cls)
         instance.chapter_dir = None
-        instance._md_files = [file_path]
-        with open(file_path, "r", encoding="utf-8") as f:
-            instance.content = f.read()
-        instance.title = cls._extract_title_from_content(
-            instance.content
-        ) or cls._extract_title_from_filename(os.path.basename(file_path))
+        instance._source_dir, name = os.path.split(file_path)
+        instance.storage = storage or DirectoryStorage(instance._source_dir)
+        instance._md_names = (sys.intern(name),)
+        instance._edited = False
+        instance._set_segments(instance._read_segments())
+        instance._retitle()
         return instance
 
+    def to_dict(self, base_dir):
+        """
+        Return the loaded chapter as plain data, with paths relative to
+        *base_dir* (see from_dict).
+        """
+        return {
+            "chapter_dir": (
+                os.path.relpath(self.chapter_dir, base_dir)
+                if self.chapter_dir
+                else None
+            ),
+            "md_files": self._relative_md_files(base_dir, os.sep),
+            "title": self.title,
+            "content": self.content,
+            "segment_lengths": list(self._segment_lengths),
+        }
+
+    @classmethod
+    def from_dict(cls, data, base_dir, storage=None):
+        """
+        Rebuild a Chapter from to_dict() without reading its files.
+
+        Args:
+            data: Dict from to_dict()
+            base_dir: Directory the paths in *data* are relative to
+            storage: BookStorage holding the files (default: the file
+                system)
+        """
+        instance = cls.__new__(cls)
+        instance.chapter_dir = (
+            os.path.join(base_dir, data["chapter_dir"])
+            if data["chapter_dir"]
+            else None
+        )
+        instance.storage = storage or DirectoryStorage(base_dir)
+        if instance.chapter_dir:
+            instance._source_dir = instance.chapter_dir
+        elif data["md_files"]:
+            instance._source_dir = os.path.join(
+                base_dir, os.path.dirname(data["md_files"][0])
+            )
+        else:
+            instance._source_dir = base_dir
+        instance._md_names = tuple(
+            sys.intern(os.path.basename(path)) for path in data["md_files"]
+        )
+        instance.title = data["title"]
+        instance._content = data["content"]
+        instance._segment_lengths = tuple(data["segment_lengths"])
+        instance._word_count = None
+        instance._latex = None
+        instance._edited = False
+        return instance
+
+    @property
+    def _md_files(self):
+        """Paths of the chapter's NNN.md files (or flat file), in order."""
+        return [
+            os.path.join(self._source_dir, name) for name in self._md_names
+        ]
+
+    def _relative_md_files(self, base_dir, sep="/"):
+        """
+        Return the _md_files paths relative to *base_dir*, joined with
+        *sep*; one relpath() per chapter rather than per file.
+        """
+        source_dir = os.path.relpath(self._source_dir, base_dir)
+        if source_dir == ".":
+            return list(self._md_names)
+        source_dir = source_dir.replace(os.sep, sep)
+        return [f"{source_dir}{sep}{name}" for name in self._md_names]
+
+    @property
+    def content(self):
+        """The chapter's markdown, re-read from its files after evict()."""
+        if self._content is None:
+            self._set_segments(self._read_segments())
+        return self._content
+
+    @property
+    def word_count(self):
+        """Words in the content, counted once and kept across evict()."""
+        if self._word_count is None:
+            self._word_count = len(self.content.split())
+        return self._word_count
+
+    def evict(self):
+        """
+        Drop the loaded text and LaTeX; content re-reads the text from
+        the chapter's files when it is next needed. Text changed by
+        update_segment() exists only in memory and is kept.
+        """
+        if not self._edited:
+            self._content = None
+            self._latex = None
+
+    def reload(self):
+        """
+        Re-read the chapter's files after they were edited in place,
+        replacing any update_segment() changes; a flat chapter also takes
+        its title from the new first heading.
+        """
+        self._edited = False
+        self._set_segments(self._read_segments())
+        self._retitle()
+
+    def update_segment(self, index, text):
+        """
+        Replace the text of one NNN.md segment in memory, without
+        writing the file.
+
+        Args:
+            index: 0-based position of the segment in _md_files
+            text: New markdown of the segment
+        """
+        segments = self._content_segments()
+        segments[index] = (segments[index][0], text)
+        self._edited = True
+        self._set_segments(segments)
+        self._retitle()
+
+    def _retitle(self):
+        """Take a flat chapter's title from its first heading."""
+        if self.chapter_dir is None:
+            self.title = self._extract_title_from_content(
+                self._content
+            ) or self._extract_title_from_filename(self._md_names[0])
+
+    def _resident_bytes(self):
+        """Estimate the memory held by this chapter and its text."""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.title)
+            + sys.getsizeof(self._md_names)
+            + sys.getsizeof(self._segment_lengths)
+            + (0 if self._content is None else sys.getsizeof(self._content))
+            + sum(
+                sys.getsizeof(text) + sys.getsizeof(latex)
+                for _, text, latex, _ in self._latex or ()
+            )
+        )
+
+    def _set_segments(self, segments):
+        """
+        Set the content from (file path, text) pairs, dropping the word
+        count and LaTeX of the previous content.
+        """
+        self._content = "".join(text for _, text in segments)
+        self._segment_lengths = tuple(len(text) for _, text in segments)
+        self._word_count = None
+        self._latex = None
+
     @staticmethod
     def _extract_title_from_content(content):
         """Extract the title from the first # heading in the content."""
@@ -62,17 +250,18 @@ class Chapter:
             return f"Chapter {int(match.group(1))}"
         return name.replace("-", " ").title()
 
-    def _sorted_md_files(self):
-        """Return sorted list of NNN.md file paths in the chapter dir."""
-        if not os.path.isdir(self.chapter_dir):
-            return []
+    def _sorted_md_names(self):
+        """Return the sorted NNN.md file names in the chapter dir."""
+        if not self.storage.isdir(self.chapter_dir):
+            return ()
         files = [
             f
-            for f in os.listdir(self.chapter_dir)
+            for f in self.storage.listdir(self.chapter_dir)
             if re.fullmatch(r"\d+\.md", f)
         ]
         files.sort(key=lambda f: int(re.match(r"(\d+)\.md", f).group(1)))
-        return [os.path.join(self.chapter_dir, f) for f in files]
+        # Every chapter has a 001.md; one shared string serves them all
+        return tuple(sys.intern(f) for f in files)
 
     def _extract_title(self):
         """Extract chapter title from the kebab-case directory name."""
@@ -88,18 +277,31 @@ class Chapter:
             return f"Chapter {int(match.group(1))}"
         return dirname.title()
 
+    def _read_segments(self):
+        """Return (file path, text) pairs for each NNN.md file in order."""
+        segments = []
+        for file_path in self._md_files:
+            segments.append((file_path, self.storage.read_text(file_path)))
+        return segments
+
     def _read_content(self):
         """Read and concatenate content from all NNN.md files."""
-        parts = []
-        for file_path in self._md_files:
-            with open(file_path, "r", encoding="utf-8") as f:
-                parts.append(f.read())
-        return "".join(parts)
+        return "".join(text for _, text in self._read_segments())
+
+    def _content_segments(self):
+        """Return (file path, text) pairs sliced from the loaded content."""
+        content = self.content
+        segments = []
+        start = 0
+        for file_path, length in zip(self._md_files, self._segment_lengths):
+            segments.append((file_path, content[start : start + length]))
+            start += length
+        return segments
 
     @staticmethod
     def _strip_first_heading(text):
         """Remove the first top-level # heading line from the content."""
-        return re.sub(r"^#[ \t]+.+\n?", "", text, count=1, flags=re.MULTILINE)
+        return _FIRST_HEADING.sub("", text, count=1)
 
     def _convert_headings(self, text):
         """Convert markdown headings to LaTeX sections."""
@@ -187,17 +389,131 @@ class Chapter:
 
         return text
 
-    def to_latex(self, doc):
+    @staticmethod
+    def _split_blocks(texts, latex):
+        """
+        Cut the LaTeX converted from "".join(texts) into one piece per
+        text.
+
+        The converters keep blocks (see SourceMap.block_map()) and the
+        lines within them, so a text that starts on a new line is cut at
+        the matching LaTeX line. A cut between blocks is made before the
+        blank lines that separate them and a cut within a block keeps
+        the line end, so the pieces typeset as the whole LaTeX does when
+        they are joined with "%" line ends. Markup that runs across a
+        cut leaves the pieces unbalanced on their own.
+
+        Returns:
+            List of (markdown, LaTeX) pairs; the markdown is the text
+            with a first line shared with the previous text blanked, as
+            that line goes to the previous piece
+        """
+        joined = "".join(texts)
+        markdown_lines = joined.split("\n")
+        starts = SourceMap._blocks(joined)
+        lines = latex.split("\n")
+        output_blocks = SourceMap._blocks(latex)
+        cuts = [(0, False)]
+        shared = [False]
+        offset = len(texts[0]) if texts else 0
+        for text in texts[1:]:
+            first = joined.count("\n", 0, offset)
+            shared.append(offset > 0 and joined[offset - 1] != "\n")
+            first += shared[-1]
+            block = bisect.bisect_right(starts, first) - 1
+            within = bool(
+                first < len(markdown_lines)
+                and markdown_lines[first].strip()
+                and first not in starts
+                and block < len(output_blocks)
+            )
+            if within:
+                cut = output_blocks[block] + first - starts[block]
+            else:
+                block = bisect.bisect_left(starts, first)
+                cut = (
+                    output_blocks[block]
+                    if block < len(output_blocks)
+                    else len(lines)
+                )
+                while cut > cuts[-1][0] and not lines[cut - 1].strip():
+                    cut -= 1
+            cuts.append((min(max(cut, cuts[-1][0]), len(lines)), within))
+            offset += len(text)
+        cuts.append((len(lines), False))
+        pieces = []
+        for index, text in enumerate(texts):
+            (start, _), (end, within) = cuts[index], cuts[index + 1]
+            piece = "\n".join(lines[start:end])
+            if within:
+                piece += "\n"
+            markdown = text
+            if shared[index]:
+                markdown = text[text.find("\n") :] if "\n" in text else ""
+            pieces.append((markdown, piece))
+        return pieces
+
+    def _latex_segments(self):
+        """
+        Convert the chapter to LaTeX, split into its NNN.md segments.
+
+        The segments are converted as one text, so bold, italic and
+        quotes that run across a segment boundary render as they would
+        within one file; the LaTeX is then cut between blocks (see
+        _split_blocks()). The first # heading of the chapter (its title)
+        is stripped from the segment that contains it, as
+        _strip_first_heading() does for the whole content.
+
+        The result is kept until the content changes, so rebuilding a
+        book converts only the chapters that changed.
+
+        Returns:
+            Tuple of (file path, markdown of the segment's blocks, LaTeX,
+            removed line) tuples; removed line is the 0-based line of the
+            stripped heading within that segment, or None
+        """
+        if self._latex is not None:
+            return self._latex
+        segments = []
+        stripped = False
+        for file_path, text in self._content_segments():
+            removed_line = None
+            match = None if stripped else _FIRST_HEADING.search(text)
+            if match:
+                removed_line = text.count("\n", 0, match.start())
+                text = text[: match.start()] + text[match.end() :]
+                stripped = True
+            segments.append((file_path, text, removed_line))
+        texts = [text for _, text, _ in segments]
+        latex = self._parse_markdown_to_latex("".join(texts))
+        self._latex = tuple(
+            (file_path, markdown, piece, removed_line)
+            for (file_path, _, removed_line), (markdown, piece) in zip(
+                segments, self._split_blocks(texts, latex)
+            )
+        )
+        return self._latex
+
+    def to_latex(self, doc, source_map=None):
         """
         Add this chapter to the LaTeX document.
 
         Args:
             doc: PyLaTeX Document object
+            source_map: Optional SourceMap; each segment is then preceded
+                by a marker comment so its .tex lines can be traced back
+                to the NNN.md file
         """
         doc.append(NoEscape(r"\chapter{" + self.title + "}"))
-        content = self._strip_first_heading(self.content)
-        latex_content = self._parse_markdown_to_latex(content)
-        doc.append(NoEscape(latex_content))
+        for file_path, text, latex, removed_line in self._latex_segments():
+            if source_map is not None:
+                marker = source_map.register(
+                    file_path,
+                    SourceMap.block_map(text, latex, removed_line),
+                    latex.count("\n") + 1,
+                )
+                latex = f"{marker}\n{latex}"
+            doc.append(NoEscape(latex))
 
         # Add page break after chapter
         doc.append(NoEscape(r"\newpage"))
@@ -0,0 +1,19 @@
+class LatexCompileError(RuntimeError):
+    """Raised when pdflatex fails; carries the parsed errors."""
+
+    def __init__(self, returncode, errors, tail=None):
+        """
+        Initialize a LatexCompileError.
+
+        Args:
+            returncode: pdflatex exit status (negative if it was killed)
+            errors: LatexError objects parsed from the output
+            tail: Last lines of pdflatex output, for context
+        """
+        self.returncode = returncode
+        self.errors = list(errors)
+        self.tail = list(tail or [])
+        msg = f"pdflatex failed with return code {returncode}"
+        if self.errors:
+            msg += f": {self.errors[0]}"
+        super().__init__(msg)
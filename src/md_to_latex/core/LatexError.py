@@ -0,0 +1,46 @@
+class LatexError:
+    """One error reported by pdflatex, located in a source file."""
+
+    def __init__(self, message, file=None, line=None, context=None):
+        """
+        Initialize a LatexError.
+
+        Args:
+            message: Error message without the leading "!"
+            file: TeX file the error was reported in, if known
+            line: Line number in *file*, if known
+            context: Offending input shown by TeX after "l.<line>"
+        """
+        self.message = message
+        self.file = file
+        self.line = line
+        self.context = context
+        # Originating markdown location, filled in from the SourceMap
+        self.source_file = None
+        self.source_line = None
+
+    @property
+    def location(self):
+        """Return "file:line", or whichever part is known."""
+        if self.file and self.line:
+            return f"{self.file}:{self.line}"
+        if self.line:
+            return f"line {self.line}"
+        return self.file or "unknown location"
+
+    def to_dict(self):
+        """Return a JSON-serializable representation."""
+        return {
+            "message": self.message,
+            "file": self.file,
+            "line": self.line,
+            "context": self.context,
+            "source_file": self.source_file,
+            "source_line": self.source_line,
+        }
+
+    def __str__(self):
+        text = f"{self.location}: {self.message}"
+        if self.source_file:
+            text += f" (from {self.source_file}:{self.source_line})"
+        return text
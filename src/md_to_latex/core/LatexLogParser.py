@@ -0,0 +1,93 @@
+import re
+from collections import deque
+
+from md_to_latex.core.LatexError import LatexError
+
+# "./book.tex:123: Undefined control sequence." (pdflatex -file-line-error)
+_FILE_LINE_ERROR = re.compile(
+    r"^(?P<file>[^:\s()][^:()]*\.[a-z]{2,4}):(?P<line>\d+): (?P<message>.+)$"
+)
+# "! Undefined control sequence." (classic format)
+_BANG_ERROR = re.compile(r"^! (?P<message>.+)$")
+# "l.123 \foo" — the offending input line
+_LINE_CONTEXT = re.compile(r"^l\.(?P<line>\d+)(?: (?P<context>.*))?$")
+# Follow-up messages that repeat an error rather than report a new one
+_FOLLOW_UP = ("==> Fatal error occurred", "Emergency stop")
+
+
+class LatexLogParser:
+    """Incrementally extracts errors from pdflatex terminal output."""
+
+    def __init__(self, main_file=None, tail_lines=40):
+        """
+        Initialize a LatexLogParser.
+
+        Args:
+            main_file: Name of the .tex file being compiled
+            tail_lines: Number of recent output lines kept for context
+        """
+        self.main_file = main_file
+        self.errors = []
+        self.tail = deque(maxlen=tail_lines)
+        self._pending = None
+
+    def _complete(self):
+        error, self._pending = self._pending, None
+        if error is not None:
+            self.errors.append(error)
+        return error
+
+    def feed(self, line):
+        """
+        Consume one line of output.
+
+        Returns:
+            The LatexError completed by this line, or None
+        """
+        line = line.rstrip("\r\n")
+        self.tail.append(line)
+
+        match = _LINE_CONTEXT.match(line)
+        if match and self._pending is not None:
+            self._pending.line = self._pending.line or int(match["line"])
+            self._pending.context = (match["context"] or "").strip()
+            return self._complete()
+
+        match = _FILE_LINE_ERROR.match(line)
+        if match:
+            completed = self._complete()
+            self._pending = LatexError(
+                match["message"].strip(),
+                file=match["file"],
+                line=int(match["line"]),
+            )
+            return completed
+
+        match = _BANG_ERROR.match(line)
+        if match:
+            message = match["message"].strip()
+            if any(message.startswith(f) for f in _FOLLOW_UP):
+                return None
+            completed = self._complete()
+            self._pending = LatexError(message)
+            return completed
+
+        return None
+
+    def close(self):
+        """
+        Finish parsing at end of output.
+
+        Returns:
+            The error still waiting for its "l.<line>" context, or None
+        """
+        return self._complete()
+
+    @classmethod
+    def parse(cls, text, main_file=None):
+        """Parse complete pdflatex output and return all errors."""
+        parser = cls(main_file)
+        for line in text.splitlines():
+            parser.feed(line)
+        parser.close()
+        return parser.errors
@@ -0,0 +1,98 @@
+class LayoutProfile:
+    """Paper size, margins and spacing of one output variant."""
+
+    def __init__(
+        self,
+        name,
+        paper="a4paper",
+        font_size="12pt",
+        twoside=True,
+        geometry=("margin=1in", "a4paper", "headheight=15pt"),
+        spacing="doublespacing",
+        suffix="",
+    ):
+        """
+        Initialize a LayoutProfile.
+
+        Args:
+            name: Layout name, as passed to Book.build(layouts=[...])
+            paper: Standard paper class option, or None when geometry
+                sets the paper size
+            font_size: Base font size class option ("10pt" to "12pt")
+            twoside: Lay out facing pages with alternating headers
+            geometry: Options for the geometry package
+            spacing: setspace command ("singlespacing",
+                "onehalfspacing" or "doublespacing")
+            suffix: Appended to the output file name of this variant
+        """
+        self.name = name
+        self.paper = paper
+        self.font_size = font_size
+        self.twoside = twoside
+        self.geometry = list(geometry)
+        self.spacing = spacing
+        self.suffix = suffix
+
+    @property
+    def class_options(self):
+        """Options for \\documentclass{book}."""
+        options = [self.paper] if self.paper else []
+        options.append("twoside" if self.twoside else "oneside")
+        options.append(self.font_size)
+        return options
+
+    @classmethod
+    def get(cls, layout):
+        """
+        Return a layout by name, or build one from a dict of settings.
+
+        Args:
+            layout: Layout name, dict of LayoutProfile arguments or
+                LayoutProfile
+
+        Raises:
+            ValueError: If no layout has that name
+        """
+        if isinstance(layout, cls):
+            return layout
+        if isinstance(layout, dict):
+            return cls(**layout)
+        if layout not in LAYOUTS:
+            raise ValueError(
+                f"Unknown layout {layout!r}; "
+                f"expected one of {', '.join(LAYOUTS)}"
+            )
+        return LAYOUTS[layout]
+
+    def to_dict(self):
+        """Return the layout settings as a plain dict."""
+        return dict(vars(self))
+
+
+LAYOUTS = {
+    "a4-manuscript": LayoutProfile("a4-manuscript"),
+    "trade-6x9": LayoutProfile(
+        "trade-6x9",
+        paper=None,
+        font_size="11pt",
+        geometry=(
+            "paperwidth=6in",
+            "paperheight=9in",
+            "inner=0.75in",
+            "outer=0.5in",
+            "top=0.75in",
+            "bottom=0.75in",
+            "headheight=15pt",
+        ),
+        spacing="singlespacing",
+        suffix="-6x9",
+    ),
+    "letter-single": LayoutProfile(
+        "letter-single",
+        paper="letterpaper",
+        twoside=False,
+        geometry=("margin=1in", "letterpaper", "headheight=15pt"),
+        spacing="singlespacing",
+        suffix="-letter",
+    ),
+}
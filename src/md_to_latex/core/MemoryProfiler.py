@@ -0,0 +1,122 @@
+import os
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_NULL_STAGE = nullcontext()
+
+
+def _rusage_bytes(maxrss):
+    """Return a ru_maxrss in bytes (kilobytes on Linux, bytes on macOS)."""
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def _maxrss_bytes(who):
+    """Return ru_maxrss of getrusage(*who*) in bytes."""
+    if resource is None:
+        return None
+    return _rusage_bytes(resource.getrusage(who).ru_maxrss)
+
+
+def _current_rss_bytes():
+    """Return the current resident set size of this process."""
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class MemoryProfiler:
+    """Records peak Python heap and process RSS around build stages."""
+
+    def __init__(self, enabled=False):
+        """
+        Initialize a MemoryProfiler.
+
+        Args:
+            enabled: When False, stage() is a shared no-op context manager
+                and tracemalloc is never started.
+        """
+        self.enabled = enabled
+        self.stages = []
+        self._started_tracing = False
+        # Largest RSS of the child processes reported by child_exited()
+        # during the current stage; child processes may run in threads
+        self._child_peak = None
+        self._child_lock = threading.Lock()
+
+    def start(self):
+        """Start tracemalloc unless something else already traces."""
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        """Stop tracemalloc if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def child_exited(self, rusage):
+        """
+        Note the resource usage of a child process that exited.
+
+        Args:
+            rusage: struct_rusage of that one process, as os.wait4()
+                returns it
+        """
+        if not self.enabled:
+            return
+        maxrss = _rusage_bytes(rusage.ru_maxrss)
+        with self._child_lock:
+            self._child_peak = max(self._child_peak or 0, maxrss)
+
+    def stage(self, name, child=False):
+        """
+        Measure memory across the enclosed block.
+
+        Args:
+            name: Stage name
+            child: Also record the largest peak RSS of the child
+                processes (e.g. pdflatex) reported by child_exited()
+                within the block; None when there were none
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._record(name, child)
+
+    @contextmanager
+    def _record(self, name, child):
+        self.start()
+        heap_before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        if child:
+            with self._child_lock:
+                self._child_peak = None
+        try:
+            yield
+        finally:
+            heap_current, heap_peak = tracemalloc.get_traced_memory()
+            record = {
+                "stage": name,
+                "heap_peak": heap_peak,
+                "heap_delta": heap_current - heap_before,
+                "rss": _current_rss_bytes(),
+                "rss_peak": _maxrss_bytes(
+                    resource.RUSAGE_SELF if resource else None
+                ),
+            }
+            if child:
+                # Measured per process: RUSAGE_CHILDREN would be the
+                # largest child of the whole process lifetime, DOCX
+                # workers included
+                record["child_rss_peak"] = self._child_peak
+            self.stages.append(record)
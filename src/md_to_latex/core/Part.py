@@ -3,23 +3,65 @@ import re
 
 from pylatex import NoEscape
 
+from md_to_latex.core.BuildTimer import BuildTimer
 from md_to_latex.core.Chapter import Chapter
+from md_to_latex.storage.DirectoryStorage import DirectoryStorage
 
 
 class Part:
     """Represents a part of the book containing multiple chapters."""
 
-    def __init__(self, part_dir):
+    __slots__ = ("part_dir", "storage", "title", "chapters")
+
+    def __init__(self, part_dir, storage=None):
         """
         Initialize a Part from a directory.
 
         Args:
             part_dir: Path to the part directory (e.g., part-1-introduction)
+            storage: BookStorage holding the directory (default: the
+                file system)
         """
         self.part_dir = part_dir
+        self.storage = storage or DirectoryStorage(part_dir)
         self.title = self._extract_title()
         self.chapters = self._load_chapters()
 
+    def to_dict(self, base_dir):
+        """
+        Return the loaded part as plain data, with paths relative to
+        *base_dir* (see from_dict).
+        """
+        return {
+            "part_dir": os.path.relpath(self.part_dir, base_dir),
+            "title": self.title,
+            "chapters": [
+                chapter.to_dict(base_dir) for chapter in self.chapters
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data, base_dir, storage=None):
+        """
+        Rebuild a Part and its chapters from to_dict() without reading
+        any files.
+
+        Args:
+            data: Dict from to_dict()
+            base_dir: Directory the paths in *data* are relative to
+            storage: BookStorage holding the files (default: the file
+                system)
+        """
+        instance = cls.__new__(cls)
+        instance.part_dir = os.path.join(base_dir, data["part_dir"])
+        instance.storage = storage or DirectoryStorage(base_dir)
+        instance.title = data["title"]
+        instance.chapters = [
+            Chapter.from_dict(chapter, base_dir, instance.storage)
+            for chapter in data["chapters"]
+        ]
+        return instance
+
     def _extract_title(self):
         """Extract part title from directory name (supports kebab-case)."""
         dirname = os.path.basename(self.part_dir)
@@ -38,15 +80,15 @@ class Part:
         """Load all chapter-<NN>-<name> subdirectories in the part directory."""
         chapters = []
 
-        if not os.path.isdir(self.part_dir):
+        if not self.storage.isdir(self.part_dir):
             return chapters
 
         # Get all chapter-<NN>-<name> subdirectories
         chapter_dirs = [
             d
-            for d in os.listdir(self.part_dir)
+            for d in self.storage.listdir(self.part_dir)
             if (
-                os.path.isdir(os.path.join(self.part_dir, d))
+                self.storage.isdir(os.path.join(self.part_dir, d))
                 and re.fullmatch(r"chapter-\d+-[a-z0-9\-]+", d)
             )
         ]
@@ -56,19 +98,26 @@ class Part:
 
         for chapter_dir in chapter_dirs:
             dir_path = os.path.join(self.part_dir, chapter_dir)
-            chapters.append(Chapter(dir_path))
+            chapters.append(Chapter(dir_path, self.storage))
 
         return chapters
 
-    def to_latex(self, doc):
+    def heading(self):
+        """Return the \\part{title} command that opens this part."""
+        return NoEscape(r"\part{" + self.title + "}")
+
+    def to_latex(self, doc, timer=None, source_map=None):
         """
         Add this part to the LaTeX document.
 
         Args:
             doc: PyLaTeX Document object
+            timer: Optional BuildTimer that records a span per chapter
+            source_map: Optional SourceMap passed on to each chapter
         """
-        # Add \part{title} command
-        doc.append(NoEscape(r"\part{" + self.title + "}"))
+        timer = timer or BuildTimer()
+        doc.append(self.heading())
 
         for chapter in self.chapters:
-            chapter.to_latex(doc)
+            with timer.span(chapter.title, category="chapter"):
+                chapter.to_latex(doc, source_map=source_map)
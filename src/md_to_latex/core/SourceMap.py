@@ -0,0 +1,171 @@
+import bisect
+import copy
+import json
+import os
+import re
+
+_BLANK_LINE = re.compile(r"^\s*$")
+# Scene breaks become a block of their own when converted
+_SCENE_BREAK = re.compile(r"^\s*(---|\.\.\.)\s*$")
+
+
+class SourceMap:
+    """Maps lines of a generated .tex file back to markdown segments."""
+
+    MARKER = "% md_to_latex:src "
+    VERSION = 1
+
+    def __init__(self, base_dir):
+        """
+        Initialize a SourceMap.
+
+        Args:
+            base_dir: Directory that source paths are stored relative to
+        """
+        self.base_dir = base_dir
+        self.sources = []
+        # Per registered segment: (block_map() pairs, output line count)
+        self._segments = []
+        # Resolved runs: parallel sorted lists of tex lines and
+        # (source index, source line) pairs
+        self._tex_lines = []
+        self._targets = []
+
+    # ── Recording ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _blocks(text):
+        """
+        Return the 0-based first line of each non-blank block; a scene
+        break line is a block on its own, as the converter makes it.
+        """
+        starts = []
+        in_block = False
+        for number, line in enumerate(text.split("\n")):
+            blank = bool(_BLANK_LINE.match(line))
+            scene_break = bool(_SCENE_BREAK.match(line))
+            if not blank and (not in_block or scene_break):
+                starts.append(number)
+            in_block = not blank and not scene_break
+        return starts
+
+    @classmethod
+    def block_map(cls, source, output, removed_line=None):
+        """
+        Align converted output with its markdown source, block by block.
+
+        The converters keep paragraph (blank-line separated) structure, so
+        the n-th output block comes from the n-th source block; lines
+        within a block correspond one to one.
+
+        Args:
+            source: Markdown text that was converted
+            output: LaTeX produced from *source*
+            removed_line: 0-based line of the original segment that was
+                removed before conversion (the chapter title heading)
+
+        Returns:
+            List of (output line offset, 1-based source line) pairs
+        """
+        source_blocks = cls._blocks(source)
+        output_blocks = cls._blocks(output)
+        if not source_blocks:
+            return [(0, 1)]
+        pairs = []
+        for index, output_start in enumerate(output_blocks):
+            source_start = source_blocks[min(index, len(source_blocks) - 1)]
+            if removed_line is not None and source_start >= removed_line:
+                source_start += 1
+            pairs.append((output_start, source_start + 1))
+        return pairs or [(0, 1)]
+
+    def register(self, source_path, pairs, line_count):
+        """
+        Register one converted segment and return its marker line.
+
+        The marker (a TeX comment) must directly precede the segment's
+        LaTeX in the document so resolve() can find where it landed.
+
+        Args:
+            source_path: Path of the NNN.md segment file
+            pairs: Block alignment from block_map()
+            line_count: Number of lines of LaTeX the segment produced
+        """
+        self.sources.append(os.path.relpath(source_path, self.base_dir))
+        self._segments.append((pairs, line_count))
+        return f"{self.MARKER}{len(self._segments) - 1}"
+
+    def resolve(self, tex_path):
+        """Locate the segment markers in the generated .tex file."""
+        self._tex_lines = []
+        self._targets = []
+        with open(tex_path, "r", encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.startswith(self.MARKER):
+                    continue
+                segment = int(line[len(self.MARKER) :].strip().rstrip("%"))
+                pairs, line_count = self._segments[segment]
+                for offset, source_line in pairs:
+                    self._tex_lines.append(number + 1 + offset)
+                    self._targets.append((segment, source_line))
+                # Sentinel: lines after the segment map to nothing
+                self._tex_lines.append(number + 1 + line_count)
+                self._targets.append((-1, 0))
+
+    def resolved(self, tex_path):
+        """
+        Return a copy of this map resolved against *tex_path*.
+
+        The registered segments are shared, so one conversion can be
+        located in several .tex files that embed it.
+        """
+        source_map = copy.copy(self)
+        source_map.resolve(tex_path)
+        return source_map
+
+    # ── Persistence and lookup ──────────────────────────────────────────────
+
+    def save(self, path):
+        """Write the resolved map as compact JSON."""
+        data = {
+            "version": self.VERSION,
+            "sources": self.sources,
+            "lines": [
+                [tex_line, segment, source_line]
+                for tex_line, (segment, source_line) in zip(
+                    self._tex_lines, self._targets
+                )
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        return path
+
+    @classmethod
+    def load(cls, path, base_dir=None):
+        """Read a map written by save()."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        source_map = cls(base_dir or os.path.dirname(path))
+        source_map.sources = data["sources"]
+        for tex_line, segment, source_line in data["lines"]:
+            source_map._tex_lines.append(tex_line)
+            source_map._targets.append((segment, source_line))
+        return source_map
+
+    def lookup(self, tex_line):
+        """
+        Find the markdown location that produced a .tex line.
+
+        Returns:
+            (source path relative to base_dir, 1-based line) or None when
+            the line does not come from a chapter segment
+        """
+        index = bisect.bisect_right(self._tex_lines, tex_line) - 1
+        if index < 0 or self._targets[index][0] < 0:
+            return None
+        segment, source_line = self._targets[index]
+        return (
+            self.sources[segment],
+            source_line + tex_line - self._tex_lines[index],
+        )
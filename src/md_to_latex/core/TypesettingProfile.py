@@ -0,0 +1,79 @@
+class TypesettingProfile:
+    """Named set of LaTeX typesetting choices for a build."""
+
+    def __init__(
+        self,
+        name,
+        font_package="ebgaramond",
+        microtype=True,
+        hyperref=True,
+        passes=2,
+        draftmode=True,
+        docx=True,
+        suffix="",
+    ):
+        """
+        Initialize a TypesettingProfile.
+
+        Args:
+            name: Profile name, as passed to Book.build(profile=...)
+            font_package: Package that selects the body font
+            microtype: Load microtype (font expansion and protrusion)
+            hyperref: Load hyperref (links, bookmarks and PDF outline)
+            passes: pdflatex passes; the second fills in the contents
+            draftmode: Run every pass but the last with -draftmode, which
+                skips writing the PDF that the next pass replaces
+            docx: Also write the DOCX file
+            suffix: Appended to the output file name, so a profile's
+                output does not overwrite the production PDF
+        """
+        self.name = name
+        self.font_package = font_package
+        self.microtype = microtype
+        self.hyperref = hyperref
+        self.passes = passes
+        self.draftmode = draftmode
+        self.docx = docx
+        self.suffix = suffix
+
+    @classmethod
+    def get(cls, profile):
+        """
+        Return the profile registered as *profile*.
+
+        Args:
+            profile: Profile name or TypesettingProfile
+
+        Raises:
+            ValueError: If no profile has that name
+        """
+        if isinstance(profile, cls):
+            return profile
+        if profile not in PROFILES:
+            raise ValueError(
+                f"Unknown typesetting profile {profile!r}; "
+                f"expected one of {', '.join(PROFILES)}"
+            )
+        return PROFILES[profile]
+
+    def to_dict(self):
+        """Return the profile settings as a plain dict."""
+        return dict(vars(self))
+
+
+PROFILES = {
+    "production": TypesettingProfile("production"),
+    # Fast proofs: Times (in every TeX distribution) sets close to EB
+    # Garamond's width and the spacing and geometry are unchanged, so
+    # pagination stays comparable. One pass leaves the contents empty,
+    # and proofs skip the DOCX.
+    "draft": TypesettingProfile(
+        "draft",
+        font_package="mathptmx",
+        microtype=False,
+        hyperref=False,
+        passes=1,
+        docx=False,
+        suffix="-draft",
+    ),
+}
@@ -2,11 +2,31 @@
 # flake8: noqa: F408
 
 from md_to_latex.core.Book import Book
+from md_to_latex.core.BookDiagnosticsMixin import BookDiagnosticsMixin
 from md_to_latex.core.BookDocxMixin import BookDocxMixin
+from md_to_latex.core.BookEditMixin import BookEditMixin
 from md_to_latex.core.BookFrontMatterMixin import BookFrontMatterMixin
 from md_to_latex.core.BookLatexConfigMixin import BookLatexConfigMixin
 from md_to_latex.core.BookLoaderMixin import BookLoaderMixin
+from md_to_latex.core.BookLockMixin import BookLockMixin
 from md_to_latex.core.BookMarkdownMixin import BookMarkdownMixin
 from md_to_latex.core.BookOutputMixin import BookOutputMixin
+from md_to_latex.core.BookPreviewMixin import BookPreviewMixin
+from md_to_latex.core.BookPublishMixin import BookPublishMixin
+from md_to_latex.core.BookRegistry import BookRegistry
+from md_to_latex.core.BookRegistryMixin import BookRegistryMixin
+from md_to_latex.core.BookShardMixin import BookShardMixin
+from md_to_latex.core.BookSnapshotMixin import BookSnapshotMixin
+from md_to_latex.core.BookVariantMixin import BookVariantMixin
+from md_to_latex.core.BookVolumeMixin import BookVolumeMixin
+from md_to_latex.core.BuildResult import BuildResult
+from md_to_latex.core.BuildTimer import BuildTimer
 from md_to_latex.core.Chapter import Chapter
+from md_to_latex.core.LatexCompileError import LatexCompileError
+from md_to_latex.core.LatexError import LatexError
+from md_to_latex.core.LatexLogParser import LatexLogParser
+from md_to_latex.core.LayoutProfile import LayoutProfile
+from md_to_latex.core.MemoryProfiler import MemoryProfiler
 from md_to_latex.core.Part import Part
+from md_to_latex.core.SourceMap import SourceMap
+from md_to_latex.core.TypesettingProfile import TypesettingProfile
@@ -0,0 +1,137 @@
+import io
+import os
+
+
+class BookStorage:
+    """
+    Read-only view of the files of one book.
+
+    Paths are the ones the loader builds by joining names onto the
+    storage root, so BookLoaderMixin, Part and Chapter work unchanged on
+    every backend. This base class serves them from an index of member
+    names; the archive and in-memory backends fill the index and read
+    the bytes of a member.
+    """
+
+    # Whether signatures() can tell a later process that nothing changed
+    cacheable = True
+
+    def __init__(self, root, name=None):
+        """
+        Initialize a BookStorage.
+
+        Args:
+            root: Path the book's paths are built from
+            name: Book name, the default title (default: last part of root)
+        """
+        self.root = root
+        self.name = name or os.path.basename(os.path.normpath(root))
+        # Identity under which builds share content-keyed caches; None
+        # keys them by output directory
+        self.cache_id = None
+        self._members = {}
+        self._dirs = {"": set()}
+
+    # ── Index ───────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _common_top_dir(names):
+        """
+        Return the single directory every name is inside, or None.
+
+        Archives made with e.g. `zip -r book.zip my-book` hold the book
+        in one top-level directory, which becomes the storage root.
+        """
+        tops = {name.split("/", 1)[0] for name in names}
+        if len(tops) != 1 or any("/" not in name for name in names):
+            return None
+        return tops.pop()
+
+    def _add_member(self, rel_path, member):
+        """Index the file *rel_path* ("/"-separated) as *member*."""
+        parts = rel_path.split("/")
+        for depth in range(len(parts)):
+            parent = "/".join(parts[:depth])
+            self._dirs.setdefault(parent, set()).add(parts[depth])
+        self._members[rel_path] = member
+
+    def _relative(self, path):
+        """Return *path* relative to the root, "/"-separated."""
+        rel_path = os.path.relpath(path, self.root)
+        return "" if rel_path == "." else rel_path.replace(os.sep, "/")
+
+    def _member(self, path):
+        try:
+            return self._members[self._relative(path)]
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+    def _read(self, member):
+        """Return the bytes of an indexed member."""
+        raise NotImplementedError
+
+    # ── File system operations ──────────────────────────────────────────────
+
+    def isdir(self, path):
+        """Whether *path* is a directory."""
+        return self._relative(path) in self._dirs
+
+    def isfile(self, path):
+        """Whether *path* is a file."""
+        return self._relative(path) in self._members
+
+    def listdir(self, path):
+        """
+        Return the names in the directory *path*.
+
+        Raises:
+            FileNotFoundError: If *path* is not a directory
+        """
+        try:
+            return sorted(self._dirs[self._relative(path)])
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+    def read_text(self, path):
+        """
+        Return the UTF-8 text of the file *path*, with universal newlines
+        as open() in text mode reads it.
+
+        Raises:
+            FileNotFoundError: If *path* is not a file
+        """
+        data = self._read(self._member(path))
+        return io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").read()
+
+    def walk(self):
+        """Yield the path of every file, sorted."""
+        for rel_path in sorted(self._members):
+            yield os.path.join(self.root, *rel_path.split("/"))
+
+    def signatures(self):
+        """
+        Return {path relative to the root: signature} for every file,
+        to tell whether anything in the book changed.
+        """
+        return {
+            self._relative(path): self.signature(path) for path in self.walk()
+        }
+
+    def signature(self, path):
+        """Return a string that changes whenever the file's content does."""
+        raise NotImplementedError
+
+    def mtime(self, path):
+        """Return the file's modification time in seconds, or None."""
+        raise NotImplementedError
+
+    # ── Lifetime ────────────────────────────────────────────────────────────
+
+    def close(self):
+        """Release the files the storage holds open; a no-op by default."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,67 @@
+import os
+
+from md_to_latex.storage.BookStorage import BookStorage
+
+
+class DirectoryStorage(BookStorage):
+    """A book in a directory on the file system."""
+
+    def isdir(self, path):
+        """Whether *path* is a directory."""
+        return os.path.isdir(path)
+
+    def isfile(self, path):
+        """Whether *path* is a file."""
+        return os.path.isfile(path)
+
+    def listdir(self, path):
+        """Return the names in the directory *path*."""
+        return os.listdir(path)
+
+    def read_text(self, path):
+        """Return the UTF-8 text of the file *path*."""
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def walk(self):
+        """Yield the path of every file, sorted."""
+        for root, dirs, files in os.walk(self.root):
+            dirs.sort()
+            for fname in sorted(files):
+                yield os.path.join(root, fname)
+
+    def signatures(self):
+        """
+        Return {relative path: signature} for every file and directory.
+
+        Directories are included because an added or removed directory,
+        such as an empty chapter directory, changes the book without
+        changing any file.
+        """
+        signatures = {}
+        pending = [("", self.root)]
+        while pending:
+            rel_dir, path = pending.pop()
+            signatures[f"{rel_dir}/"] = self.signature(path)
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    rel_path = (
+                        f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    )
+                    if entry.is_dir():
+                        pending.append((rel_path, entry.path))
+                    else:
+                        stat = entry.stat()
+                        signatures[rel_path] = (
+                            f"{stat.st_size}\0{stat.st_mtime_ns}"
+                        )
+        return signatures
+
+    def signature(self, path):
+        """Size and modification time, as the file's stat reports them."""
+        stat = os.stat(path)
+        return f"{stat.st_size}\0{stat.st_mtime_ns}"
+
+    def mtime(self, path):
+        """Return the file's modification time in seconds."""
+        return os.path.getmtime(path)
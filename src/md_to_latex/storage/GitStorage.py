@@ -0,0 +1,113 @@
+import os
+import re
+import subprocess
+
+from md_to_latex.storage.BookStorage import BookStorage
+
+# Tree entries that are not regular files: symlinks and submodules
+_SKIPPED_MODES = ("120000", "160000")
+# Revision characters that are not safe in a file name
+_UNSAFE_REVISION = re.compile(r"[^\w.@-]+")
+
+
+class GitStorage(BookStorage):
+    """
+    A book as committed at a revision of a local git repository, read
+    without checking it out.
+
+    The tree is listed with one `git ls-tree` and every blob is read
+    with one `git cat-file --batch`. Blob IDs are the file signatures,
+    and the commit time is every file's modification time, so the
+    source date of a reproducible build is the commit's.
+    """
+
+    def __init__(self, book_dir, revision="HEAD"):
+        """
+        Initialize a GitStorage.
+
+        Args:
+            book_dir: The book directory in a git work tree (it may be a
+                subdirectory of the repository)
+            revision: Commit, tag or branch to read the book from
+
+        Raises:
+            ValueError: If book_dir is not in a git repository or the
+                revision does not exist
+        """
+        self.book_dir = os.path.normpath(book_dir)
+        self.revision = revision
+        self.commit = self._git(
+            "rev-parse", "--verify", f"{revision}^{{commit}}"
+        )
+        top_level = self._git("rev-parse", "--show-toplevel")
+        prefix = self._git("rev-parse", "--show-prefix")
+        # A revision such as origin/main or HEAD~2 names one directory
+        super().__init__(
+            f"{self.book_dir}@{_UNSAFE_REVISION.sub('-', revision)}",
+            name=os.path.basename(os.path.abspath(self.book_dir)),
+        )
+        # Editions of one book share caches keyed by content
+        self.cache_id = os.path.abspath(self.book_dir)
+        self.commit_time = int(
+            self._git("show", "-s", "--format=%ct", self.commit)
+        )
+        pathspec = ["--", prefix] if prefix else []
+        listing = self._git(
+            "-C", top_level, "ls-tree", "-r", "-z", self.commit, *pathspec
+        )
+        for entry in filter(None, listing.split("\0")):
+            meta, path = entry.split("\t", 1)
+            mode, kind, blob_id = meta.split()
+            if kind == "blob" and mode not in _SKIPPED_MODES:
+                self._add_member(path[len(prefix) :], blob_id)
+        self._blobs = None
+
+    def _git(self, *args):
+        """Run git in book_dir and return its stripped output."""
+        try:
+            process = subprocess.run(
+                ["git", "-C", self.book_dir, *args],
+                capture_output=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, "stderr", b"") or b""
+            raise ValueError(
+                f"Cannot read {self.book_dir!r} at {self.revision!r}: "
+                f"{stderr.decode('utf-8', 'replace').strip() or e}"
+            ) from None
+        return process.stdout.decode("utf-8").strip("\n")
+
+    def _read_blobs(self):
+        """Read every blob of the book in one `git cat-file --batch`."""
+        blob_ids = sorted(set(self._members.values()))
+        process = subprocess.run(
+            ["git", "-C", self.book_dir, "cat-file", "--batch"],
+            input="".join(f"{blob_id}\n" for blob_id in blob_ids).encode(),
+            capture_output=True,
+            check=True,
+        )
+        output = process.stdout
+        blobs = {}
+        position = 0
+        for blob_id in blob_ids:
+            header_end = output.index(b"\n", position)
+            size = int(output[position:header_end].split()[2])
+            start = header_end + 1
+            blobs[blob_id] = output[start : start + size]
+            position = start + size + 1
+        return blobs
+
+    def _read(self, member):
+        if self._blobs is None:
+            self._blobs = self._read_blobs()
+        return self._blobs[member]
+
+    def signature(self, path):
+        """The blob ID, a hash of the file's content."""
+        return self._member(path)
+
+    def mtime(self, path):
+        """Return the commit time of the revision."""
+        self._member(path)
+        return self.commit_time
@@ -0,0 +1,75 @@
+import hashlib
+import posixpath
+import tarfile
+
+from md_to_latex.storage.BookStorage import BookStorage
+
+
+class MemoryStorage(BookStorage):
+    """A book held in memory, e.g. an upload or a test fixture."""
+
+    # Nothing outlives the process to revalidate against
+    cacheable = False
+
+    def __init__(self, files, root="book", name=None, mtimes=None):
+        """
+        Initialize a MemoryStorage.
+
+        Args:
+            files: Dict of "/"-separated path (relative to the book) to
+                content, as str or UTF-8 bytes
+            root: Path the book's paths are built from; nothing is read
+                from or written to it
+            name: Book name, the default title (default: last part of
+                root)
+            mtimes: Optional dict of path to modification time, used
+                for the source date of reproducible builds
+        """
+        super().__init__(root, name=name)
+        self._mtimes = {
+            rel_path.strip("/"): mtime
+            for rel_path, mtime in (mtimes or {}).items()
+        }
+        for rel_path, content in files.items():
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            self._add_member(rel_path.strip("/"), content)
+
+    @classmethod
+    def from_tar(cls, fileobj, root="book"):
+        """
+        Read a tar stream, e.g. standard input, into a MemoryStorage.
+
+        The stream is read once from start to end, so it need not be
+        seekable; gzip, bzip2 and xz compression are detected. A single
+        top-level folder becomes the book root and its name the book's.
+
+        Args:
+            fileobj: Binary file object positioned at the tar data
+            root: Path the book's paths are built from
+        """
+        files, mtimes = {}, {}
+        with tarfile.open(fileobj=fileobj, mode="r|*") as archive:
+            for member in archive:
+                if member.isfile():
+                    name = posixpath.normpath(member.name)
+                    files[name] = archive.extractfile(member).read()
+                    mtimes[name] = member.mtime
+        top_dir = cls._common_top_dir(list(files))
+        if top_dir:
+            start = len(top_dir) + 1
+            files = {name[start:]: data for name, data in files.items()}
+            mtimes = {name[start:]: t for name, t in mtimes.items()}
+        return cls(files, root=root, name=top_dir, mtimes=mtimes)
+
+    def _read(self, member):
+        return member
+
+    def signature(self, path):
+        """SHA-1 of the content."""
+        return hashlib.sha1(self._member(path)).hexdigest()
+
+    def mtime(self, path):
+        """Return the modification time given for the file, or None."""
+        self._member(path)
+        return self._mtimes.get(self._relative(path))
@@ -0,0 +1,62 @@
+import os
+import posixpath
+import tarfile
+
+from md_to_latex.storage.BookStorage import BookStorage
+
+_TAR_SUFFIXES = (".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".tar")
+
+
+class TarStorage(BookStorage):
+    """
+    A book in a (possibly compressed) tar archive, read without
+    extracting it.
+
+    A compressed tar cannot be read from the middle, so every file is
+    read once, in archive order, when the archive is opened; the
+    archive is closed again before the constructor returns.
+    """
+
+    def __init__(self, archive_path, root=None):
+        """
+        Initialize a TarStorage.
+
+        Args:
+            archive_path: Path to the .tar, .tar.gz, .tgz, ... file
+            root: Path the book's paths are built from (default:
+                archive_path)
+        """
+        self.archive_path = archive_path
+        members = {}
+        with tarfile.open(archive_path, "r|*") as archive:
+            for member in archive:
+                if member.isfile():
+                    data = archive.extractfile(member).read()
+                    members[posixpath.normpath(member.name)] = (member, data)
+        top_dir = self._common_top_dir(list(members))
+        super().__init__(
+            root or archive_path,
+            name=top_dir or self._strip_suffix(os.path.basename(archive_path)),
+        )
+        prefix = f"{top_dir}/" if top_dir else ""
+        for name, member in members.items():
+            self._add_member(name[len(prefix) :], member)
+
+    @staticmethod
+    def _strip_suffix(filename):
+        for suffix in _TAR_SUFFIXES:
+            if filename.endswith(suffix):
+                return filename[: -len(suffix)]
+        return filename
+
+    def _read(self, member):
+        return member[1]
+
+    def signature(self, path):
+        """Size and modification time, as the archive records them."""
+        info, _ = self._member(path)
+        return f"{info.size}\0{info.mtime}"
+
+    def mtime(self, path):
+        """Return the member's modification time in seconds."""
+        return self._member(path)[0].mtime
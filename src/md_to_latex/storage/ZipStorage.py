@@ -0,0 +1,55 @@
+import os
+import time
+import zipfile
+
+from md_to_latex.storage.BookStorage import BookStorage
+
+# Resource forks that macOS's Finder adds to the archives it creates
+_MACOS_METADATA = "__MACOSX/"
+
+
+class ZipStorage(BookStorage):
+    """A book in a zip archive, read without extracting it."""
+
+    def __init__(self, archive_path, root=None):
+        """
+        Initialize a ZipStorage.
+
+        Args:
+            archive_path: Path to the .zip file
+            root: Path the book's paths are built from (default:
+                archive_path)
+        """
+        self.archive_path = archive_path
+        self._zip = zipfile.ZipFile(archive_path)
+        infos = [
+            info
+            for info in self._zip.infolist()
+            if not info.is_dir()
+            and not info.filename.startswith(_MACOS_METADATA)
+        ]
+        top_dir = self._common_top_dir([info.filename for info in infos])
+        super().__init__(
+            root or archive_path,
+            name=top_dir
+            or os.path.splitext(os.path.basename(archive_path))[0],
+        )
+        prefix = f"{top_dir}/" if top_dir else ""
+        for info in infos:
+            self._add_member(info.filename[len(prefix) :], info)
+
+    def _read(self, member):
+        return self._zip.read(member)
+
+    def close(self):
+        """Close the archive; the index stays, reading raises ValueError."""
+        self._zip.close()
+
+    def signature(self, path):
+        """Size and CRC-32 of the member, as the archive records them."""
+        info = self._member(path)
+        return f"{info.file_size}\0{info.CRC:08x}"
+
+    def mtime(self, path):
+        """Return the member's modification time in seconds."""
+        return time.mktime(self._member(path).date_time + (0, 0, -1))
@@ -0,0 +1,9 @@
+# md_to_latex.storage (auto generate by build_inits.py)
+# flake8: noqa: F408
+
+from md_to_latex.storage.BookStorage import BookStorage
+from md_to_latex.storage.DirectoryStorage import DirectoryStorage
+from md_to_latex.storage.GitStorage import GitStorage
+from md_to_latex.storage.MemoryStorage import MemoryStorage
+from md_to_latex.storage.TarStorage import TarStorage
+from md_to_latex.storage.ZipStorage import ZipStorage
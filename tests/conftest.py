@@ -215,6 +215,23 @@ def example_book_2_dir():
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def session_temp_dir():
+    """
+    Point tempfile at a directory that is removed after the session, so
+    machine-wide state such as build locks does not pile up in the
+    system temp directory.
+    """
+    temp_dir = tempfile.mkdtemp(prefix="md_to_latex_tests_")
+    previous = tempfile.tempdir
+    tempfile.tempdir = temp_dir
+    try:
+        yield temp_dir
+    finally:
+        tempfile.tempdir = previous
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def create_example_book_in_tests_input(example_book_dir, example_book_2_dir):
     """
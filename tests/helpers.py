@@ -0,0 +1,83 @@
+"""
+Shared helpers for tests that build books without running pdflatex.
+"""
+
+import os
+
+from md_to_latex.core.Book import Book
+from md_to_latex.core.LatexLogParser import LatexLogParser
+
+
+class FakePdflatex:
+    """
+    Stand-in for Book._run_pdflatex: writes the files a pdflatex run
+    would leave behind and records every run.
+    """
+
+    def __init__(self, extensions=(".pdf",), release=None, returncode=0):
+        """
+        Initialize a FakePdflatex.
+
+        Args:
+            extensions: Files written next to the .tex for every run
+            release: threading.Event every run waits for (up to 5
+                seconds) before it writes its files
+            returncode: Exit status every run reports
+        """
+        self.extensions = extensions
+        self.release = release
+        self.returncode = returncode
+        # (tex_dir, tex_filename, draftmode) of every run, in order
+        self.runs = []
+
+    @property
+    def tex_filenames(self):
+        """The .tex file names of every run."""
+        return [tex_filename for _, tex_filename, _ in self.runs]
+
+    def __call__(
+        self, tex_dir, tex_filename, fail_fast=False, draftmode=False
+    ):
+        self.runs.append((tex_dir, tex_filename, draftmode))
+        if self.release is not None:
+            self.release.wait(5)
+        name = os.path.splitext(tex_filename)[0]
+        for ext in self.extensions:
+            with open(os.path.join(tex_dir, name + ext), "wb") as f:
+                f.write(b"%PDF-1.5\n")
+        return self.returncode, LatexLogParser(tex_filename)
+
+
+def write_book(book_dir, files):
+    """
+    Write a book's files.
+
+    Args:
+        book_dir: Book directory to create
+        files: Dict of "/"-separated path relative to book_dir to text
+
+    Returns:
+        book_dir
+    """
+    for rel_path, content in files.items():
+        path = os.path.join(book_dir, *rel_path.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+    return book_dir
+
+
+def open_book(book_dir, pdflatex=None, **kwargs):
+    """
+    Return a Book that compiles with a FakePdflatex and never opens its
+    outputs.
+
+    Args:
+        book_dir: Book directory
+        pdflatex: FakePdflatex to compile with (default: a new one)
+        **kwargs: Passed on to Book()
+    """
+    book = Book(book_dir, **kwargs)
+    book.open_outputs = False
+    book._run_pdflatex = pdflatex or FakePdflatex()
+    return book
@@ -0,0 +1,181 @@
+"""
+Test cases for the benchmark suite and regression comparison.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from md_to_latex.bench import (BenchmarkComparison, BenchmarkHistory,
+                               BenchmarkRunner, SyntheticBook)
+from md_to_latex.core.Book import Book
+
+
+def _results(**medians):
+    """Build a minimal result set from {metric: (median, mad)}."""
+    return {
+        "metrics": {
+            name.replace("__", "/"): {
+                "unit": "s",
+                "median": median,
+                "mad": mad,
+            }
+            for name, (median, mad) in medians.items()
+        }
+    }
+
+
+class TestSyntheticBook(unittest.TestCase):
+    """Test the synthetic benchmark book generator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_write_small_book(self):
+        """The small book loads with the configured structure."""
+        book = Book(SyntheticBook("small").write(self.temp_dir))
+        parts, chapters, segments, _ = SyntheticBook.SIZES["small"]
+        self.assertEqual(len(book.parts), parts)
+        self.assertEqual(len(book.parts[0].chapters), chapters)
+        self.assertEqual(len(book.parts[0].chapters[0]._md_files), segments)
+
+    def test_deterministic(self):
+        """The same seed writes identical content."""
+        first = Book(SyntheticBook("small").write(self.temp_dir))
+        other_dir = os.path.join(self.temp_dir, "other")
+        second = Book(SyntheticBook("small").write(other_dir))
+        self.assertEqual(
+            first.parts[0].chapters[0].content,
+            second.parts[0].chapters[0].content,
+        )
+
+    def test_unknown_size(self):
+        """Unknown sizes are rejected."""
+        with self.assertRaises(ValueError):
+            SyntheticBook("huge")
+
+
+class TestBenchmarkComparison(unittest.TestCase):
+    """Test regression detection between result sets."""
+
+    def test_regression_beyond_budget_and_noise(self):
+        """A large, low-noise slowdown is a regression."""
+        comparison = BenchmarkComparison(
+            _results(small__build=(1.0, 0.01)),
+            _results(small__build=(1.5, 0.01)),
+        )
+        self.assertFalse(comparison.passed)
+        self.assertEqual(comparison.regressions[0]["metric"], "small/build")
+
+    def test_noisy_slowdown_is_ok(self):
+        """A slowdown within the noise threshold is not a regression."""
+        comparison = BenchmarkComparison(
+            _results(small__build=(1.0, 0.2)),
+            _results(small__build=(1.3, 0.2)),
+        )
+        self.assertTrue(comparison.passed)
+
+    def test_budget_override(self):
+        """Per-metric budgets override the default budget."""
+        comparison = BenchmarkComparison(
+            _results(small__docx=(1.0, 0.0)),
+            _results(small__docx=(1.3, 0.0)),
+            budgets={"*/docx": 0.5},
+        )
+        self.assertTrue(comparison.passed)
+
+    def test_improvement(self):
+        """A large speedup is reported as an improvement."""
+        comparison = BenchmarkComparison(
+            _results(small__load=(1.0, 0.0)),
+            _results(small__load=(0.5, 0.0)),
+        )
+        self.assertEqual(comparison.rows[0]["status"], "improvement")
+
+
+class TestBenchmarkHistory(unittest.TestCase):
+    """Test storing and running benchmarks."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.history = BenchmarkHistory(self.temp_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_save_and_load_by_commit(self):
+        """Results are keyed by commit and machine fingerprint."""
+        path = self.history.save(
+            _results(small__load=(1.0, 0.0))["metrics"], commit="abc123"
+        )
+        fingerprint = BenchmarkHistory.machine_info()["fingerprint"]
+        self.assertEqual(
+            os.path.basename(path), f"abc123-{fingerprint}.json"
+        )
+        loaded = self.history.load("abc123")
+        self.assertEqual(loaded["commit"], "abc123")
+        self.assertIn("small/load", loaded["metrics"])
+
+    def test_load_missing(self):
+        """Loading unknown results raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            self.history.load("does-not-exist")
+
+    def test_runner_metrics(self):
+        """The runner records one summary per scenario and size."""
+        metrics = BenchmarkRunner(
+            sizes=["small"], scenarios=["load", "convert"], repeat=2
+        ).run()
+        self.assertEqual(set(metrics), {"small/load", "small/convert"})
+        self.assertEqual(len(metrics["small/load"]["samples"]), 2)
+
+    def test_docx_size_metrics(self):
+        """The DOCX scenario reports sizes and the cached generation."""
+        metrics = BenchmarkRunner(
+            sizes=["small"], scenarios=["docx"], repeat=1
+        ).run()
+        self.assertEqual(
+            set(metrics),
+            {
+                "small/docx",
+                "small/docx/cached",
+                "small/docx/bytes",
+                "small/docx/document_xml_bytes",
+            },
+        )
+        self.assertEqual(metrics["small/docx/bytes"]["unit"], "bytes")
+        self.assertEqual(metrics["small/docx/cached"]["unit"], "s")
+        self.assertEqual(
+            metrics["small/docx/document_xml_bytes"]["unit"], "bytes"
+        )
+
+    def test_catalog_memory_metrics(self):
+        """The catalog scenario reports the heap of resident books."""
+        metrics = BenchmarkRunner(
+            sizes=["small"], scenarios=["catalog"], repeat=1
+        ).run()
+        self.assertEqual(
+            set(metrics),
+            {
+                "small/catalog",
+                "small/catalog/bytes",
+                "small/catalog/evicted_bytes",
+            },
+        )
+        self.assertEqual(metrics["small/catalog/bytes"]["unit"], "bytes")
+        self.assertLess(
+            metrics["small/catalog/evicted_bytes"]["median"],
+            metrics["small/catalog/bytes"]["median"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Test cases for build timing instrumentation.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from md_to_latex.core.Book import Book
+from md_to_latex.core.BuildTimer import BuildTimer
+
+
+class TestBuildTimer(unittest.TestCase):
+    """Test BuildTimer span recording."""
+
+    def test_disabled_records_nothing(self):
+        """A disabled timer returns a no-op span and records nothing."""
+        timer = BuildTimer()
+        with timer.span("convert"):
+            pass
+        timer.add_span("load", 0.0, 1.0)
+        self.assertEqual(timer.spans, [])
+
+    def test_nested_spans_depth(self):
+        """Spans opened inside another span are one level deeper."""
+        timer = BuildTimer(enabled=True)
+        with timer.span("convert"):
+            with timer.span("Chapter One", category="chapter"):
+                pass
+        depths = {s["name"]: s["depth"] for s in timer.spans}
+        self.assertEqual(depths, {"convert": 0, "Chapter One": 1})
+
+    def test_durations_by_category(self):
+        """durations() sums spans of one category by name."""
+        timer = BuildTimer(enabled=True)
+        timer.add_span("load", 1.0, 1.5)
+        timer.add_span("Chapter", 1.0, 3.0, category="chapter")
+        self.assertEqual(timer.durations(), {"load": 0.5})
+
+    def test_chrome_trace_threads(self):
+        """Each worker thread gets its own track in the trace."""
+        timer = BuildTimer(enabled=True)
+
+        def work():
+            with timer.span("worker", category="chapter"):
+                pass
+
+        thread = threading.Thread(target=work, name="worker-1")
+        thread.start()
+        thread.join()
+        with timer.span("main"):
+            pass
+
+        trace = timer.to_chrome_trace()
+        complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        names = {
+            e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"
+        }
+        self.assertEqual(len(complete), 2)
+        self.assertEqual(len({e["tid"] for e in complete}), 2)
+        self.assertIn("worker-1", names)
+        self.assertGreaterEqual(min(e["ts"] for e in complete), 0)
+
+
+class TestBookBuildTiming(unittest.TestCase):
+    """Test timing spans recorded by Book.build()."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.book_dir = os.path.join(self.temp_dir, "book")
+        ch_dir = os.path.join(
+            self.book_dir, "part-1-intro", "chapter-01-start"
+        )
+        os.makedirs(ch_dir)
+        with open(os.path.join(ch_dir, "001.md"), "w", encoding="utf-8") as f:
+            f.write("# Start\n\nSome **bold** content.")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_build_writes_trace(self):
+        """build() records stages and chapters and writes a trace."""
+        trace_path = os.path.join(self.temp_dir, "trace.json")
+        result = Book(self.book_dir).build(trace_path=trace_path)
+
+        stages = result.stage_durations()
+        for stage in ("load", "convert", "generate_tex", "generate_docx"):
+            self.assertIn(stage, stages)
+        self.assertIn(
+            "Start",
+            [s["name"] for s in result.spans if s["category"] == "chapter"],
+        )
+        with open(trace_path, encoding="utf-8") as f:
+            trace = json.load(f)
+        self.assertTrue(trace["traceEvents"])
+
+    def test_build_without_timing(self):
+        """Timing is off by default and records no spans."""
+        result = Book(self.book_dir).build()
+        self.assertEqual(result.spans, [])
+        self.assertTrue(os.path.exists(result.tex_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
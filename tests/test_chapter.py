@@ -86,6 +86,32 @@ class TestChapterInit(unittest.TestCase):
         chapter = Chapter(self.chapter_dir)
         self.assertEqual(chapter.content, "")
 
+    def test_slots(self):
+        """Chapters have no per-instance __dict__."""
+        self._write("001.md", "# Title\n\nText.")
+        chapter = Chapter(self.chapter_dir)
+        self.assertFalse(hasattr(chapter, "__dict__"))
+        self.assertEqual(
+            chapter._md_files, [os.path.join(self.chapter_dir, "001.md")]
+        )
+
+    def test_evict_rereads_content(self):
+        """Evicted text is re-read on demand; the word count is kept."""
+        self._write("001.md", "# Title\n\nOne two.\n")
+        self._write("002.md", "Three.")
+        chapter = Chapter(self.chapter_dir)
+        content = chapter.content
+        self.assertEqual(chapter.word_count, 5)
+        chapter.evict()
+        self.assertIsNone(chapter._content)
+        self.assertEqual(chapter.word_count, 5)
+        self.assertIsNone(chapter._content)
+        self.assertEqual(chapter.content, content)
+        self.assertEqual(
+            [text for _, text in chapter._content_segments()],
+            ["# Title\n\nOne two.\n", "Three."],
+        )
+
 
 class TestChapterFromFile(unittest.TestCase):
     """Test Chapter.from_file() (flat format)."""
@@ -0,0 +1,94 @@
+"""
+Test cases for isolating the chapter that breaks pdflatex.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from md_to_latex.core.Book import Book
+from md_to_latex.core.LatexError import LatexError
+from tests.helpers import FakePdflatex
+
+
+class TestBookDiagnosticsMixin(unittest.TestCase):
+    """Test BookDiagnosticsMixin helpers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.chapter_dir = os.path.join(
+            self.temp_dir, "part-1-intro", "chapter-01-start"
+        )
+        os.makedirs(self.chapter_dir)
+        for name, text in [
+            ("001.md", "# Start\n\nFirst **segment**.\n"),
+            ("002.md", "Second segment.\n"),
+        ]:
+            with open(
+                os.path.join(self.chapter_dir, name), "w", encoding="utf-8"
+            ) as f:
+                f.write(text)
+        self.book = Book(self.temp_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_read_segments(self):
+        """Chapters expose their NNN.md segments in order."""
+        chapter = self.book.parts[0].chapters[0]
+        segments = chapter._read_segments()
+        self.assertEqual(
+            [os.path.basename(path) for path, _ in segments],
+            ["001.md", "002.md"],
+        )
+        self.assertEqual(
+            "".join(text for _, text in segments), chapter.content
+        )
+
+    def test_diagnostic_document_uses_book_preamble(self):
+        """Standalone documents carry the full book preamble."""
+        chapter = self.book.parts[0].chapters[0]
+        doc = self.book._diagnostic_document(
+            self.book._chapter_items(chapter)
+        )
+        latex = doc.dumps()
+        self.assertIn("ebgaramond", latex)
+        self.assertIn(r"\newcommand{\booktitle}", latex)
+        self.assertIn(r"\chapter{Start}", latex)
+        self.assertIn(r"\textbf{segment}", latex)
+        self.assertNotIn(r"\tableofcontents", latex)
+
+    def test_segment_items_strip_heading_once(self):
+        """Only the first segment has its title heading stripped."""
+        chapter = self.book.parts[0].chapters[0]
+        segments = chapter._latex_segments()
+        first = self.book._segment_items(chapter, segments[0][2])
+        self.assertNotIn("Start", first[0][1])
+        self.assertIn("Second segment.", segments[1][2])
+
+    def test_failed_compile_without_log_errors(self):
+        """A nonzero exit with nothing parsed still yields a LatexError."""
+        self.book._run_pdflatex = FakePdflatex(returncode=1)
+        work_dir = tempfile.mkdtemp(dir=self.temp_dir)
+        chapter = self.book.parts[0].chapters[0]
+        errors = self.book._compile_items(
+            work_dir, "chapter-001", self.book._chapter_items(chapter)
+        )
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], LatexError)
+        self.assertEqual(
+            errors[0].to_dict()["message"], "pdflatex exited with status 1"
+        )
+        self.assertEqual(errors[0].file, "chapter-001.tex")
+
+    def test_unknown_strategy(self):
+        """Unknown diagnosis strategies are rejected."""
+        with self.assertRaises(ValueError):
+            self.book.diagnose(strategy="guess")
+
+
+if __name__ == "__main__":
+    unittest.main()
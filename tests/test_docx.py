@@ -0,0 +1,259 @@
+"""
+Test cases for DOCX generation.
+"""
+
+import inspect
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from concurrent.futures import Future
+
+from docx import Document as DocxDocument
+from docx.oxml.ns import qn
+
+from md_to_latex.core.Book import Book
+from md_to_latex.core.BuildTimer import BuildTimer
+
+
+class TestBookDocxMixin(unittest.TestCase):
+    """Test BookDocxMixin."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        chapter_dir = os.path.join(
+            self.temp_dir, "part-1-intro", "chapter-01-a"
+        )
+        os.makedirs(chapter_dir)
+        with open(
+            os.path.join(chapter_dir, "001.md"), "w", encoding="utf-8"
+        ) as f:
+            f.write(
+                'She said "hello" twice.^[A *short* note.]\n\n'
+                "---\n\n"
+                "More text.^[Another note.]\n"
+            )
+        self.book = Book(self.temp_dir)
+        self.book.open_outputs = False
+        os.makedirs(self.book.output_dir)
+        self.docx_path = self.book._generate_docx(
+            os.path.join(self.book.output_dir, "book")
+        )
+        self.doc = DocxDocument(self.docx_path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        shutil.rmtree(self.book.output_dir, ignore_errors=True)
+
+    def _paragraphs(self, style):
+        return [p for p in self.doc.paragraphs if p.style.name == style]
+
+    def test_content_styles_defined(self):
+        """Footnote, quote and scene-break styles are defined once."""
+        styles = self.doc.styles
+        self.assertTrue(styles["Note Reference"].font.superscript)
+        self.assertEqual(styles["Note Text"].font.size.pt, 9)
+        self.assertEqual(str(styles["Maroon Quote"].font.color.rgb), "800000")
+        self.assertEqual(len(self._paragraphs("Scene Break")), 1)
+
+    def test_runs_reference_styles(self):
+        """Styled runs carry a style reference, not direct formatting."""
+        refs = [
+            run
+            for p in self.doc.paragraphs
+            for run in p.runs
+            if run.style.name == "Note Reference"
+        ]
+        self.assertEqual([run.text for run in refs], ["1", "2", "1", "2"])
+        quotes = [
+            run
+            for p in self.doc.paragraphs
+            for run in p.runs
+            if run.style.name == "Maroon Quote"
+        ]
+        self.assertEqual([run.text for run in quotes], ["“hello”"])
+        for run in refs + quotes:
+            rPr = run._r.rPr
+            self.assertEqual(len(rPr), 1, "only w:rStyle expected")
+            self.assertIsNotNone(rPr.find(qn("w:rStyle")))
+
+    def test_notes_use_note_text_style(self):
+        """Note paragraphs inherit size and spacing from their style."""
+        notes = self._paragraphs("Note Text")
+        self.assertEqual(
+            [p.text for p in notes], ["1 A short note.", "2 Another note."]
+        )
+        for note in notes:
+            self.assertIsNone(note.runs[-1].font.size)
+        italic = [run.text for run in notes[0].runs if run.italic]
+        self.assertEqual(italic, ["short"])
+        self.assertEqual(len(self._paragraphs("Note Separator")), 1)
+
+    def test_streamed_document(self):
+        """The streamed body follows the front matter, in book order."""
+        texts = [p.text for p in self.doc.paragraphs]
+        self.assertLess(texts.index(self.book.title), texts.index("Intro"))
+        self.assertLess(texts.index("Intro"), texts.index("A"))
+        self.assertIn("More text.2", texts)
+        with zipfile.ZipFile(self.docx_path) as docx:
+            xml = docx.read("word/document.xml")
+        self.assertEqual(xml.count(b"xmlns:w="), 1)
+        self.assertTrue(xml.endswith(b"</w:sectPr></w:body></w:document>"))
+
+    def test_compression_level(self):
+        """The zip compression level is configurable."""
+        sizes = {}
+        for level in (0, 9):
+            path = self.book._generate_docx(
+                os.path.join(self.book.output_dir, f"level-{level}"),
+                compression_level=level,
+            )
+            with zipfile.ZipFile(path) as docx:
+                info = docx.getinfo("word/document.xml")
+            sizes[level] = info.compress_size
+            self.assertEqual(
+                DocxDocument(path).paragraphs[-1].text,
+                self.doc.paragraphs[-1].text,
+            )
+        self.assertGreater(sizes[0], sizes[9])
+
+
+class TestDocxChapterFragments(unittest.TestCase):
+    """Test parallel, cached rendering of chapter fragments."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.book_dir = os.path.join(self.temp_dir, "book")
+        self.files = []
+        for index, text in enumerate(
+            [
+                "One.^[First.] Two.^[Second.]\n\n---\n\n# Not^[counted]\n",
+                "Three.^[Third.]\n...\nFour *and* \"five\".^[Fourth.]\n",
+                "No notes here.\n",
+            ]
+        ):
+            chapter_dir = os.path.join(
+                self.book_dir, "part-1-intro", f"chapter-0{index + 1}-c"
+            )
+            os.makedirs(chapter_dir)
+            path = os.path.join(chapter_dir, "001.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            self.files.append(path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, name, max_workers=1, scratch="scratch"):
+        book = Book(
+            self.book_dir,
+            output_dir=os.path.join(self.temp_dir, "out"),
+            scratch_dir=os.path.join(self.temp_dir, scratch),
+        )
+        book.open_outputs = False
+        book.source_date_epoch = 1700000000
+        os.makedirs(book.output_dir, exist_ok=True)
+        path = book._generate_docx(
+            os.path.join(book.output_dir, name), max_workers=max_workers
+        )
+        with open(path, "rb") as f:
+            return book, f.read()
+
+    def _cache_names(self, book):
+        return sorted(os.listdir(book._cache_dir("docx_fragments")))
+
+    def test_count_notes_matches_renderer(self):
+        """Footnotes are counted as the renderer numbers them."""
+        book, _ = self._generate("book")
+        doc = DocxDocument()
+        book._docx_setup_styles(doc)
+        for path, expected in zip(self.files, [2, 2, 0]):
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+            book._docx_render_chapter(doc, "Title", 2, content, 10)
+            self.assertEqual(book._fn_counter, 10 + expected)
+            self.assertEqual(book._docx_count_notes(content), expected)
+
+    def test_notes_numbered_across_chapters(self):
+        """Each chapter's notes continue from the previous chapter's."""
+        book, _ = self._generate("book")
+        doc = DocxDocument(os.path.join(book.output_dir, "book.docx"))
+        notes = [
+            p.text for p in doc.paragraphs if p.style.name == "Note Text"
+        ]
+        self.assertEqual(
+            notes, ["1 First.", "2 Second.", "3 Third.", "4 Fourth."]
+        )
+
+    def test_parallel_matches_serial(self):
+        """Worker processes render the same document as one process."""
+        _, serial = self._generate("book")
+        _, parallel = self._generate("book", max_workers=2, scratch="other")
+        self.assertEqual(serial, parallel)
+
+    def test_render_window_is_bounded(self):
+        """Only a window of chapter jobs is in flight at a time."""
+        book, _ = self._generate("book")
+        submitted = []
+
+        class ImmediatePool:
+            def submit(self, function, job, timing):
+                submitted.append(job)
+                future = Future()
+                future.set_result((job, []))
+                return future
+
+        jobs = list(range(10))
+        results = []
+        for result in book._docx_render_window(ImmediatePool(), jobs, 3):
+            self.assertLessEqual(len(submitted) - len(results), 3)
+            results.append(result[0])
+        self.assertEqual(results, jobs)
+        self.assertEqual(submitted, jobs)
+
+    def test_fragments_cached_by_content(self):
+        """Unchanged chapters are reused; stale fragments are removed."""
+        book, first = self._generate("book")
+        cached = self._cache_names(book)
+        self.assertEqual(len(cached), 3)
+        _, second = self._generate("book")
+        self.assertEqual(first, second)
+
+        with open(self.files[2], "a", encoding="utf-8") as f:
+            f.write("\nMore.\n")
+        book, _ = self._generate("book")
+        changed = self._cache_names(book)
+        self.assertEqual(len(set(cached) & set(changed)), 2)
+        self.assertEqual(len(changed), 3)
+
+    def test_fragments_streamed_with_chapter_spans(self):
+        """Fragments are yielded lazily and timed per chapter."""
+        book, _ = self._generate("book")
+        book.timer = BuildTimer(enabled=True)
+        _, jobs = book._docx_chapter_jobs(0)
+        fragments = book._docx_chapter_fragments(jobs)
+        self.assertTrue(inspect.isgenerator(fragments))
+        self.assertEqual(len(list(fragments)), 3)
+
+        self.assertEqual(book.timer.durations("chapter"), {})
+        with open(self.files[0], "a", encoding="utf-8") as f:
+            f.write("\nMore.\n")
+        book = Book(
+            self.book_dir,
+            output_dir=book.output_dir,
+            scratch_dir=book.scratch_dir,
+        )
+        book.timer = BuildTimer(enabled=True)
+        _, jobs = book._docx_chapter_jobs(0)
+        list(book._docx_chapter_fragments(jobs))
+        spans = [s for s in book.timer.spans if s["category"] == "chapter"]
+        self.assertEqual([s["name"] for s in spans], ["C"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Test cases for in-memory edits and incremental rebuilds.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from md_to_latex.core.TypesettingProfile import TypesettingProfile
+from tests.helpers import FakePdflatex, open_book, write_book
+
+
+class TestBookEditMixin(unittest.TestCase):
+    """Test BookEditMixin."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.book_dir = write_book(
+            os.path.join(self.temp_dir, "book"),
+            {
+                f"part-1-intro/{name}/{segment}": (
+                    f"Text of {name} {segment}.\n"
+                )
+                for name in ("chapter-01-first", "chapter-02-second")
+                for segment in ("001.md", "002.md")
+            },
+        )
+        self.pdflatex = FakePdflatex()
+        self.book = open_book(
+            self.book_dir,
+            self.pdflatex,
+            scratch_dir=os.path.join(self.temp_dir, "scratch"),
+        )
+        self.first, self.second = self.book.parts[0].chapters
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_update_segment(self):
+        """Only the edited chapter's text, LaTeX and word count change."""
+        first_latex = self.first._latex_segments()
+        second_latex = self.second._latex_segments()
+        self.assertIs(self.first._latex_segments(), first_latex)
+        chapter = self.book.update_segment(
+            "part-1-intro/chapter-02-second/002.md", "Edited **here** now.\n"
+        )
+        self.assertIs(chapter, self.second)
+        self.assertEqual(
+            chapter.content,
+            "Text of chapter-02-second 001.md.\nEdited **here** now.\n",
+        )
+        self.assertEqual(chapter.word_count, 7)
+        self.assertIsNot(chapter._latex_segments(), second_latex)
+        self.assertIn(r"\textbf{here}", chapter._latex_segments()[1][2])
+        self.assertIs(self.first._latex_segments(), first_latex)
+        with open(chapter._md_files[1], encoding="utf-8") as f:
+            self.assertEqual(f.read(), "Text of chapter-02-second 002.md.\n")
+
+        chapter.evict()
+        self.assertIn("Edited", chapter.content)
+        self.book.update_segment(chapter._md_files[0], "Absolute.\n")
+        self.assertTrue(chapter.content.startswith("Absolute.\n"))
+        with self.assertRaises(ValueError):
+            self.book.update_segment("part-1-intro/missing.md", "")
+
+    def test_update_metadata(self):
+        """Metadata fields change in memory and the build key follows."""
+        key = self.book._build_key({})
+        self.book.update_metadata(title="Renamed", subtitle="Sub")
+        self.assertEqual(self.book.title, "Renamed")
+        self.assertEqual(self.book.subtitle, "Sub")
+        self.book.update_metadata(subtitle=None)
+        self.assertIsNone(self.book.subtitle)
+        self.assertNotIn("subtitle", self.book.metadata)
+        self.assertNotEqual(self.book._build_key({}), key)
+
+    def test_rebuild_preview(self):
+        """A preview rebuild compiles only the chapters edited since."""
+        self.book.preview()
+        self.assertEqual(len(self.pdflatex.runs), 2)
+        self.book.update_segment(self.first._md_files[1], "Changed.\n")
+        previews = self.book.rebuild()["preview"]
+        self.assertEqual([p["chapter"] for p in previews], ["First"])
+        self.assertFalse(previews[0]["cached"])
+        self.assertEqual(len(self.pdflatex.runs), 3)
+        self.assertEqual(self.book.rebuild(), {"preview": []})
+        with self.assertRaises(ValueError):
+            self.book.rebuild(["epub"])
+
+    def test_rebuild_docx(self):
+        """A DOCX rebuild publishes the DOCX alone, with the edit."""
+        self.book.update_segment(self.first._md_files[0], "Fresh words.\n")
+        docx_path = self.book.rebuild(["docx"])["docx"]
+        self.assertEqual(os.path.dirname(docx_path), self.book.output_dir)
+        with zipfile.ZipFile(docx_path) as docx:
+            self.assertIn(
+                b"Fresh words.", docx.read("word/document.xml")
+            )
+        self.assertEqual(self.pdflatex.runs, [])
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.book.output_dir, "manifest.json"))
+        )
+
+    def test_rebuild_docx_options(self):
+        """A DOCX rebuild takes its own options and never opens a viewer."""
+        self.book.profile = TypesettingProfile.get("draft")
+        self.book.source_date_epoch = 1700000000
+        self.book.open_outputs = True
+        calls = []
+        generate_docx = self.book._generate_docx
+
+        def recording_generate_docx(output_path, **kwargs):
+            calls.append(kwargs)
+            return generate_docx(output_path, **kwargs)
+
+        self.book._generate_docx = recording_generate_docx
+        docx_path = self.book.rebuild(
+            ["docx"], docx_compression=0, reproducible=False
+        )["docx"]
+        self.assertFalse(docx_path.endswith("-draft.docx"))
+        self.assertIsNone(self.book.source_date_epoch)
+        self.assertEqual(
+            calls, [{"compression_level": 0, "open_output": False}]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Test cases for pdflatex output parsing.
+"""
+
+import unittest
+
+from md_to_latex.core.LatexCompileError import LatexCompileError
+from md_to_latex.core.LatexLogParser import LatexLogParser
+
+FILE_LINE_OUTPUT = """This is pdfTeX, Version 3.141592653-2.6-1.40.25
+(./the-example-novel.tex
+LaTeX2e <2023-11-01>
+./the-example-novel.tex:214: Undefined control sequence.
+l.214 He said \\foo
+                   bar.
+./the-example-novel.tex:300: Missing $ inserted.
+<inserted text>
+                $
+l.300 Price is 5^
+                 2.
+"""
+
+CLASSIC_OUTPUT = """(./book.tex
+! LaTeX Error: Environment foo undefined.
+
+See the LaTeX manual or LaTeX Companion for explanation.
+l.12 \\begin{foo}
+
+!  ==> Fatal error occurred, no output PDF file produced!
+"""
+
+
+class TestLatexLogParser(unittest.TestCase):
+    """Test LatexLogParser."""
+
+    def test_file_line_errors(self):
+        """-file-line-error output yields file, line and context."""
+        errors = LatexLogParser.parse(FILE_LINE_OUTPUT)
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(errors[0].file, "./the-example-novel.tex")
+        self.assertEqual(errors[0].line, 214)
+        self.assertEqual(errors[0].message, "Undefined control sequence.")
+        self.assertEqual(errors[0].context, "He said \\foo")
+        self.assertEqual(errors[1].line, 300)
+
+    def test_classic_errors(self):
+        """Classic "!" errors take their line from "l.<n>"."""
+        errors = LatexLogParser.parse(CLASSIC_OUTPUT)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(
+            errors[0].message, "LaTeX Error: Environment foo undefined."
+        )
+        self.assertEqual(errors[0].line, 12)
+        self.assertIsNone(errors[0].file)
+
+    def test_feed_reports_error_when_complete(self):
+        """feed() returns the error once its context line arrives."""
+        parser = LatexLogParser()
+        lines = FILE_LINE_OUTPUT.splitlines()
+        completed = [parser.feed(line) for line in lines[:5]]
+        self.assertIsNone(completed[3])
+        self.assertEqual(completed[4].line, 214)
+
+    def test_close_flushes_pending(self):
+        """An error without a context line is returned by close()."""
+        parser = LatexLogParser()
+        parser.feed("./book.tex:7: Emergency stop.")
+        self.assertEqual(parser.close().line, 7)
+        self.assertEqual(len(parser.errors), 1)
+
+    def test_no_errors(self):
+        """Clean output yields no errors."""
+        self.assertEqual(
+            LatexLogParser.parse("Output written on book.pdf (3 pages)."),
+            [],
+        )
+
+
+class TestLatexCompileError(unittest.TestCase):
+    """Test LatexCompileError."""
+
+    def test_message_includes_first_error(self):
+        """The message names the first parsed error."""
+        errors = LatexLogParser.parse(FILE_LINE_OUTPUT)
+        error = LatexCompileError(1, errors)
+        self.assertIsInstance(error, RuntimeError)
+        self.assertIn("return code 1", str(error))
+        self.assertIn("the-example-novel.tex:214", str(error))
+
+
+if __name__ == "__main__":
+    unittest.main()
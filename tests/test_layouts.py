@@ -0,0 +1,103 @@
+"""
+Test cases for layout profiles and multi-variant builds.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from md_to_latex.core.Book import Book
+from md_to_latex.core.LayoutProfile import LAYOUTS, LayoutProfile
+from md_to_latex.core.SourceMap import SourceMap
+
+
+def _body(tex_path):
+    with open(tex_path, "r", encoding="utf-8") as f:
+        return f.read().split(r"\begin{document}", 1)[1]
+
+
+class TestLayoutProfile(unittest.TestCase):
+    """Test LayoutProfile and variant builds."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        chapter_dir = os.path.join(
+            self.temp_dir, "part-1-intro", "chapter-01-start"
+        )
+        os.makedirs(chapter_dir)
+        with open(
+            os.path.join(chapter_dir, "001.md"), "w", encoding="utf-8"
+        ) as f:
+            f.write("# Start\n\nSome **text**.\n\nMore text.\n")
+        self.output_dir = os.path.join(self.temp_dir, "out")
+        self.book = Book(self.temp_dir, output_dir=self.output_dir)
+        self.book.open_outputs = False
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_get(self):
+        """Layouts come from names, dicts or instances."""
+        trade = LayoutProfile.get("trade-6x9")
+        self.assertIs(trade, LAYOUTS["trade-6x9"])
+        self.assertIs(LayoutProfile.get(trade), trade)
+        custom = LayoutProfile.get({"name": "a5", "paper": "a5paper"})
+        self.assertEqual(custom.class_options, ["a5paper", "twoside", "12pt"])
+        with self.assertRaises(ValueError):
+            LayoutProfile.get("poster")
+
+    def test_default_layout_preamble(self):
+        """The default layout keeps the A4 double-spaced manuscript."""
+        latex = self.book._new_document().dumps()
+        self.assertIn(r"\documentclass[a4paper,twoside,12pt]{book}", latex)
+        self.assertIn("margin=1in", latex)
+        self.assertIn(r"\doublespacing", latex)
+
+    def test_layout_preambles(self):
+        """Trade and letter layouts set their own paper and spacing."""
+        trade = self.book._new_document(layout=LAYOUTS["trade-6x9"]).dumps()
+        self.assertIn(r"\documentclass[twoside,11pt]{book}", trade)
+        self.assertIn("paperwidth=6in", trade)
+        self.assertIn(r"\singlespacing", trade)
+        letter = self.book._new_document(
+            layout=LAYOUTS["letter-single"]
+        ).dumps()
+        self.assertIn("letterpaper,oneside", letter)
+
+    def test_build_variants_share_body(self):
+        """Every variant embeds the same body, rendered once."""
+        result = self.book.build(
+            layouts=["a4-manuscript", "trade-6x9", "letter-single"]
+        )
+        paths = [variant["tex_path"] for variant in result.variants]
+        base = paths[0][: -len(".tex")]
+        self.assertEqual(
+            paths, [f"{base}.tex", f"{base}-6x9.tex", f"{base}-letter.tex"]
+        )
+        bodies = {_body(path) for path in paths}
+        self.assertEqual(len(bodies), 1)
+
+    def test_variant_source_maps(self):
+        """Each variant's .texmap.json locates lines in its own .tex."""
+        result = self.book.build(layouts=["trade-6x9", "letter-single"])
+        for variant in result.variants:
+            tex_path = variant["tex_path"]
+            source_map = SourceMap.load(
+                f"{tex_path[:-4]}.texmap.json", self.temp_dir
+            )
+            with open(tex_path, "r", encoding="utf-8") as f:
+                lines = f.read().split("\n")
+            number = lines.index("More text.") + 1
+            self.assertEqual(source_map.lookup(number)[1], 5)
+
+    def test_duplicate_suffix(self):
+        """Two layouts writing the same file are rejected."""
+        with self.assertRaises(ValueError):
+            self.book.build(layouts=["trade-6x9", LAYOUTS["trade-6x9"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
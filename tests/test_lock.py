@@ -0,0 +1,111 @@
+"""
+Test cases for per-book build locking and deduplication.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from tests.helpers import FakePdflatex, open_book, write_book
+
+
+class TestBookLockMixin(unittest.TestCase):
+    """Test BookLockMixin."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.book_dir = write_book(
+            os.path.join(self.temp_dir, "book"),
+            {"part-1-intro/chapter-01-a/001.md": "Some text.\n"},
+        )
+        self.release = threading.Event()
+        self.release.set()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _book(self):
+        """A Book whose pdflatex runs wait for self.release."""
+        return open_book(
+            self.book_dir,
+            FakePdflatex(release=self.release),
+            output_dir=os.path.join(self.temp_dir, "out"),
+        )
+
+    def _build_in_thread(self, book, results, **kwargs):
+        def run():
+            results[book] = book.build(**kwargs)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def _wait_for(self, condition):
+        deadline = time.time() + 5
+        while not condition() and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_builds_wait_for_the_lock(self):
+        """A second builder waits until the first releases the lock."""
+        first, second = self._book(), self._book()
+        results = {}
+        self.release.clear()
+        threads = [self._build_in_thread(first, results)]
+        self._wait_for(lambda: first._run_pdflatex.runs)
+        threads.append(
+            self._build_in_thread(second, results, profile="draft")
+        )
+        time.sleep(0.2)
+        self.assertFalse(second._run_pdflatex.runs)
+
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertTrue(second._run_pdflatex.runs)
+        self.assertFalse(results[second].shared)
+
+    def test_identical_waiting_build_reuses_result(self):
+        """An identical build that waited returns the first one's result."""
+        first, second = self._book(), self._book()
+        results = {}
+        self.release.clear()
+        threads = [self._build_in_thread(first, results)]
+        self._wait_for(lambda: first._run_pdflatex.runs)
+        threads.append(self._build_in_thread(second, results))
+        time.sleep(0.2)
+
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertFalse(second._run_pdflatex.runs)
+        self.assertTrue(results[second].shared)
+        self.assertEqual(results[second].pdf_path, results[first].pdf_path)
+
+    def test_sequential_builds_are_not_shared(self):
+        """Only builds that finished after the request are reused."""
+        book = self._book()
+        book.build()
+        runs = len(book._run_pdflatex.runs)
+        self.assertFalse(book.build().shared)
+        self.assertGreater(len(book._run_pdflatex.runs), runs)
+
+    def test_build_key(self):
+        """The key changes with the options and with the book's files."""
+        book = self._book()
+        key = book._build_key({"profile": "production"})
+        self.assertEqual(key, book._build_key({"profile": "production"}))
+        self.assertNotEqual(key, book._build_key({"profile": "draft"}))
+        with open(
+            os.path.join(self.book_dir, "metadata.json"), "w", encoding="utf-8"
+        ) as f:
+            f.write("{}")
+        self.assertNotEqual(key, book._build_key({"profile": "production"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
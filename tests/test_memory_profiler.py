@@ -0,0 +1,131 @@
+"""
+Test cases for per-stage memory accounting.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+import unittest
+from types import SimpleNamespace
+
+from md_to_latex.core.Book import Book
+from md_to_latex.core.MemoryProfiler import MemoryProfiler
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    """Test MemoryProfiler stage records."""
+
+    def test_disabled_does_not_trace(self):
+        """A disabled profiler never starts tracemalloc."""
+        profiler = MemoryProfiler()
+        with profiler.stage("convert"):
+            pass
+        self.assertEqual(profiler.stages, [])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_stage_records_heap_peak(self):
+        """The heap peak covers allocations freed inside the stage."""
+        profiler = MemoryProfiler(enabled=True)
+        with profiler.stage("convert"):
+            blob = bytearray(4 * 1024 * 1024)
+            del blob
+        profiler.stop()
+
+        record = profiler.stages[0]
+        self.assertEqual(record["stage"], "convert")
+        self.assertGreaterEqual(record["heap_peak"], 4 * 1024 * 1024)
+        self.assertLess(record["heap_delta"], 1024 * 1024)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_child_stage_records_child_rss(self):
+        """Stages wrapping subprocesses report the child peak RSS."""
+        profiler = MemoryProfiler(enabled=True)
+        with profiler.stage("compile_pdf", child=True):
+            pass
+        profiler.stop()
+        self.assertIn("child_rss_peak", profiler.stages[0])
+        self.assertIsNone(profiler.stages[0]["child_rss_peak"])
+
+    def test_child_rss_is_per_stage(self):
+        """Only the children reported within a stage count towards it."""
+        profiler = MemoryProfiler(enabled=True)
+        with profiler.stage("generate_docx"):
+            profiler.child_exited(SimpleNamespace(ru_maxrss=900))
+        with profiler.stage("compile_pdf", child=True):
+            profiler.child_exited(SimpleNamespace(ru_maxrss=300))
+            profiler.child_exited(SimpleNamespace(ru_maxrss=200))
+        profiler.stop()
+        scale = 1 if sys.platform == "darwin" else 1024
+        self.assertEqual(profiler.stages[1]["child_rss_peak"], 300 * scale)
+
+
+class TestBookMemoryProfile(unittest.TestCase):
+    """Test memory records produced by Book.build()."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.book_dir = os.path.join(self.temp_dir, "book")
+        ch_dir = os.path.join(
+            self.book_dir, "part-1-intro", "chapter-01-start"
+        )
+        os.makedirs(ch_dir)
+        with open(os.path.join(ch_dir, "001.md"), "w", encoding="utf-8") as f:
+            f.write("# Start\n\nSome content^[A note.].")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_build_reports_stages(self):
+        """All build stages appear in the memory report."""
+        result = Book(self.book_dir, profile_memory=True).build()
+        stages = [record["stage"] for record in result.memory]
+        self.assertEqual(
+            stages,
+            [
+                "load",
+                "convert",
+                "generate_tex",
+                "compile_pdf",
+                "generate_docx",
+            ],
+        )
+        self.assertEqual(result.to_dict()["memory"], result.memory)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_each_build_reports_its_own_stages(self):
+        """A second build does not repeat the first build's stages."""
+        book = Book(self.book_dir, profile_memory=True)
+        first = book.build()
+        second = book.build()
+        self.assertEqual(
+            [record["stage"] for record in second.memory],
+            [record["stage"] for record in first.memory],
+        )
+        self.assertIsNot(second.memory, first.memory)
+
+    @unittest.skipUnless(hasattr(os, "wait4"), "needs os.wait4")
+    def test_wait_pdflatex_reports_the_process(self):
+        """Waiting for pdflatex keeps its exit status and notes its RSS."""
+        book = Book(self.book_dir, profile_memory=True)
+        with book.memory.stage("compile_pdf", child=True):
+            process = subprocess.Popen(
+                [sys.executable, "-c", "raise SystemExit(3)"]
+            )
+            self.assertEqual(book._wait_pdflatex(process), 3)
+        book.memory.stop()
+        self.assertEqual(process.returncode, 3)
+        self.assertGreater(book.memory.stages[-1]["child_rss_peak"], 0)
+
+    def test_build_without_profile(self):
+        """Memory profiling is off by default."""
+        result = Book(self.book_dir).build()
+        self.assertEqual(result.memory, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
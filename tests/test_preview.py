@@ -0,0 +1,98 @@
+"""
+Test cases for standalone chapter preview PDFs.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from md_to_latex.core.LatexError import LatexError
+from tests.helpers import FakePdflatex, open_book, write_book
+
+
+class TestBookPreviewMixin(unittest.TestCase):
+    """Test BookPreviewMixin."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = write_book(
+            tempfile.mkdtemp(),
+            {
+                f"part-1-intro/{name}/001.md": f"Text of {name}.\n"
+                for name in ("chapter-01-first", "chapter-02-second")
+            },
+        )
+        self.output_dir = os.path.join(self.temp_dir, "out")
+        self.pdflatex = FakePdflatex()
+        self.book = open_book(
+            self.temp_dir, self.pdflatex, output_dir=self.output_dir
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_select_chapters(self):
+        """Chapters are selected by number, title or object."""
+        second = self.book.parts[0].chapters[1]
+        selected = self.book._select_chapters([2, "first", second])
+        self.assertEqual([n for n, _ in selected], [2, 1, 2])
+        for wanted in ([3], ["missing"]):
+            with self.assertRaises(ValueError):
+                self.book._select_chapters(wanted)
+
+    def test_preview_document(self):
+        """Previews keep the book preamble and the chapter number."""
+        chapter = self.book.parts[0].chapters[1]
+        latex = self.book._preview_document(2, chapter).dumps()
+        self.assertIn("ebgaramond", latex)
+        self.assertIn(r"\fancyhead", latex)
+        self.assertIn(r"\setcounter{chapter}{1}", latex)
+        self.assertIn(r"\chapter{Second}", latex)
+        self.assertNotIn(r"\tableofcontents", latex)
+
+    def test_preview_compiles_and_caches(self):
+        """Unchanged chapters are served from the cache."""
+        previews = self.book.preview()
+        self.assertEqual(len(self.pdflatex.runs), 2)
+        self.assertFalse(any(p["cached"] for p in previews))
+        self.assertTrue(all(os.path.isfile(p["pdf_path"]) for p in previews))
+
+        previews = self.book.preview([1, 2])
+        self.assertEqual(len(self.pdflatex.runs), 2)
+        self.assertTrue(all(p["cached"] for p in previews))
+
+    def test_changed_chapter_recompiles(self):
+        """Editing a chapter invalidates only its own preview."""
+        self.book.preview()
+        with open(
+            os.path.join(
+                self.temp_dir, "part-1-intro", "chapter-01-first", "001.md"
+            ),
+            "a",
+            encoding="utf-8",
+        ) as f:
+            f.write("More text.\n")
+        book = open_book(
+            self.temp_dir, self.pdflatex, output_dir=self.output_dir
+        )
+        previews = book.preview()
+        self.assertEqual([p["cached"] for p in previews], [False, True])
+        self.assertEqual(len(self.pdflatex.runs), 3)
+
+
+    def test_failed_preview_without_log_errors(self):
+        """A nonzero exit with nothing parsed is reported as a LatexError."""
+        self.book._run_pdflatex = FakePdflatex(returncode=1)
+        previews = self.book.preview([1])
+        self.assertIsNone(previews[0]["pdf_path"])
+        errors = previews[0]["errors"]
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], LatexError)
+        self.assertEqual(errors[0].message, "pdflatex exited with status 1")
+        self.assertIn("status 1", str(errors[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
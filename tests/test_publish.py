@@ -0,0 +1,160 @@
+"""
+Test cases for scratch-directory builds and atomic publishing.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from md_to_latex.core.Book import Book
+from md_to_latex.core.BookLockMixin import LOCK_DIR
+from tests.helpers import FakePdflatex, open_book, write_book
+
+
+class TestBookPublishMixin(unittest.TestCase):
+    """Test BookPublishMixin."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.book_dir = write_book(
+            os.path.join(self.temp_dir, "book"),
+            {"part-1-intro/chapter-01-a/001.md": "Some text.\n"},
+        )
+        self.output_dir = os.path.join(self.temp_dir, "published")
+        self.scratch_dir = os.path.join(self.temp_dir, "scratch")
+        self.pdflatex = FakePdflatex(
+            extensions=(".aux", ".log", ".toc", ".out", ".pdf")
+        )
+        self.book = open_book(
+            self.book_dir,
+            self.pdflatex,
+            output_dir=self.output_dir,
+            scratch_dir=self.scratch_dir,
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_default_output_dir(self):
+        """Without output_dir, files go to <book_dir>.compiled."""
+        book = Book(self.book_dir)
+        self.assertEqual(book.output_dir, f"{self.book_dir}.compiled")
+        self.assertIsNone(book.scratch_dir)
+
+    def test_build_publishes_outputs(self):
+        """pdflatex runs in scratch; only final files are published."""
+        result = self.book.build()
+        self.assertTrue(self.pdflatex.runs)
+        for tex_dir, _, _ in self.pdflatex.runs:
+            self.assertEqual(
+                os.path.dirname(tex_dir), os.path.abspath(self.scratch_dir)
+            )
+        self.assertEqual(
+            sorted(os.listdir(self.output_dir)),
+            [
+                "book.docx",
+                "book.pdf",
+                "book.tex",
+                "book.texmap.json",
+                "manifest.json",
+            ],
+        )
+        self.assertEqual(
+            result.pdf_path, os.path.join(self.output_dir, "book.pdf")
+        )
+        self.assertEqual(
+            result.tex_path, os.path.join(self.output_dir, "book.tex")
+        )
+        # Only the caches and the build lock outlive a build in
+        # scratch_dir
+        self.assertEqual(
+            sorted(os.listdir(self.scratch_dir)),
+            sorted(
+                [LOCK_DIR]
+                + [
+                    os.path.basename(self.book._cache_dir(name))
+                    for name in ("docx_fragments", "model")
+                ]
+            ),
+        )
+
+    def test_unchanged_outputs_left_untouched(self):
+        """Identical outputs keep their mtime; changed ones are replaced."""
+        self.book.build()
+        tex_path = os.path.join(self.output_dir, "book.tex")
+        pdf_path = os.path.join(self.output_dir, "book.pdf")
+        for path in (tex_path, pdf_path):
+            os.utime(path, (1, 1))
+        self.book.build()
+        self.assertEqual(os.path.getmtime(tex_path), 1)
+        self.assertFalse(self.book._artifacts["book.tex"]["changed"])
+
+        self.book.title = "Renamed"
+        result = self.book.build()
+        self.assertTrue(result.artifacts["renamed.tex"]["changed"])
+
+    def test_manifest(self):
+        """The manifest lists the digest of every published artifact."""
+        result = self.book.build()
+        with open(result.manifest_path, "r", encoding="utf-8") as f:
+            artifacts = json.load(f)["artifacts"]
+        self.assertIn("book.docx", artifacts)
+        pdf_path = os.path.join(self.output_dir, "book.pdf")
+        self.assertEqual(
+            artifacts["book.pdf"],
+            {
+                "sha256": self.book._file_digest(pdf_path),
+                "size": os.path.getsize(pdf_path),
+            },
+        )
+
+        # Entries of earlier builds stay while their files exist
+        os.remove(os.path.join(self.output_dir, "book.docx"))
+        self.book.title = "Renamed"
+        self.book.build()
+        with open(result.manifest_path, "r", encoding="utf-8") as f:
+            artifacts = json.load(f)["artifacts"]
+        self.assertIn("renamed.pdf", artifacts)
+        self.assertIn("book.pdf", artifacts)
+        self.assertNotIn("book.docx", artifacts)
+
+    def test_copy_replace(self):
+        """Copies across file systems replace the target in one rename."""
+        os.makedirs(self.output_dir)
+        source = os.path.join(self.temp_dir, "book.pdf")
+        target = os.path.join(self.output_dir, "book.pdf")
+        with open(source, "wb") as f:
+            f.write(b"new")
+        with open(target, "wb") as f:
+            f.write(b"old")
+        self.book._copy_replace(source, target)
+        with open(target, "rb") as f:
+            self.assertEqual(f.read(), b"new")
+        self.assertFalse(os.path.exists(source))
+        self.assertEqual(os.listdir(self.output_dir), ["book.pdf"])
+
+    def test_publish_in_place(self):
+        """Files already in the output directory are left where they are."""
+        os.makedirs(self.output_dir)
+        path = os.path.join(self.output_dir, "book.docx")
+        with open(path, "wb") as f:
+            f.write(b"docx")
+        self.assertEqual(self.book._publish(path), path)
+        self.assertTrue(os.path.isfile(path))
+
+    def test_preview_publishes_pdf_only(self):
+        """Previews compile in scratch and publish just the PDF."""
+        previews = self.book.preview()
+        self.assertTrue(os.path.isfile(previews[0]["pdf_path"]))
+        self.assertEqual(
+            sorted(os.listdir(self.book.preview_dir)),
+            ["chapter-001-a.pdf", "previews.json"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+"""
+Test cases for the registry of loaded books.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from md_to_latex.core.Book import Book
+from md_to_latex.core.BookRegistry import BookRegistry
+from md_to_latex.storage.MemoryStorage import MemoryStorage
+
+
+class TestBookRegistry(unittest.TestCase):
+    """Test BookRegistry and Book.open()."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.scratch_dir = os.path.join(self.temp_dir, "scratch")
+        self.book_dir = self._write_book("book")
+        self.registry = BookRegistry()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        Book.registry.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, book_dir, rel_path, content):
+        path = os.path.join(book_dir, *rel_path.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def _write_book(self, name):
+        book_dir = os.path.join(self.temp_dir, name)
+        self._write(book_dir, "metadata.json", '{"title": "Reg"}')
+        self._write(book_dir, "part-1-a/chapter-01-x/001.md", "# X\n\nOne.\n")
+        self._write(book_dir, "part-1-a/chapter-01-x/002.md", "Two.\n")
+        self._write(book_dir, "part-1-a/chapter-02-y/001.md", "# Y\n\nY.\n")
+        return book_dir
+
+    def _open(self, book_dir=None):
+        return self.registry.open(
+            Book, book_dir or self.book_dir, scratch_dir=self.scratch_dir
+        )
+
+    def test_unchanged_book_is_reused(self):
+        """An unchanged book is returned from the registry."""
+        book = self._open()
+        self.assertIs(self._open(), book)
+        self.assertEqual(len(self.registry), 1)
+
+    def test_edited_chapter_is_refreshed(self):
+        """Only the chapter whose file was edited is re-read."""
+        book = self._open()
+        first, second = book.parts[0].chapters
+        second_content = second.content
+        self._write(
+            self.book_dir, "part-1-a/chapter-01-x/002.md", "Two, edited.\n"
+        )
+        self.assertIs(self._open(), book)
+        self.assertEqual(first.content, "# X\n\nOne.\nTwo, edited.\n")
+        self.assertEqual(first.word_count, 5)
+        self.assertIs(second.content, second_content)
+        self.assertIs(self._open(), book)
+
+    def test_disk_change_replaces_edits(self):
+        """A refreshed chapter drops its in-memory edits."""
+        book = self._open()
+        unchanged_key = book._build_key({})
+        book.update_segment(
+            "part-1-a/chapter-01-x/001.md", "# X\n\nNew.\n"
+        )
+        self.assertNotEqual(book._build_key({}), unchanged_key)
+        self._write(
+            self.book_dir, "part-1-a/chapter-01-x/002.md", "Two, saved.\n"
+        )
+        self.assertIs(self._open(), book)
+        first = book.parts[0].chapters[0]
+        self.assertEqual(first.content, "# X\n\nOne.\nTwo, saved.\n")
+        self.assertEqual(book._edits, {})
+        self.assertEqual(
+            book._build_key({}), Book(self.book_dir)._build_key({})
+        )
+
+    def test_structural_changes_reload(self):
+        """New files and metadata edits load the book again."""
+        book = self._open()
+        self._write(self.book_dir, "part-1-a/chapter-02-y/002.md", "More.\n")
+        reloaded = self._open()
+        self.assertIsNot(reloaded, book)
+        self.assertEqual(len(reloaded.parts[0].chapters[1]._md_files), 2)
+
+        self._write(self.book_dir, "metadata.json", '{"title": "New"}')
+        self.assertEqual(self._open().title, "New")
+
+    def test_memory_cap_evicts_least_recently_used(self):
+        """Books beyond the memory cap are dropped oldest first."""
+        other_dir = self._write_book("other")
+        book = self._open()
+        self.registry.max_bytes = book._resident_bytes() + 1
+        other = self._open(other_dir)
+        self.assertEqual(len(self.registry), 1)
+        self.assertIs(self._open(other_dir), other)
+        self.assertIsNot(self._open(), book)
+
+    def test_loads_run_outside_the_registry_lock(self):
+        """A slow load blocks neither other books nor the same book."""
+        slow_dir = self._write_book("slow")
+        other_dir = self._write_book("other")
+        started, release = threading.Event(), threading.Event()
+
+        class SlowBook(Book):
+            @classmethod
+            def _open_storage(cls, book_dir):
+                if book_dir == slow_dir:
+                    started.set()
+                    release.wait(5)
+                return super()._open_storage(book_dir)
+
+        opened = []
+
+        def open_slow():
+            opened.append(self.registry.open(SlowBook, slow_dir))
+
+        threads = [threading.Thread(target=open_slow) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(started.wait(5))
+        self.registry.open(SlowBook, other_dir)
+        self.assertEqual(len(self.registry), 1)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(opened), 2)
+        self.assertIs(opened[0], opened[1])
+
+    def test_trimmed_book_keeps_its_lock_while_opened(self):
+        """A book dropped from the cache mid-open still loads only once."""
+        other_dir = self._write_book("other")
+        registry = BookRegistry(max_bytes=0)
+        registry.open(Book, self.book_dir)
+        started, release = threading.Event(), threading.Event()
+        self.addCleanup(release.set)
+        entered = []
+
+        class SlowBook(Book):
+            @classmethod
+            def _open_storage(cls, book_dir):
+                if book_dir == self.book_dir:
+                    entered.append(book_dir)
+                    started.set()
+                    release.wait(5)
+                return super()._open_storage(book_dir)
+
+        threads = [
+            threading.Thread(
+                target=registry.open, args=(SlowBook, self.book_dir)
+            )
+        ]
+        threads[0].start()
+        self.assertTrue(started.wait(5))
+        # Trims the first book while its open is in progress
+        registry.open(SlowBook, other_dir)
+        threads.append(
+            threading.Thread(
+                target=registry.open, args=(SlowBook, self.book_dir)
+            )
+        )
+        threads[1].start()
+        threads[1].join(0.5)
+        self.assertEqual(len(entered), 1)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(entered), 2)
+        self.assertEqual(registry._key_locks, {})
+
+    def test_unchanged_archive_keeps_its_storage_open(self):
+        """Reopening an unchanged archive closes only the new storage."""
+        archive_path = shutil.make_archive(
+            os.path.join(self.temp_dir, "book"), "zip", self.book_dir
+        )
+        book = self._open(archive_path)
+        self.assertIs(self._open(archive_path), book)
+        chapter = book.parts[0].chapters[0]
+        chapter.evict()
+        self.assertEqual(chapter.content, "# X\n\nOne.\nTwo.\n")
+
+    def test_book_open_and_storages(self):
+        """Book.open() uses the class registry; storages are not cached."""
+        book = Book.open(self.book_dir, scratch_dir=self.scratch_dir)
+        self.assertIs(
+            Book.open(self.book_dir, scratch_dir=self.scratch_dir), book
+        )
+        self.assertIsNot(Book.open(self.book_dir, snapshot=False), book)
+        storage = MemoryStorage({"chapter-01-x.md": "# X\n"})
+        self.assertIsNot(Book.open(storage), Book.open(storage))
+
+
+if __name__ == "__main__":
+    unittest.main()
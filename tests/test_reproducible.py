@@ -0,0 +1,87 @@
+"""
+Test cases for reproducible builds.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from md_to_latex.core.Book import Book
+
+EPOCH = 1700000000
+
+
+class TestReproducibleBuild(unittest.TestCase):
+    """Test reproducible PDF and DOCX output."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        chapter_dir = os.path.join(
+            self.temp_dir, "part-1-intro", "chapter-01-a"
+        )
+        os.makedirs(chapter_dir)
+        self.chapter_file = os.path.join(chapter_dir, "001.md")
+        with open(self.chapter_file, "w", encoding="utf-8") as f:
+            f.write("Some text.\n")
+        self.book = Book(self.temp_dir)
+        self.book.open_outputs = False
+        self.saved_epoch = os.environ.pop("SOURCE_DATE_EPOCH", None)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        os.environ.pop("SOURCE_DATE_EPOCH", None)
+        if self.saved_epoch is not None:
+            os.environ["SOURCE_DATE_EPOCH"] = self.saved_epoch
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        shutil.rmtree(self.book.output_dir, ignore_errors=True)
+
+    def test_resolve_source_date(self):
+        """SOURCE_DATE_EPOCH enables and pins reproducible builds."""
+        self.assertIsNone(self.book._resolve_source_date())
+        os.utime(self.chapter_file, (EPOCH, EPOCH + 5))
+        self.assertEqual(
+            self.book._resolve_source_date(reproducible=True), EPOCH + 5
+        )
+
+        os.environ["SOURCE_DATE_EPOCH"] = str(EPOCH)
+        self.assertEqual(self.book._resolve_source_date(), EPOCH)
+        self.assertIsNone(self.book._resolve_source_date(reproducible=False))
+
+        os.environ["SOURCE_DATE_EPOCH"] = "yesterday"
+        with self.assertRaises(ValueError):
+            self.book._resolve_source_date()
+
+    def test_latex_pins_date_and_trailer_id(self):
+        """The title date and PDF ID come from the source date."""
+        self.assertIn(r"\today", self.book._new_document().dumps())
+
+        self.book.source_date_epoch = EPOCH
+        latex = self.book._new_document().dumps()
+        self.assertNotIn(r"\today", latex)
+        self.assertIn("November 14, 2023", latex)
+        self.assertIn(r"\pdftrailerid{\jobname-1700000000}", latex)
+
+    def test_docx_is_byte_identical(self):
+        """DOCX core properties and zip entry times are pinned."""
+        self.book.source_date_epoch = EPOCH
+        output_dir = self.book.output_dir
+        os.makedirs(output_dir)
+        first = self.book._generate_docx(os.path.join(output_dir, "a"))
+        second = self.book._generate_docx(os.path.join(output_dir, "b"))
+        with open(first, "rb") as f1, open(second, "rb") as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+        with zipfile.ZipFile(first) as docx:
+            self.assertEqual(
+                {info.date_time for info in docx.infolist()},
+                {(2023, 11, 14, 22, 13, 20)},
+            )
+            core = docx.read("docProps/core.xml").decode("utf-8")
+        self.assertIn("2023-11-14T22:13:20Z", core)
+
+
+if __name__ == "__main__":
+    unittest.main()
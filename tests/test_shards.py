@@ -0,0 +1,210 @@
+"""
+Test cases for sharded parallel PDF compilation.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pypdf import PdfReader, PdfWriter
+
+from md_to_latex.bench import SyntheticBook
+from md_to_latex.core.Book import Book
+from md_to_latex.core.LatexLogParser import LatexLogParser
+
+
+class TestBookShardMixin(unittest.TestCase):
+    """Test BookShardMixin helpers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.book = Book(SyntheticBook("medium").write(self.temp_dir))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_shard_per_part(self):
+        """"parts" makes one shard per part, in book order."""
+        groups = self.book._shard_units("parts")
+        self.assertEqual(len(groups), 3)
+        for part, units in zip(self.book.parts, groups):
+            self.assertEqual([c for _, c in units], part.chapters)
+
+    def test_shard_count_groups_chapters(self):
+        """A shard count splits all chapters into contiguous groups."""
+        groups = self.book._shard_units(4)
+        self.assertEqual(len(groups), 4)
+        chapters = [c for units in groups for _, c in units]
+        self.assertEqual(chapters, self.book._all_chapters())
+        self.assertTrue(all(groups))
+
+    def test_shard_count_capped_by_chapters(self):
+        """More shards than chapters gives one chapter per shard."""
+        self.assertEqual(len(self.book._shard_units("100")), 18)
+
+    def test_invalid_shards(self):
+        """Invalid shard settings are rejected."""
+        for shards in ("many", 0):
+            with self.assertRaises(ValueError):
+                self.book._shard_units(shards)
+
+    def test_shard_counters_continue(self):
+        """Each shard starts from the chapters and parts before it."""
+        groups = self.book._shard_units(4)
+        counters = self.book._shard_counters(groups)
+        self.assertEqual(counters[0], (0, 0))
+        chapters_before = len(groups[0]) + len(groups[1])
+        self.assertEqual(counters[2][0], chapters_before)
+        self.assertEqual(
+            counters[2][1], len({id(p) for g in groups[:2] for p, _ in g})
+        )
+
+    def test_shard_documents(self):
+        """Only shard 0 has front matter; later shards input counters."""
+        groups = self.book._shard_units(4)
+        first = self.book._shard_document(0, groups[0]).dumps()
+        self.assertIn(r"\tableofcontents", first)
+        self.assertIn(r"\mdtolatexrecordshardend", first)
+
+        second = self.book._shard_document(1, groups[1]).dumps()
+        self.assertNotIn(r"\tableofcontents", second)
+        self.assertIn(r"\input{shard-001-start}", second)
+        # A part heading only opens the shard holding its first chapter
+        starts_part = any(
+            part.chapters[0] is chapter for part, chapter in groups[1]
+        )
+        self.assertEqual(r"\part{" in second, starts_part)
+
+    def test_state_round_trip(self):
+        """Start pages come from .aux files; shard 0's .toc is merged."""
+        names = ["shard-000", "shard-001"]
+        with open(os.path.join(self.temp_dir, "shard-000.aux"), "w") as f:
+            f.write("\\relax\n\\mdtolatexshardend{41}\n")
+        for name in names:
+            with open(os.path.join(self.temp_dir, f"{name}.toc"), "w") as f:
+                f.write(f"\\contentsline {{chapter}}{{{name}}}{{1}}\n")
+
+        state = self.book._shard_state(self.temp_dir, names)
+        self.assertEqual(state[0], [None, 41])
+        self.book._write_shard_state(self.temp_dir, names, [(0, 0)] * 2, state)
+        with open(os.path.join(self.temp_dir, "shard-001-start.tex")) as f:
+            self.assertIn(r"\setcounter{page}{41}", f.read())
+        with open(os.path.join(self.temp_dir, "shard-000.toc")) as f:
+            self.assertIn("shard-001", f.read())
+        # Merged entries are not mistaken for shard 0's own next time
+        again = self.book._shard_state(self.temp_dir, names)
+        self.assertEqual(again, state)
+
+    def test_work_dir_without_scratch_dir(self):
+        """Without a scratch_dir, shards are compiled next to the build."""
+        output_path = os.path.join(self.temp_dir, "build", "book")
+        self.assertEqual(
+            self.book._shard_work_dir(output_path), f"{output_path}-shards"
+        )
+
+    def test_start_pages_settle_across_shards(self):
+        """Every shard's start page follows all earlier page counts."""
+        pages = {}
+
+        def fake_pdflatex(
+            tex_dir, tex_filename, fail_fast=False, draftmode=False
+        ):
+            name = os.path.splitext(tex_filename)[0]
+            start = self.book._read_shard_start(
+                os.path.join(tex_dir, f"{name}-start.tex")
+            )
+            if name == "shard-000":
+                start = 1
+            with open(os.path.join(tex_dir, f"{name}.aux"), "w") as f:
+                f.write(f"\\mdtolatexshardend{{{start + pages[name]}}}\n")
+            with open(os.path.join(tex_dir, f"{name}.toc"), "w") as f:
+                f.write("")
+            writer = PdfWriter()
+            for _ in range(pages[name]):
+                writer.add_blank_page(100, 100)
+            writer.write(os.path.join(tex_dir, f"{name}.pdf"))
+            return 0, LatexLogParser(tex_filename)
+
+        self.book = Book(
+            self.book.book_dir,
+            scratch_dir=os.path.join(self.temp_dir, "scratch"),
+        )
+        self.book._run_pdflatex = fake_pdflatex
+        output_path = os.path.join(self.temp_dir, "book")
+        work_dir = self.book._shard_work_dir(output_path)
+        names = [self.book._shard_name(i) for i in range(5)]
+        for counts, starts in (
+            ([3, 4, 5, 6, 7], [4, 8, 13, 19]),
+            ([10, 4, 2, 6, 7], [11, 15, 17, 23]),
+        ):
+            pages.update(zip(names, counts))
+            self.book._compile_sharded(output_path, 5)
+            self.assertEqual(
+                [
+                    self.book._read_shard_start(
+                        os.path.join(work_dir, f"{name}-start.tex")
+                    )
+                    for name in names[1:]
+                ],
+                starts,
+            )
+            self.assertEqual(
+                PdfReader(f"{output_path}.pdf").page_labels[-1],
+                str(starts[-1] + counts[-1] - 1),
+            )
+
+    def test_stitch_pdfs(self):
+        """Stitching keeps pages, bookmarks and page labels."""
+        paths = []
+        for index, (pages, style, start) in enumerate(
+            [(3, "/r", 1), (2, "/D", 7)]
+        ):
+            writer = PdfWriter()
+            for _ in range(pages):
+                writer.add_blank_page(100, 100)
+            writer.add_outline_item(f"Chapter {index}", 0)
+            writer.set_page_label(0, pages - 1, style=style, start=start)
+            paths.append(os.path.join(self.temp_dir, f"shard-{index}.pdf"))
+            writer.write(paths[-1])
+
+        output = os.path.join(self.temp_dir, "book.pdf")
+        self.book._stitch_pdfs(paths, output)
+        reader = PdfReader(output)
+        self.assertEqual(len(reader.pages), 5)
+        self.assertEqual(
+            [item.title for item in reader.outline],
+            ["Chapter 0", "Chapter 1"],
+        )
+        self.assertEqual(reader.page_labels, ["i", "ii", "iii", "7", "8"])
+
+    def test_stitch_pdfs_reproducible(self):
+        """A pinned source date gives a byte-identical stitched PDF."""
+        paths = []
+        for index in range(2):
+            writer = PdfWriter()
+            writer.add_blank_page(100, 100)
+            writer.add_metadata(
+                {"/Title": "Book", "/CreationDate": f"D:2024010{index + 1}"}
+            )
+            paths.append(os.path.join(self.temp_dir, f"shard-{index}.pdf"))
+            writer.write(paths[-1])
+
+        outputs = []
+        for name in ("a.pdf", "b.pdf"):
+            output = os.path.join(self.temp_dir, name)
+            self.book._stitch_pdfs(paths, output, source_date_epoch=86400)
+            with open(output, "rb") as f:
+                outputs.append(f.read())
+        self.assertEqual(outputs[0], outputs[1])
+        reader = PdfReader(os.path.join(self.temp_dir, "a.pdf"))
+        self.assertEqual(reader.metadata["/Title"], "Book")
+        self.assertEqual(reader.metadata["/CreationDate"], "D:19700102000000Z")
+        self.assertEqual(reader.metadata["/ModDate"], "D:19700102000000Z")
+        self.assertIn("/ID", reader.trailer)
+
+
+if __name__ == "__main__":
+    unittest.main()
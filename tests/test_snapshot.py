@@ -0,0 +1,104 @@
+"""
+Test cases for book model snapshots.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from md_to_latex.core.Book import Book
+from md_to_latex.storage.MemoryStorage import MemoryStorage
+
+
+class TestBookSnapshotMixin(unittest.TestCase):
+    """Test BookSnapshotMixin."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.book_dir = os.path.join(self.temp_dir, "book")
+        self.part_dir = os.path.join(self.book_dir, "part-1-intro")
+        self.chapter_file = self._write(
+            "part-1-intro/chapter-01-a/001.md", "# A\n\nSome “text”.\n"
+        )
+        self._write("part-1-intro/chapter-01-a/002.md", "More.^[Note.]\n")
+        self._write("about-the-book.md", "# About\nIt is a book.\n")
+        self._write("metadata.json", '{"title": "Snap", "year": 2024}')
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, rel_path, content):
+        path = os.path.join(self.book_dir, *rel_path.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def _open(self, **kwargs):
+        return Book(
+            self.book_dir,
+            scratch_dir=os.path.join(self.temp_dir, "scratch"),
+            **kwargs,
+        )
+
+    def test_reopen_restores_model(self):
+        """An unchanged book reopens from its snapshot with equal model."""
+        first = self._open()
+        self.assertFalse(first.from_snapshot)
+        second = self._open()
+        self.assertTrue(second.from_snapshot)
+        self.assertEqual(second._model_dict(), first._model_dict())
+        self.assertEqual(second.title, "Snap")
+        self.assertEqual(second.year, 2024)
+        chapter = second.parts[0].chapters[0]
+        self.assertEqual(
+            chapter._md_files, first.parts[0].chapters[0]._md_files
+        )
+        self.assertEqual(
+            [text for _, text in chapter._content_segments()],
+            ["# A\n\nSome “text”.\n", "More.^[Note.]\n"],
+        )
+        self.assertIs(chapter.storage, second.storage)
+
+    def test_changes_invalidate_snapshot(self):
+        """Edited files and new directories force a full load."""
+        self._open()
+        self._write("part-1-intro/chapter-01-a/001.md", "# A\n\nEdited.\n")
+        book = self._open()
+        self.assertFalse(book.from_snapshot)
+        self.assertIn("Edited.", book.parts[0].chapters[0].content)
+        self.assertTrue(self._open().from_snapshot)
+
+        os.makedirs(os.path.join(self.part_dir, "chapter-02-empty"))
+        book = self._open()
+        self.assertFalse(book.from_snapshot)
+        self.assertEqual(len(book.parts[0].chapters), 2)
+
+    def test_opting_out(self):
+        """
+        snapshot=False, books without a scratch_dir and in-memory books
+        always load in full.
+        """
+        self._open()
+        self.assertFalse(self._open(snapshot=False).from_snapshot)
+        self.assertFalse(Book(self.book_dir).from_snapshot)
+        files = {"chapter-01-x.md": "# X\n"}
+        Book(MemoryStorage(files))
+        self.assertFalse(Book(MemoryStorage(files)).from_snapshot)
+
+    def test_corrupt_snapshot_is_ignored(self):
+        """A damaged snapshot is replaced by a full load."""
+        book = self._open()
+        with open(book._snapshot_path(), "wb") as f:
+            f.write(b"{not json")
+        book = self._open()
+        self.assertFalse(book.from_snapshot)
+        self.assertEqual(book.title, "Snap")
+        self.assertTrue(self._open().from_snapshot)
+
+
+if __name__ == "__main__":
+    unittest.main()
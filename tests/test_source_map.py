@@ -0,0 +1,140 @@
+"""
+Test cases for mapping generated .tex lines back to markdown segments.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from md_to_latex.core.Book import Book
+from md_to_latex.core.SourceMap import SourceMap
+
+
+class TestSourceMap(unittest.TestCase):
+    """Test SourceMap."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        chapter_dir = os.path.join(
+            self.temp_dir, "part-1-intro", "chapter-01-start"
+        )
+        os.makedirs(chapter_dir)
+        for name, text in [
+            ("001.md", "# Start\n\nFirst line.\n\nSecond **para**.\n"),
+            ("002.md", "Third para.\n\nFourth BROKEN para.\n"),
+        ]:
+            with open(
+                os.path.join(chapter_dir, name), "w", encoding="utf-8"
+            ) as f:
+                f.write(text)
+        self.output_dir = os.path.join(self.temp_dir, "out")
+        self.book = Book(self.temp_dir, output_dir=self.output_dir)
+        self.book.open_outputs = False
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self):
+        source_map = SourceMap(self.temp_dir)
+        doc = self.book._build_document(source_map=source_map)
+        tex_path = os.path.join(self.temp_dir, "book")
+        doc.generate_tex(tex_path)
+        source_map.resolve(f"{tex_path}.tex")
+        with open(f"{tex_path}.tex", "r", encoding="utf-8") as f:
+            lines = f.read().split("\n")
+        return source_map, lines
+
+    def test_block_map_skips_removed_heading(self):
+        """Blocks after the stripped title keep their original lines."""
+        pairs = SourceMap.block_map("\nA.\n\nB.\n", "A.\n\n\nB.\n", 0)
+        self.assertEqual(pairs, [(0, 3), (3, 5)])
+
+    def test_lookup_finds_segment_lines(self):
+        """Lines of the generated .tex resolve to NNN.md file and line."""
+        source_map, lines = self._generate()
+        broken = next(
+            n for n, line in enumerate(lines, 1) if "BROKEN" in line
+        )
+        self.assertEqual(
+            source_map.lookup(broken),
+            (os.path.join("part-1-intro", "chapter-01-start", "002.md"), 3),
+        )
+        second = next(
+            n for n, line in enumerate(lines, 1) if "Second" in line
+        )
+        self.assertEqual(source_map.lookup(second)[1], 5)
+
+    def test_markup_across_segments(self):
+        """Markup running across segments converts as within one file."""
+        chapter_dir = os.path.join(
+            self.temp_dir, "part-1-intro", "chapter-02-across"
+        )
+        os.makedirs(chapter_dir)
+        for name, text in [
+            ("001.md", "# Across\n\nSome **bold\n"),
+            ("002.md", "text** and *it\n\n---\nalic* WORD.\n"),
+        ]:
+            with open(
+                os.path.join(chapter_dir, name), "w", encoding="utf-8"
+            ) as f:
+                f.write(text)
+        self.book = Book(self.temp_dir, output_dir=self.output_dir)
+        source_map, lines = self._generate()
+        chapter = self.book.parts[0].chapters[1]
+        self.assertEqual(
+            "".join(latex for _, _, latex, _ in chapter._latex_segments()),
+            "\nSome \\textbf{bold\ntext} and \\textit{it\n\n"
+            "\\scenebreak\n\nalic} WORD.\n",
+        )
+        segment = os.path.join("part-1-intro", "chapter-02-across", "002.md")
+        for needle, expected in [
+            ("Some", (segment.replace("002", "001"), 3)),
+            ("text}", (segment, 1)),
+            ("WORD", (segment, 4)),
+        ]:
+            number = next(
+                n for n, line in enumerate(lines, 1) if needle in line
+            )
+            self.assertEqual(source_map.lookup(number), expected)
+
+    def test_lookup_outside_segments(self):
+        """Preamble and front matter lines map to nothing."""
+        source_map, lines = self._generate()
+        self.assertIsNone(source_map.lookup(1))
+        end = next(
+            n for n, line in enumerate(lines, 1) if "end{document}" in line
+        )
+        self.assertIsNone(source_map.lookup(end))
+
+    def test_save_and_load_round_trip(self):
+        """A saved map answers lookups the same way after loading."""
+        source_map, lines = self._generate()
+        path = source_map.save(os.path.join(self.temp_dir, "book.json"))
+        loaded = SourceMap.load(path, self.temp_dir)
+        for number in range(1, len(lines) + 1):
+            self.assertEqual(
+                loaded.lookup(number), source_map.lookup(number)
+            )
+
+    def test_build_writes_texmap(self):
+        """build() writes <name>.texmap.json next to the .tex file."""
+        result = self.book.build()
+        texmap = f"{os.path.splitext(result.tex_path)[0]}.texmap.json"
+        with open(texmap, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(data["version"], SourceMap.VERSION)
+        self.assertEqual(len(data["sources"]), 2)
+
+    def test_build_without_source_map(self):
+        """source_map=False leaves the .tex free of markers."""
+        result = self.book.build(source_map=False)
+        with open(result.tex_path, "r", encoding="utf-8") as f:
+            self.assertNotIn(SourceMap.MARKER, f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,285 @@
+"""
+Test cases for the storage backends.
+"""
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+from md_to_latex.core.Book import Book
+from md_to_latex.storage.DirectoryStorage import DirectoryStorage
+from md_to_latex.storage.GitStorage import GitStorage
+from md_to_latex.storage.MemoryStorage import MemoryStorage
+from md_to_latex.storage.TarStorage import TarStorage
+from md_to_latex.storage.ZipStorage import ZipStorage
+
+FILES = {
+    "metadata.json": json.dumps({"title": "Stored", "author": "A. Writer"}),
+    "about-the-book.md": "# About\nA book.\r\n",
+    "part-1-first-steps/chapter-01-begin/001.md": "# One\n\nFirst.\n",
+    "part-1-first-steps/chapter-01-begin/002.md": "Second.^[A note.]\n",
+    "part-1-first-steps/chapter-02-go-on/001.md": "Third.\n",
+    "part-2-later/chapter-03-end/001.md": "Last.\n",
+}
+
+
+def _model(book):
+    """The loaded book as plain data, for comparing backends."""
+    return {
+        "title": book.title,
+        "author": book.author,
+        "about_book": (book.about_book_title, book.about_book),
+        "parts": [
+            (
+                part.title,
+                [(ch.title, ch.content) for ch in part.chapters],
+            )
+            for part in book.parts
+        ],
+    }
+
+
+class TestStorageBackends(unittest.TestCase):
+    """Test that every backend loads the same Book."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.book_dir = os.path.join(self.temp_dir, "my-book")
+        for rel_path, content in FILES.items():
+            path = os.path.join(self.book_dir, *rel_path.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(content)
+        self.expected = _model(Book(self.book_dir))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_directory(self):
+        """A directory path opens a DirectoryStorage."""
+        book = Book(self.book_dir)
+        self.assertIsInstance(book.storage, DirectoryStorage)
+        self.assertEqual(self.expected["title"], "Stored")
+        self.assertEqual(len(self.expected["parts"]), 2)
+        self.assertEqual(self.expected["about_book"], ("About", "A book.\n"))
+
+    def test_zip_archive(self):
+        """A zip archive is read in place, below its top-level folder."""
+        archive_path = os.path.join(self.temp_dir, "upload.zip")
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            for rel_path, content in FILES.items():
+                archive.writestr(f"my-book/{rel_path}", content)
+            archive.writestr("__MACOSX/my-book/._metadata.json", "")
+        with Book(archive_path) as book:
+            self.assertIsInstance(book.storage, ZipStorage)
+            self.assertEqual(book.book_dir, archive_path)
+            self.assertEqual(_model(book), self.expected)
+        self.assertIsNone(book.storage._zip.fp)
+
+    def test_tar_archive(self):
+        """A compressed tar archive is read in place."""
+        archive_path = os.path.join(self.temp_dir, "upload.tar.gz")
+        with tarfile.open(archive_path, "w:gz") as archive:
+            for rel_path in FILES:
+                archive.add(
+                    os.path.join(self.book_dir, *rel_path.split("/")),
+                    arcname=f"./{rel_path}",
+                )
+        book = Book(archive_path)
+        self.assertIsInstance(book.storage, TarStorage)
+        self.assertEqual(book.storage.name, "upload")
+        self.assertEqual(_model(book), self.expected)
+
+        # Every file was read on opening; the archive is not kept open
+        os.remove(archive_path)
+        chapter = book.parts[0].chapters[0]
+        chapter.evict()
+        self.assertEqual(chapter.content, self.expected["parts"][0][1][0][1])
+
+    def test_memory(self):
+        """An in-memory dict of files loads without touching the disk."""
+        book = Book(MemoryStorage(FILES, root="virtual/my-book"))
+        self.assertEqual(book.book_dir, "virtual/my-book")
+        self.assertFalse(os.path.exists("virtual"))
+        self.assertEqual(_model(book), self.expected)
+
+        untitled = Book(MemoryStorage({"chapter-01-x.md": "# X\n\nText.\n"}))
+        self.assertEqual(untitled.title, "book")
+        self.assertEqual(untitled.format, 2)
+        self.assertEqual(untitled.chapters[0].title, "X")
+
+    def test_memory_from_tar_stream(self):
+        """A tar stream is read sequentially into memory."""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w|gz") as archive:
+            archive.add(self.book_dir, arcname="my-book")
+        buffer.seek(0)
+        storage = MemoryStorage.from_tar(buffer)
+        self.assertEqual(storage.name, "my-book")
+        self.assertEqual(_model(Book(storage)), self.expected)
+        metadata_path = os.path.join(self.book_dir, "metadata.json")
+        self.assertAlmostEqual(
+            storage.mtime("book/metadata.json"),
+            os.path.getmtime(metadata_path),
+            delta=1,
+        )
+
+    def test_memory_build_key_follows_content(self):
+        """The build key of an in-memory book changes with its content."""
+        key = Book(MemoryStorage(FILES))._build_key({})
+        self.assertEqual(key, Book(MemoryStorage(FILES))._build_key({}))
+        changed = dict(FILES, **{"part-2-later/chapter-03-end/001.md": "!"})
+        self.assertNotEqual(key, Book(MemoryStorage(changed))._build_key({}))
+
+    def test_storage_operations(self):
+        """Index-backed storage answers like the file system."""
+        storage = MemoryStorage(FILES, root="b")
+        self.assertTrue(storage.isdir("b"))
+        self.assertTrue(storage.isdir("b/part-1-first-steps"))
+        self.assertFalse(storage.isfile("b/part-1-first-steps"))
+        self.assertEqual(
+            storage.listdir("b/part-1-first-steps"),
+            ["chapter-01-begin", "chapter-02-go-on"],
+        )
+        with self.assertRaises(FileNotFoundError):
+            storage.listdir("b/missing")
+        with self.assertRaises(FileNotFoundError):
+            storage.read_text("b/missing.md")
+        self.assertEqual(
+            list(storage.walk())[0], os.path.join("b", "about-the-book.md")
+        )
+        self.assertIsNone(storage.mtime("b/metadata.json"))
+
+
+
+@unittest.skipUnless(shutil.which("git"), "needs git")
+class TestGitStorage(unittest.TestCase):
+    """Test reading books from git revisions."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo = os.path.join(self.temp_dir, "repo")
+        self.book_dir = os.path.join(self.repo, "books", "my-book")
+        self._git("init", "-q", self.repo, cwd=self.temp_dir)
+        self._commit(FILES, "v1", "1700000000")
+        self.chapter_path = "part-2-later/chapter-03-end/001.md"
+        self._commit({self.chapter_path: "Revised.\n"}, "v2", "1700000100")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _git(self, *args, cwd=None, env=None):
+        return subprocess.run(
+            ["git", "-c", "user.name=T", "-c", "user.email=t@example.com"]
+            + list(args),
+            cwd=cwd or self.repo,
+            env=dict(os.environ, **(env or {})),
+            capture_output=True,
+            check=True,
+        ).stdout.decode("utf-8")
+
+    def _commit(self, files, tag, date):
+        for rel_path, content in files.items():
+            path = os.path.join(self.book_dir, *rel_path.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(content)
+        self._git("add", "-A")
+        self._git(
+            "commit", "-q", "-m", tag, env={"GIT_COMMITTER_DATE": date}
+        )
+        self._git("tag", tag)
+
+    def test_reads_revisions(self):
+        """Each revision is read as committed, without a checkout."""
+        with open(
+            os.path.join(self.book_dir, "metadata.json"), "w", encoding="utf-8"
+        ) as f:
+            f.write("{}")  # uncommitted change, ignored
+        old = Book(GitStorage(self.book_dir, "v1"))
+        new = Book(GitStorage(self.book_dir, "v2"))
+        self.assertEqual(old.title, "Stored")
+        self.assertEqual(old.parts[1].chapters[0].content, "Last.\n")
+        self.assertEqual(new.parts[1].chapters[0].content, "Revised.\n")
+        self.assertEqual(old.book_dir, f"{self.book_dir}@v1")
+        self.assertEqual(old.output_dir, f"{self.book_dir}@v1.compiled")
+
+        path = os.path.join(new.book_dir, *self.chapter_path.split("/"))
+        self.assertEqual(
+            new.storage.signature(path),
+            self._git("rev-parse", f"v2:books/my-book/{self.chapter_path}")
+            .strip(),
+        )
+        self.assertEqual(new._resolve_source_date(True), 1700000100)
+
+    def test_revision_names_one_directory(self):
+        """Revisions with path characters map to one sibling directory."""
+        self._git("branch", "topic/x", "v1")
+        for revision, suffix in (("topic/x", "topic-x"), ("HEAD~1", "HEAD-1")):
+            book = Book(GitStorage(self.book_dir, revision))
+            self.assertEqual(book.book_dir, f"{self.book_dir}@{suffix}")
+            self.assertEqual(
+                os.path.dirname(book.output_dir),
+                os.path.dirname(self.book_dir),
+            )
+            self.assertEqual(book.parts[1].chapters[0].content, "Last.\n")
+
+    def test_unknown_revision(self):
+        """A revision that does not exist is reported as a ValueError."""
+        with self.assertRaises(ValueError):
+            GitStorage(self.book_dir, "v9")
+        with self.assertRaises(ValueError):
+            GitStorage(self.temp_dir)
+
+    def test_revisions_share_docx_fragments(self):
+        """Unchanged chapters are rendered once across revisions."""
+        scratch_dir = os.path.join(self.temp_dir, "scratch")
+        cache_names = []
+        for tag in ("v1", "v2"):
+            book = Book(
+                GitStorage(self.book_dir, tag), scratch_dir=scratch_dir
+            )
+            book.open_outputs = False
+            os.makedirs(book.output_dir)
+            book._generate_docx(os.path.join(book.output_dir, "book"))
+            cache_names.append(
+                set(
+                    os.listdir(
+                        book._cache_dir("docx_fragments", shared=True)
+                    )
+                )
+            )
+        self.assertEqual(len(cache_names[0]), 3)
+        self.assertEqual(len(cache_names[1]), 4)
+        self.assertTrue(cache_names[0] < cache_names[1])
+
+    def test_revisions_keep_own_snapshots(self):
+        """Each revision reopens from its own model snapshot."""
+        scratch_dir = os.path.join(self.temp_dir, "scratch")
+        for tag in ("v1", "v2"):
+            Book(GitStorage(self.book_dir, tag), scratch_dir=scratch_dir)
+        books = [
+            Book(GitStorage(self.book_dir, tag), scratch_dir=scratch_dir)
+            for tag in ("v1", "v2")
+        ]
+        self.assertTrue(all(book.from_snapshot for book in books))
+        self.assertNotEqual(
+            books[0]._snapshot_path(), books[1]._snapshot_path()
+        )
+        self.assertEqual(
+            books[1].parts[1].chapters[0].content, "Revised.\n"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
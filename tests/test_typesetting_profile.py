@@ -0,0 +1,79 @@
+"""
+Test cases for typesetting profiles.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from md_to_latex.core.TypesettingProfile import (PROFILES,
+                                                 TypesettingProfile)
+from tests.helpers import open_book, write_book
+
+
+class TestTypesettingProfile(unittest.TestCase):
+    """Test TypesettingProfile and its use by Book."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = write_book(
+            tempfile.mkdtemp(),
+            {
+                "part-1-intro/chapter-01-start/001.md": (
+                    "# Start\n\nSome **text**.\n"
+                )
+            },
+        )
+        self.output_dir = os.path.join(self.temp_dir, "out")
+        self.book = open_book(self.temp_dir, output_dir=self.output_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_get(self):
+        """Profiles are looked up by name or passed through."""
+        draft = TypesettingProfile.get("draft")
+        self.assertIs(draft, PROFILES["draft"])
+        self.assertIs(TypesettingProfile.get(draft), draft)
+        with self.assertRaises(ValueError):
+            TypesettingProfile.get("glossy")
+
+    def test_production_preamble(self):
+        """The production profile keeps the full package stack."""
+        latex = self.book._new_document().dumps()
+        for package in ("microtype", "hyperref", "ebgaramond"):
+            self.assertIn(package, latex)
+
+    def test_draft_preamble(self):
+        """The draft profile drops expensive packages, not the layout."""
+        self.book.profile = TypesettingProfile.get("draft")
+        latex = self.book._new_document().dumps()
+        for package in ("microtype", "hyperref", "ebgaramond"):
+            self.assertNotIn(package, latex)
+        self.assertIn("mathptmx", latex)
+        self.assertIn(r"\doublespacing", latex)
+        self.assertIn("margin=1in", latex)
+
+    def test_passes_and_draftmode(self):
+        """Only passes before the last run in draftmode."""
+        runs = self.book._run_pdflatex.runs
+        self.book._compile_pdf(self.temp_dir, "book.tex")
+        self.assertEqual([draftmode for *_, draftmode in runs], [True, False])
+
+        runs.clear()
+        self.book.profile = TypesettingProfile.get("draft")
+        self.book._compile_pdf(self.temp_dir, "book.tex")
+        self.assertEqual([draftmode for *_, draftmode in runs], [False])
+
+    def test_draft_build_output(self):
+        """Draft builds write <name>-draft.tex and no DOCX."""
+        result = self.book.build(profile="draft")
+        self.assertTrue(result.tex_path.endswith("-draft.tex"))
+        self.assertTrue(os.path.isfile(result.tex_path))
+        self.assertIsNone(result.docx_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Test cases for splitting a book into volumes.
+"""
+
+import shutil
+import tempfile
+import unittest
+
+from md_to_latex.bench import SyntheticBook
+from md_to_latex.core.Book import Book
+from md_to_latex.core.BookVolumeMixin import WORDS_PER_PAGE
+
+
+class TestBookVolumeMixin(unittest.TestCase):
+    """Test BookVolumeMixin."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.book = Book(SyntheticBook("medium").write(self.temp_dir))
+        self.book.open_outputs = False
+        self.part_words = [
+            sum(len(c.content.split()) for c in part.chapters)
+            for part in self.book.parts
+        ]
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_plan_splits_at_parts(self):
+        """Volumes hold whole parts and stay under the word budget."""
+        budget = self.part_words[0] + self.part_words[1]
+        volumes = self.book._plan_volumes(max_words=budget)
+        self.assertEqual(
+            [[p.title for p in v["parts"]] for v in volumes],
+            [["Part 1", "Part 2"], ["Part 3"]],
+        )
+        self.assertEqual(volumes[1]["first_chapter"], 12)
+        self.assertEqual(volumes[1]["first_part"], 2)
+        self.assertEqual(volumes[1]["words"], self.part_words[2])
+
+    def test_oversized_part_gets_own_volume(self):
+        """A part larger than the budget is not split."""
+        volumes = self.book._plan_volumes(max_words=10)
+        self.assertEqual(len(volumes), 3)
+
+    def test_page_budget(self):
+        """Page budgets are converted at WORDS_PER_PAGE."""
+        pages = (self.part_words[0] + self.part_words[1]) // WORDS_PER_PAGE
+        by_pages = self.book._plan_volumes(max_pages=pages + 1)
+        self.assertEqual(len(by_pages), 2)
+
+    def test_invalid_budget(self):
+        """A budget is required and must be positive."""
+        for kwargs in ({}, {"max_words": -5}):
+            with self.assertRaises(ValueError):
+                self.book._plan_volumes(**kwargs)
+
+    def test_volume_document(self):
+        """Each volume has a title page, contents and continued numbers."""
+        volumes = self.book._plan_volumes(max_words=1)
+        self.book.word_count = self.book._count_words()
+        latex = self.book._volume_document(volumes[1]).dumps()
+        self.assertIn("Volume 2", latex)
+        self.assertIn(r"\tableofcontents", latex)
+        self.assertIn(r"\setcounter{chapter}{6}", latex)
+        self.assertIn(r"\part{Part 2}", latex)
+        self.assertNotIn(r"\part{Part 1}", latex)
+        self.assertIn(f"{volumes[1]['words']:,} words", latex)
+
+    def test_build_reports_volumes(self):
+        """build() writes one .tex per volume and lists them together."""
+        result = self.book.build(volume_words=1, profile="draft")
+        self.assertEqual(len(result.volumes), 3)
+        summary = result.to_dict()["volumes"]
+        self.assertEqual([v["parts"] for v in summary][2], ["Part 3"])
+        self.assertTrue(summary[0]["tex_path"].endswith("-draft-vol-1.tex"))
+        self.assertEqual(result.tex_path, summary[0]["tex_path"])
+
+    def test_volumes_and_shards_exclusive(self):
+        """Volumes cannot be combined with sharding or layouts."""
+        with self.assertRaises(ValueError):
+            self.book.build(volume_words=1, shards=2)
+        with self.assertRaises(ValueError):
+            self.book.build(volume_pages=1, layouts=["trade-6x9"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Run the benchmark scenarios and compare results against history.
+
+Usage:
+    python workflows/bench.py run [--sizes small,medium] [--repeat 5]
+    python workflows/bench.py run --compare <base>
+    python workflows/bench.py compare <base> <new> [--budget 0.1]
+
+<base> and <new> are results files or commit ids recorded on this
+machine. The compare step exits with status 1 when a metric regresses
+beyond its budget.
+"""
+
+import argparse
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+from md_to_latex.bench import (BenchmarkComparison, BenchmarkHistory,
+                               BenchmarkRunner)
+
+console = Console()
+
+DEFAULT_HISTORY_DIR = "benchmarks/results"
+
+
+def _parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Run md_to_latex benchmarks and detect regressions."
+    )
+    parser.add_argument(
+        "--history-dir",
+        default=DEFAULT_HISTORY_DIR,
+        help=f"Results directory (default: {DEFAULT_HISTORY_DIR})",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument(
+        "--sizes", help="Comma-separated synthetic book sizes"
+    )
+    run_parser.add_argument(
+        "--scenarios",
+        help="Comma-separated scenarios "
+        f"({', '.join(BenchmarkRunner.SCENARIOS)})",
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=5, help="Samples per metric"
+    )
+    run_parser.add_argument(
+        "--compare", metavar="BASE", help="Compare against BASE after run"
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare two result sets"
+    )
+    compare_parser.add_argument("base", help="Baseline results or commit")
+    compare_parser.add_argument("new", help="New results or commit")
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument(
+            "--budget",
+            type=float,
+            default=0.10,
+            help="Allowed relative slowdown per metric (default: 0.10)",
+        )
+        sub.add_argument(
+            "--budget-file",
+            help="JSON file of {metric glob: budget} overrides",
+        )
+        sub.add_argument(
+            "--noise",
+            type=float,
+            default=3.0,
+            help="Noise threshold in median absolute deviations",
+        )
+    return parser.parse_args()
+
+
+def _split(value):
+    """Split a comma-separated option into a list (None stays None)."""
+    return [v.strip() for v in value.split(",") if v.strip()] if value else None
+
+
+def _format_value(value, unit):
+    """Format a metric value for display."""
+    if unit == "bytes":
+        return f"{value:,.0f} B"
+    return f"{value * 1000:.1f} ms"
+
+
+def _display_comparison(comparison):
+    """Display a comparison table and return the exit status."""
+    styles = {"regression": "red", "improvement": "green", "ok": "dim"}
+    table = Table(title="Benchmark comparison", title_justify="left")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Base", justify="right")
+    table.add_column("New", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Status")
+    for row in comparison.rows:
+        table.add_row(
+            row["metric"],
+            _format_value(row["base"], row["unit"]),
+            _format_value(row["new"], row["unit"]),
+            f"{row['change']:+.1%}",
+            f"[{styles[row['status']]}]{row['status']}[/]",
+        )
+    console.print(table)
+    if comparison.passed:
+        console.print("[bold green]✓ No regressions[/bold green]")
+        return 0
+    console.print(
+        f"[bold red]✗ {len(comparison.regressions)} metric(s) regressed "
+        f"beyond budget[/bold red]"
+    )
+    return 1
+
+
+def _compare(history, args, base_ref, new_results):
+    """Compare *new_results* to *base_ref* and return the exit status."""
+    budgets = (
+        BenchmarkComparison.load_budgets(args.budget_file)
+        if args.budget_file
+        else None
+    )
+    comparison = BenchmarkComparison(
+        history.load(base_ref),
+        new_results,
+        budget=args.budget,
+        budgets=budgets,
+        noise=args.noise,
+    )
+    return _display_comparison(comparison)
+
+
+def main():
+    """Main benchmark execution."""
+    args = _parse_arguments()
+    history = BenchmarkHistory(args.history_dir)
+
+    if args.command == "run":
+        runner = BenchmarkRunner(
+            sizes=_split(args.sizes),
+            scenarios=_split(args.scenarios),
+            repeat=args.repeat,
+        )
+        console.print("[bold green]⚙ Running benchmarks...[/bold green]")
+        path = history.save(runner.run())
+        console.print(f"[cyan]Results saved:[/cyan] [bold]{path}[/bold]")
+        if args.compare:
+            sys.exit(_compare(history, args, args.compare, history.load(path)))
+        return
+
+    sys.exit(_compare(history, args, args.base, history.load(args.new)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Compile standalone preview PDFs of individual chapters.
+
+Usage:
+    python workflows/preview.py <book_directory_path> [chapter ...]
+
+Chapters are 1-based numbers or titles; without any, every chapter is
+previewed. Unchanged chapters are served from the preview cache.
+
+Example:
+    python workflows/preview.py /path/to/my-book 3 "The Harbour"
+"""
+
+import argparse
+import os
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+from md_to_latex import Book
+
+console = Console()
+
+
+def _parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compile standalone chapter preview PDFs.",
+        epilog="Example: python workflows/preview.py /path/to/my-book 3",
+    )
+    parser.add_argument(
+        "book_dir",
+        help="Path to the book directory, or to a zip or tar archive of it",
+    )
+    parser.add_argument(
+        "chapters",
+        nargs="*",
+        help="Chapter numbers or titles (default: every chapter)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Maximum concurrent pdflatex processes (default: CPU count)",
+    )
+    return parser.parse_args()
+
+
+def _display_previews(previews):
+    """Display one row per preview, with errors below failed ones."""
+    table = Table(title="Previews", title_justify="left")
+    table.add_column("#", justify="right")
+    table.add_column("Chapter", style="cyan")
+    table.add_column("Status")
+    table.add_column("PDF")
+    for preview in previews:
+        if preview["errors"]:
+            status = "[red]failed[/red]"
+        elif preview["cached"]:
+            status = "[dim]cached[/dim]"
+        else:
+            status = "[green]compiled[/green]"
+        table.add_row(
+            str(preview["chapter_index"]),
+            preview["chapter"],
+            status,
+            preview["pdf_path"] or "-",
+        )
+    console.print(table)
+    for preview in previews:
+        for error in preview["errors"][:3]:
+            console.print(
+                f"[red]✗ Chapter {preview['chapter_index']}:[/red] {error}"
+            )
+
+
+def main():
+    """Main pipeline execution."""
+    args = _parse_arguments()
+    if not os.path.exists(args.book_dir):
+        console.print(
+            "[red]✗ Error:[/red] Directory or archive not found: "
+            f"{args.book_dir}"
+        )
+        sys.exit(1)
+
+    with Book(args.book_dir) as book:
+        try:
+            previews = book.preview(
+                args.chapters or None, max_workers=args.jobs
+            )
+        except ValueError as e:
+            console.print(f"[red]✗ Error:[/red] {e}")
+            sys.exit(1)
+    _display_previews(previews)
+    if any(preview["errors"] for preview in previews):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
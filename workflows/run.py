@@ -3,40 +3,177 @@
 Pipeline for converting Markdown book directory to LaTeX/PDF.
 
 Usage:
-    python workflows/md_to_latex.py <book_directory_path>
+    python workflows/md_to_latex.py <book_directory_path> [options]
 
 Example:
     python workflows/md_to_latex.py /path/to/my-book
+    python workflows/md_to_latex.py /path/to/my-book --trace build.json
+    tar c my-book | python workflows/md_to_latex.py --stdin > my-book.pdf
 """
 
+import argparse
+import contextlib
 import os
+import shutil
 import sys
+import tarfile
+import tempfile
 
 from rich.console import Console
+from rich.table import Table
 
-from md_to_latex import Book
+from md_to_latex import Book, GitStorage, MemoryStorage
+from md_to_latex.core.LayoutProfile import LAYOUTS
+from md_to_latex.core.TypesettingProfile import PROFILES
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 console = Console()
 
+TARGETS = ("pdf", "docx", "tex", "tar")
 
-def _validate_arguments():
+
+def _parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Convert a markdown book directory to LaTeX/PDF.",
+        epilog="Example: python workflows/md_to_latex.py /path/to/my-book",
+    )
+    parser.add_argument(
+        "book_dir",
+        nargs="?",
+        help="Path to the book directory, or to a zip or tar archive of it",
+    )
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Read the book as a tar stream from standard input",
+    )
+    parser.add_argument(
+        "--revision",
+        metavar="REV",
+        help="Build the book as committed at this git commit, tag or "
+        "branch, without checking it out",
+    )
+    parser.add_argument(
+        "--target",
+        choices=TARGETS,
+        help="Write this output to standard output; 'tar' writes a tar "
+        "of every published file (default with --stdin: pdf)",
+    )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="Print time spent in each build stage",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Write a Chrome trace-event JSON timeline (implies --timing)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Print peak heap and RSS for each build stage",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Abort pdflatex on the first LaTeX error",
+    )
+    parser.add_argument(
+        "--diagnose",
+        nargs="?",
+        const="standalone",
+        choices=["standalone", "bisect"],
+        help="When the PDF fails, compile chapters standalone in parallel "
+        "to find the broken chapter and NNN.md segment",
+    )
+    parser.add_argument(
+        "--shards",
+        metavar="parts|N",
+        help="Compile the PDF in parallel shards, one per part or N "
+        "chapter groups, and stitch them (needs pypdf)",
+    )
+    parser.add_argument(
+        "--profile",
+        default="production",
+        choices=list(PROFILES),
+        help="Typesetting profile; 'draft' is a fast proof that skips "
+        "microtype, hyperref and the DOCX (default: production)",
+    )
+    parser.add_argument(
+        "--volume-words",
+        type=int,
+        metavar="N",
+        help="Split the PDF at part boundaries into volumes of at most "
+        "N words, compiled in parallel",
+    )
+    parser.add_argument(
+        "--volume-pages",
+        type=int,
+        metavar="N",
+        help="Split into volumes of at most about N pages",
+    )
+    parser.add_argument(
+        "--layout",
+        dest="layouts",
+        action="append",
+        choices=list(LAYOUTS),
+        help="Page layout variant; repeat to compile several variants "
+        "concurrently from one conversion (default: a4-manuscript)",
+    )
+    parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        default=None,
+        help="Write byte-identical PDF and DOCX files for identical "
+        "inputs (implied when SOURCE_DATE_EPOCH is set)",
+    )
+    parser.add_argument(
+        "--docx-compression",
+        type=int,
+        choices=range(10),
+        metavar="0-9",
+        help="zlib compression level of the DOCX (default: 6)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        metavar="PATH",
+        help="Directory the finished files are published to "
+        "(default: <book_dir>.compiled; a temporary directory with "
+        "--stdin)",
+    )
+    parser.add_argument(
+        "--scratch-dir",
+        metavar="PATH",
+        help="Local directory pdflatex works in, e.g. /dev/shm "
+        "(default: the system temporary directory)",
+    )
+    return parser.parse_args()
+
+
+def _validate_arguments(args):
     """Validate command-line arguments and return book directory."""
-    if len(sys.argv) < 2:
+    book_dir = args.book_dir
+
+    if args.stdin:
+        if book_dir:
+            console.print(
+                "[red]✗ Error:[/red] Give a book directory or --stdin, "
+                "not both"
+            )
+            sys.exit(1)
+        args.target = args.target or "pdf"
+        return None
+    if not book_dir:
+        console.print("[red]✗ Error:[/red] No book directory given")
+        sys.exit(1)
+    if not os.path.exists(book_dir):
         console.print(
-            "[yellow]Usage:[/yellow] python workflows/md_to_latex.py "
-            "<book_directory_path>"
+            f"[red]✗ Error:[/red] Directory or archive not found: {book_dir}"
         )
-        console.print("\n[cyan]Example:[/cyan]")
-        console.print("  python workflows/md_to_latex.py /path/to/my-book")
-        sys.exit(1)
-
-    book_dir = sys.argv[1]
-
-    if not os.path.isdir(book_dir):
-        console.print(f"[red]✗ Error:[/red] Directory not found: {book_dir}")
         sys.exit(1)
 
     return book_dir
@@ -60,6 +197,83 @@ def _display_book_info(book):
         )
 
 
+def _display_timing(result):
+    """Display time spent in each build stage."""
+    table = Table(title="Build stages", title_justify="left")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Seconds", justify="right")
+    for stage, seconds in result.stage_durations().items():
+        table.add_row(stage, f"{seconds:.3f}")
+    console.print(table)
+    if result.trace_path:
+        console.print(
+            f"[cyan]Trace written:[/cyan] [bold]{result.trace_path}[/bold]"
+        )
+
+
+def _display_volumes(result):
+    """Display the volumes the book was split into."""
+    table = Table(title="Volumes", title_justify="left")
+    table.add_column("Volume", justify="right")
+    table.add_column("Parts", style="cyan")
+    table.add_column("Words", justify="right")
+    table.add_column("Output")
+    for volume in result.to_dict()["volumes"]:
+        output = volume["pdf_path"] or (
+            f"[red]{len(volume['errors'])} error(s)[/red] "
+            f"{volume['tex_path']}"
+        )
+        table.add_row(
+            str(volume["volume"]),
+            ", ".join(volume["parts"]) or f"{volume['chapters']} chapters",
+            f"{volume['words']:,}",
+            output,
+        )
+    console.print(table)
+
+
+def _display_variants(result):
+    """Display the layout variants that were compiled."""
+    table = Table(title="Layouts", title_justify="left")
+    table.add_column("Layout", style="cyan")
+    table.add_column("Output")
+    for variant in result.variants:
+        output = variant["pdf_path"] or (
+            f"[red]{len(variant['errors'])} error(s)[/red] "
+            f"{variant['tex_path']}"
+        )
+        table.add_row(variant["layout"], output)
+    console.print(table)
+
+
+def _format_mb(num_bytes):
+    """Format a byte count in megabytes, or '-' when unavailable."""
+    if num_bytes is None:
+        return "-"
+    return f"{num_bytes / (1024 * 1024):.1f}"
+
+
+def _display_memory(result):
+    """Display peak heap and RSS for each build stage."""
+    table = Table(title="Memory (MB)", title_justify="left")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Heap peak", justify="right")
+    table.add_column("Heap delta", justify="right")
+    table.add_column("RSS", justify="right")
+    table.add_column("RSS peak", justify="right")
+    table.add_column("pdflatex RSS peak", justify="right")
+    for record in result.memory:
+        table.add_row(
+            record["stage"],
+            _format_mb(record["heap_peak"]),
+            _format_mb(record["heap_delta"]),
+            _format_mb(record["rss"]),
+            _format_mb(record["rss_peak"]),
+            _format_mb(record.get("child_rss_peak")),
+        )
+    console.print(table)
+
+
 def _display_output_info(book, output_file):
     """Display output information after generation."""
     console.rule(style="dim")
@@ -70,12 +284,58 @@ def _display_output_info(book, output_file):
     console.print("\n[bold green]✓ Done![/bold green]")
 
 
-def main():
-    """Main pipeline execution."""
-    book_dir = _validate_arguments()
+def _write_tar(book, result, stream):
+    """Write every published file and the manifest as a tar stream."""
+    names = sorted(result.artifacts)
+    if result.manifest_path:
+        names.append(os.path.basename(result.manifest_path))
+    with tarfile.open(fileobj=stream, mode="w|") as archive:
+        for name in names:
+            path = os.path.join(book.output_dir, name)
+            info = archive.gettarinfo(path, arcname=name)
+            info.mode = 0o644
+            info.uid = info.gid = 0
+            info.uname = info.gname = ""
+            if book.source_date_epoch is not None:
+                info.mtime = book.source_date_epoch
+            with open(path, "rb") as f:
+                archive.addfile(info, f)
+
+
+def _write_target(book, result, target, stream):
+    """Write the *target* output of the build to *stream*."""
+    if target == "tar":
+        _write_tar(book, result, stream)
+    else:
+        path = getattr(result, f"{target}_path")
+        if not path:
+            console.print(f"[red]✗ Error:[/red] No {target} was built")
+            sys.exit(1)
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, stream)
+    stream.flush()
+
+
+def _build(args, book_dir, output_dir):
+    """Load and build the book, printing progress; return both."""
+    if args.stdin:
+        book_dir = MemoryStorage.from_tar(sys.stdin.buffer)
+    elif args.revision:
+        try:
+            book_dir = GitStorage(book_dir, args.revision)
+        except ValueError as e:
+            console.print(f"[red]✗ Error:[/red] {e}")
+            sys.exit(1)
 
     # Create book object
-    book = Book(book_dir)
+    book = Book(
+        book_dir,
+        profile_memory=args.memory,
+        output_dir=output_dir,
+        scratch_dir=args.scratch_dir,
+    )
+    if args.target:
+        book.open_outputs = False
 
     _display_book_info(book)
 
@@ -83,9 +343,58 @@ def main():
     console.rule(style="dim")
 
     # Generate LaTeX and PDF
-    output_file = book.toLatex()
+    result = book.build(
+        timing=args.timing,
+        trace_path=args.trace,
+        fail_fast=args.fail_fast,
+        diagnose=args.diagnose,
+        shards=args.shards,
+        profile=args.profile,
+        volume_words=args.volume_words,
+        volume_pages=args.volume_pages,
+        layouts=args.layouts,
+        reproducible=args.reproducible,
+        docx_compression=args.docx_compression,
+    )
 
-    _display_output_info(book, output_file)
+    if result.volumes:
+        _display_volumes(result)
+    if result.variants:
+        _display_variants(result)
+    if args.timing or args.trace:
+        _display_timing(result)
+    if args.memory:
+        _display_memory(result)
+
+    _display_output_info(book, result.output_path)
+    return book, result
+
+
+def main():
+    """Main pipeline execution."""
+    args = _parse_arguments()
+    book_dir = _validate_arguments(args)
+    if not args.target:
+        _build(args, book_dir, args.output_dir)
+        return
+
+    # Standard output carries the target; progress goes to stderr, and
+    # a book read from stdin is built in a temporary output directory
+    stdout = sys.stdout.buffer
+    output_dir = args.output_dir
+    if args.stdin and not output_dir:
+        if args.scratch_dir:
+            os.makedirs(args.scratch_dir, exist_ok=True)
+        output_dir = tempfile.mkdtemp(
+            prefix="md_to_latex_out_", dir=args.scratch_dir
+        )
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            book, result = _build(args, book_dir, output_dir)
+            _write_target(book, result, args.target, stdout)
+    finally:
+        if output_dir != args.output_dir:
+            shutil.rmtree(output_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":